@@ -5,84 +5,116 @@ Self-Evolving Autonomous Intelligence for Arduino DevOps
 """
 
 import asyncio
+import importlib
 import numpy as np
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Callable, AsyncIterator
+from dataclasses import dataclass, field, asdict
 import json
 import hashlib
-import pickle
+import msgpack
+import orjson
 import os
 import random
 import math
+import time
+from collections import OrderedDict, defaultdict, deque
 from pathlib import Path
 import torch
 import torch.nn as nn
 import torch.optim as optim
 import torch.nn.functional as F
 from torch.utils.data import DataLoader, Dataset
-import gymnasium as gym
-from gymnasium import spaces
-import stable_baselines3 as sb3
-from stable_baselines3 import PPO, SAC, TD3
-from stable_baselines3.common.env_util import make_vec_env
-from stable_baselines3.common.callbacks import BaseCallback
-import optuna
-from optuna.pruners import MedianPruner
-from optuna.samplers import TPESampler
-import mlflow
-import wandb
-from transformers import AutoTokenizer, AutoModelForCausalLM, Trainer, TrainingArguments
-from transformers import GPT2LMHeadModel, GPT2Tokenizer
-import openai
-from langchain.llms import OpenAI
-from langchain.chains import ConversationChain
-from langchain.memory import ConversationBufferMemory
-from langchain.agents import initialize_agent, Tool
-from langchain.agents.agent_types import AgentType
+from torch.func import functional_call, grad, vmap
 import networkx as nx
-from sklearn.cluster import DBSCAN
-from sklearn.ensemble import IsolationForest
-from sklearn.metrics import silhouette_score
-import plotly.graph_objects as go
-import plotly.express as px
-from bokeh.plotting import figure, show
-from bokeh.models import HoverTool
-import streamlit as st
-import gradio as gr
-import docker
-import kubernetes
-from kubernetes import client, config
 import ray
-from ray import tune, serve
-from ray.rllib.algorithms.ppo import PPOConfig
-from ray.tune.schedulers import ASHAScheduler
-import apache_beam as beam
-from apache_beam.options.pipeline_options import PipelineOptions
-import prefect
-from prefect import flow, task
-from prefect.deployments import Deployment
-import dask
-from dask.distributed import Client
-import celery
-from celery import Celery
-import redis
+from ray.util import collective
 import prometheus_client
 from prometheus_client import Counter, Histogram, Gauge
-import grafana_api
-from grafana_api.grafana_face import GrafanaFace
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 무거운 선택 의존성은 처음 접근할 때 로드 (PEP 562 모듈 __getattr__)
+_LAZY_IMPORTS = {
+    'gym': ('gymnasium', None),
+    'spaces': ('gymnasium.spaces', None),
+    'sb3': ('stable_baselines3', None),
+    'PPO': ('stable_baselines3', 'PPO'),
+    'SAC': ('stable_baselines3', 'SAC'),
+    'TD3': ('stable_baselines3', 'TD3'),
+    'make_vec_env': ('stable_baselines3.common.env_util', 'make_vec_env'),
+    'BaseCallback': ('stable_baselines3.common.callbacks', 'BaseCallback'),
+    'optuna': ('optuna', None),
+    'MedianPruner': ('optuna.pruners', 'MedianPruner'),
+    'TPESampler': ('optuna.samplers', 'TPESampler'),
+    'mlflow': ('mlflow', None),
+    'wandb': ('wandb', None),
+    'AutoTokenizer': ('transformers', 'AutoTokenizer'),
+    'AutoModelForCausalLM': ('transformers', 'AutoModelForCausalLM'),
+    'Trainer': ('transformers', 'Trainer'),
+    'TrainingArguments': ('transformers', 'TrainingArguments'),
+    'GPT2LMHeadModel': ('transformers', 'GPT2LMHeadModel'),
+    'GPT2Tokenizer': ('transformers', 'GPT2Tokenizer'),
+    'openai': ('openai', None),
+    'OpenAI': ('langchain.llms', 'OpenAI'),
+    'ConversationChain': ('langchain.chains', 'ConversationChain'),
+    'ConversationBufferMemory': ('langchain.memory', 'ConversationBufferMemory'),
+    'initialize_agent': ('langchain.agents', 'initialize_agent'),
+    'Tool': ('langchain.agents', 'Tool'),
+    'AgentType': ('langchain.agents.agent_types', 'AgentType'),
+    'DBSCAN': ('sklearn.cluster', 'DBSCAN'),
+    'IsolationForest': ('sklearn.ensemble', 'IsolationForest'),
+    'silhouette_score': ('sklearn.metrics', 'silhouette_score'),
+    'go': ('plotly.graph_objects', None),
+    'px': ('plotly.express', None),
+    'figure': ('bokeh.plotting', 'figure'),
+    'show': ('bokeh.plotting', 'show'),
+    'HoverTool': ('bokeh.models', 'HoverTool'),
+    'st': ('streamlit', None),
+    'gr': ('gradio', None),
+    'docker': ('docker', None),
+    'kubernetes': ('kubernetes', None),
+    'client': ('kubernetes.client', None),
+    'config': ('kubernetes.config', None),
+    'tune': ('ray.tune', None),
+    'serve': ('ray.serve', None),
+    'PPOConfig': ('ray.rllib.algorithms.ppo', 'PPOConfig'),
+    'ASHAScheduler': ('ray.tune.schedulers', 'ASHAScheduler'),
+    'beam': ('apache_beam', None),
+    'PipelineOptions': ('apache_beam.options.pipeline_options', 'PipelineOptions'),
+    'prefect': ('prefect', None),
+    'flow': ('prefect', 'flow'),
+    'task': ('prefect', 'task'),
+    'Deployment': ('prefect.deployments', 'Deployment'),
+    'dask': ('dask', None),
+    'Client': ('dask.distributed', 'Client'),
+    'celery': ('celery', None),
+    'Celery': ('celery', 'Celery'),
+    'redis': ('redis', None),
+    'grafana_api': ('grafana_api', None),
+    'GrafanaFace': ('grafana_api.grafana_face', 'GrafanaFace'),
+}
+
+def __getattr__(name: str) -> Any:
+    """지연 로드 대상 모듈/심볼을 첫 접근 시 임포트"""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module_name, attr = _LAZY_IMPORTS[name]
+    module = importlib.import_module(module_name)
+    value = getattr(module, attr) if attr else module
+    globals()[name] = value
+    return value
+
 @dataclass
 class EvolutionGeneration:
     """진화 세대 정보"""
     generation_id: str
     generation_number: int
     population_size: int
-    fitness_scores: List[float]
+    fitness_scores: np.ndarray  # float32
     best_individual: Dict[str, Any]
     mutation_rate: float
     crossover_rate: float
@@ -90,21 +122,87 @@ class EvolutionGeneration:
     diversity_index: float
     performance_metrics: Dict[str, float]
     timestamp: datetime
+    
+    def to_json(self) -> bytes:
+        """orjson 직렬화 (NumPy 배열은 버퍼에서 바로 인코딩)"""
+        return orjson.dumps(self, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+
+class AgentColumns:
+    """에이전트 스칼라 속성 컬럼 (Structure-of-Arrays, 행 = 에이전트 등록 순서)
+    
+    AIAgent의 learning_rate/exploration_rate/collaboration_score는 이 컬럼의 행을
+    직접 읽고 쓰므로 값의 저장소는 여기 하나뿐이다.
+    """
+    
+    def __init__(self, capacity: int = 0):
+        self.rows: Dict[str, int] = {}
+        self._learning_rates = np.zeros(capacity, dtype=np.float32)
+        self._exploration_rates = np.zeros(capacity, dtype=np.float32)
+        self._collaboration_scores = np.zeros(capacity, dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def reserve(self, capacity: int):
+        """최소 capacity 행을 확보 (기존 값 유지)"""
+        if capacity <= len(self._learning_rates):
+            return
+        for name in ('_learning_rates', '_exploration_rates', '_collaboration_scores'):
+            grown = np.zeros(capacity, dtype=np.float32)
+            grown[:len(self)] = getattr(self, name)[:len(self)]
+            setattr(self, name, grown)
+    
+    def add(self, agent_id: str, learning_rate: float, exploration_rate: float,
+            collaboration_score: float) -> int:
+        """에이전트 행 추가 (용량이 부족하면 두 배로 확장) 후 행 번호 반환"""
+        row = len(self)
+        if row == len(self._learning_rates):
+            self.reserve(max(1, 2 * row))
+        self.rows[agent_id] = row
+        self._learning_rates[row] = learning_rate
+        self._exploration_rates[row] = exploration_rate
+        self._collaboration_scores[row] = collaboration_score
+        return row
+    
+    @property
+    def learning_rates(self) -> np.ndarray:
+        return self._learning_rates[:len(self)]
+    
+    @property
+    def exploration_rates(self) -> np.ndarray:
+        return self._exploration_rates[:len(self)]
+    
+    @property
+    def collaboration_scores(self) -> np.ndarray:
+        return self._collaboration_scores[:len(self)]
+
+def _agent_column_property(column: str) -> property:
+    """AgentColumns 컬럼에서 에이전트 행을 읽고 쓰는 프로퍼티 (확장 후에도 최신 배열 참조)"""
+    def getter(agent: 'AIAgent') -> float:
+        return float(getattr(agent.columns, column)[agent.row])
+    
+    def setter(agent: 'AIAgent', value: float):
+        getattr(agent.columns, column)[agent.row] = value
+    
+    return property(getter, setter)
 
 @dataclass
 class AIAgent:
-    """자율 AI 에이전트"""
+    """자율 AI 에이전트 (스칼라 속성은 AgentColumns의 한 행)"""
     agent_id: str
     agent_type: str  # "optimizer", "learner", "creator", "monitor", "healer"
     capabilities: List[str]
     current_task: Optional[str]
     performance_history: List[float]
-    learning_rate: float
-    exploration_rate: float
     memory_size: int
     model_architecture: Dict[str, Any]
     last_update: datetime
-    collaboration_score: float
+    columns: AgentColumns = field(repr=False, compare=False)
+    row: int
+    
+    learning_rate = _agent_column_property('learning_rates')
+    exploration_rate = _agent_column_property('exploration_rates')
+    collaboration_score = _agent_column_property('collaboration_scores')
 
 @dataclass
 class SystemDNA:
@@ -118,6 +216,41 @@ class SystemDNA:
     fitness_score: float
     generation: int
     mutations: List[str]
+    
+    def to_bytes(self) -> bytes:
+        """msgpack 직렬화 (NumPy 배열은 확장 타입으로 저장)"""
+        return msgpack.packb(asdict(self), default=_encode_ndarray, use_bin_type=True)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SystemDNA':
+        """msgpack 역직렬화"""
+        return cls(**msgpack.unpackb(data, ext_hook=_decode_ndarray, raw=False, strict_map_key=False))
+
+_NDARRAY_EXT_TYPE = 1
+
+def _encode_ndarray(obj: Any) -> msgpack.ExtType:
+    """NumPy 배열을 (dtype, shape, raw bytes) 확장 타입으로 인코딩"""
+    if isinstance(obj, np.ndarray):
+        payload = msgpack.packb((obj.dtype.str, obj.shape, np.ascontiguousarray(obj).tobytes()))
+        return msgpack.ExtType(_NDARRAY_EXT_TYPE, payload)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"직렬화할 수 없는 타입: {type(obj)!r}")
+
+def _decode_ndarray(code: int, data: bytes) -> Any:
+    """확장 타입을 NumPy 배열로 복원"""
+    if code == _NDARRAY_EXT_TYPE:
+        dtype, shape, buffer = msgpack.unpackb(data)
+        return np.frombuffer(buffer, dtype=np.dtype(dtype)).reshape(shape)
+    return msgpack.ExtType(code, data)
+
+# 지식 그래프 캐시 형식 버전 (그래프 스키마/직렬화 방식 변경 시 증가)
+_KNOWLEDGE_GRAPH_CACHE_VERSION = 1
+
+def _default_cache_dir() -> Path:
+    """사용자 전용 캐시 디렉터리 (XDG_CACHE_HOME, 없으면 ~/.cache)"""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'autonomous-ai-system'
 
 class AutonomousEvolutionEngine:
     """자율 진화 엔진"""
@@ -125,25 +258,40 @@ class AutonomousEvolutionEngine:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.current_generation = 0
+        self._rng = np.random.default_rng(config.get('seed'))
+        # 진화 주기당 한 번 갱신되는 기준 시각
+        self.cycle_timestamp = datetime.now()
         self.population = []
-        self.evolution_history = []
+        self.evolution_history = deque(maxlen=config.get('evolution_history_size', 1000))
+        # 메모리 이력은 최근 세대만 유지하므로 전체 이력은 JSON Lines 파일에 추가 기록 (선택)
+        self._history_log_path = config.get('evolution_history_path')
+        # 세대별 시스템 DNA 보관 디렉터리 (선택, 롤백/분석용)
+        self._dna_archive_dir = Path(config['dna_archive_dir']) if config.get('dna_archive_dir') else None
         
         # AI 에이전트 풀
         self.ai_agents = {}
         self.agent_collaboration_network = nx.DiGraph()
         
+        # 에이전트 스칼라 속성 컬럼 (Structure-of-Arrays, 유일한 저장소)
+        self.agent_columns = AgentColumns()
+        
         # 자가 학습 시스템
         self.meta_learner = None
-        self.experience_buffer = []
+        self.experience_buffer = deque(maxlen=config.get('experience_buffer_size', 100_000))
         self.knowledge_graph = nx.Graph()
         
         # 자율 실험 시스템
         self.experiment_queue = []
         self.running_experiments = {}
+        
+        # 상태 변경 구독자 (status_stream)와 마지막 건강 진단 결과 (푸시 시 재진단하지 않음)
+        self._status_subscribers: List[asyncio.Queue] = []
+        self._last_health: Dict[str, Any] = {}
         self.experiment_results = {}
+        self._experiment_semaphore = asyncio.Semaphore(config.get('experiment_parallelism', 5))
         
         # 성능 모니터링
-        self.performance_tracker = PerformanceTracker()
+        self.performance_tracker = PerformanceTracker(config.get('metrics_port', 8000))
         self.anomaly_detector = AnomalyDetector()
         
         # 코드 생성 및 최적화
@@ -187,11 +335,46 @@ class AutonomousEvolutionEngine:
             meta_learning_rate=0.01
         )
         
-        # 지식 그래프 초기화 (기본 도메인 지식)
-        await self._initialize_knowledge_graph()
+        # 지식 그래프 초기화 (기본 도메인 지식, 디스크 캐시 사용)
+        await self._load_or_build_knowledge_graph()
         
         logger.info("🧠 메타 러닝 시스템 초기화 완료")
     
+    async def _load_or_build_knowledge_graph(self):
+        """지식 그래프를 디스크 캐시에서 로드하거나 새로 구축"""
+        
+        # 캐시 키 = 형식 버전 + 그래프 설정 (버전이 바뀌면 이전 캐시는 무시)
+        graph_config = json.dumps(
+            {'version': _KNOWLEDGE_GRAPH_CACHE_VERSION, 'config': self.config.get('knowledge_graph', {})},
+            sort_keys=True, default=str
+        )
+        config_hash = hashlib.sha256(graph_config.encode()).hexdigest()[:16]
+        cache_dir = Path(self.config.get('cache_dir') or _default_cache_dir())
+        cache_path = cache_dir / f"kg_{config_hash}.msgpack"
+        
+        # 캐시는 데이터 전용 형식(msgpack node-link)이라 로드 시 코드가 실행되지 않음
+        if cache_path.exists():
+            try:
+                data = msgpack.unpackb(cache_path.read_bytes(), ext_hook=_decode_ndarray,
+                                       raw=False, strict_map_key=False)
+                self.knowledge_graph = nx.node_link_graph(data)
+                logger.info(f"📚 지식 그래프 캐시 로드: {cache_path}")
+                return
+            except (OSError, ValueError, KeyError, TypeError, nx.NetworkXError) as e:
+                logger.warning(f"지식 그래프 캐시 무시 ({cache_path}): {e}")
+        
+        await self._initialize_knowledge_graph()
+        
+        # 사용자 전용 디렉터리/파일 권한으로 임시 파일에 쓴 뒤 원자적 교체
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        payload = msgpack.packb(nx.node_link_data(self.knowledge_graph),
+                                default=_encode_ndarray, use_bin_type=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    
     async def _create_agent_swarm(self):
         """AI 에이전트 스웜 생성"""
         
@@ -223,12 +406,18 @@ class AutonomousEvolutionEngine:
             }
         ]
         
+        created_at = datetime.now()
+        
+        num_agents = sum(agent_config['count'] for agent_config in agent_types)
+        self.agent_columns.reserve(len(self.agent_columns) + num_agents)
+        
         for agent_config in agent_types:
             for i in range(agent_config['count']):
                 agent = await self._create_ai_agent(
                     agent_type=agent_config['type'],
                     agent_index=i,
-                    capabilities=agent_config['capabilities']
+                    capabilities=agent_config['capabilities'],
+                    created_at=created_at
                 )
                 self.ai_agents[agent.agent_id] = agent
         
@@ -237,7 +426,8 @@ class AutonomousEvolutionEngine:
         
         logger.info(f"🤖 AI 에이전트 스웜 생성 완료: {len(self.ai_agents)}개 에이전트")
     
-    async def _create_ai_agent(self, agent_type: str, agent_index: int, capabilities: List[str]) -> AIAgent:
+    async def _create_ai_agent(self, agent_type: str, agent_index: int, capabilities: List[str],
+                               created_at: Optional[datetime] = None) -> AIAgent:
         """개별 AI 에이전트 생성"""
         
         agent_id = f"{agent_type}_{agent_index:02d}"
@@ -284,18 +474,19 @@ class AutonomousEvolutionEngine:
                 'rl_hidden': 512
             }
         
+        row = self.agent_columns.add(agent_id, learning_rate=0.001, exploration_rate=0.1,
+                                     collaboration_score=0.0)
         agent = AIAgent(
             agent_id=agent_id,
             agent_type=agent_type,
             capabilities=capabilities,
             current_task=None,
             performance_history=[],
-            learning_rate=0.001,
-            exploration_rate=0.1,
             memory_size=10000,
             model_architecture=model_architecture,
-            last_update=datetime.now(),
-            collaboration_score=0.0
+            last_update=created_at or datetime.now(),
+            columns=self.agent_columns,
+            row=row
         )
         
         return agent
@@ -312,24 +503,52 @@ class AutonomousEvolutionEngine:
             )
         
         # 협업 관계 설정 (능력 기반 매칭)
-        for agent1_id, agent1 in self.ai_agents.items():
-            for agent2_id, agent2 in self.ai_agents.items():
-                if agent1_id != agent2_id:
-                    collaboration_strength = self._calculate_collaboration_potential(agent1, agent2)
-                    
-                    if collaboration_strength > 0.5:
-                        self.agent_collaboration_network.add_edge(
-                            agent1_id, agent2_id,
-                            strength=collaboration_strength,
-                            interaction_count=0
-                        )
+        collaboration_matrix = self._calculate_collaboration_matrix()
+        agent_ids = list(self.ai_agents.keys())
+        
+        for i, j in np.argwhere(collaboration_matrix > 0.5):
+            self.agent_collaboration_network.add_edge(
+                agent_ids[i], agent_ids[j],
+                strength=float(collaboration_matrix[i, j]),
+                interaction_count=0
+            )
         
         logger.info(f"🤝 에이전트 협업 네트워크 구축: {len(self.agent_collaboration_network.edges)}개 연결")
     
+    def _calculate_collaboration_matrix(self) -> np.ndarray:
+        """전체 에이전트 쌍의 협업 잠재력 (능력 Jaccard 유사도) 행렬"""
+        
+        capability_index = {}
+        for agent in self.ai_agents.values():
+            for capability in agent.capabilities:
+                capability_index.setdefault(capability, len(capability_index))
+        
+        # [num_agents, num_capabilities] one-hot 능력 행렬
+        capabilities = np.zeros((len(self.ai_agents), len(capability_index)), dtype=np.float32)
+        for row, agent in enumerate(self.ai_agents.values()):
+            capabilities[row, [capability_index[c] for c in agent.capabilities]] = 1.0
+        
+        intersection = capabilities @ capabilities.T
+        counts = capabilities.sum(axis=1)
+        union = counts[:, None] + counts[None, :] - intersection
+        strength = intersection / np.maximum(union, 1.0)
+        
+        # 자기 자신과의 협업은 제외
+        np.fill_diagonal(strength, 0.0)
+        
+        return strength
+    
     async def _autonomous_evolution_loop(self):
         """자율 진화 메인 루프"""
         
+        # 절대 데드라인 기준 주기 (실행 시간만큼 주기가 밀리지 않도록)
+        period = self.config.get('evolution_cycle_minutes', 60) * 60
+        next_tick = time.monotonic() + period
+        self._fail_count = 0
+        
         while True:
+            self.cycle_timestamp = datetime.now()
+            
             try:
                 # 성능 평가
                 current_performance = await self._evaluate_system_performance()
@@ -353,13 +572,22 @@ class AutonomousEvolutionEngine:
                 # 시스템 자가 치유
                 await self._perform_autonomous_healing()
                 
-                # 다음 진화 주기까지 대기
-                await asyncio.sleep(self.config.get('evolution_cycle_minutes', 60) * 60)
+                self._fail_count = 0
+                
+                # 다음 진화 주기까지 대기 (주기를 초과했으면 바로 다음 주기 시작)
+                sleep_for = max(0.0, next_tick - time.monotonic())
+                next_tick += period
+                await asyncio.sleep(sleep_for)
                 
             except Exception as e:
                 logger.error(f"자율 진화 루프 오류: {e}")
                 await self._emergency_recovery()
-                await asyncio.sleep(300)  # 5분 대기 후 재시도
+                
+                # 지수 백오프 (5분부터 최대 1시간)
+                delay = min(300 * 2 ** self._fail_count, 3600)
+                self._fail_count += 1
+                await asyncio.sleep(delay)
+                next_tick = time.monotonic() + period
     
     async def _evolve_new_generation(self):
         """새로운 세대 진화"""
@@ -369,6 +597,19 @@ class AutonomousEvolutionEngine:
         
         # 현재 시스템 DNA 수집
         current_dna = await self._extract_system_dna()
+        if self._dna_archive_dir is not None:
+            # 돌연변이 전 상태를 보관 (직렬화는 여기서 끝내고 파일 기록만 스레드로)
+            await asyncio.to_thread(self._archive_system_dna, current_dna.generation, current_dna.to_bytes())
+        
+        # 연속형 하이퍼파라미터 유전자 돌연변이 (에이전트 전체를 한 번에)
+        hyperparameter_genes = current_dna.hyperparameter_genes
+        mutation_rate = self.config.get('mutation_rate', 0.1)
+        hyperparameter_genes['learning_rates'] = self._mutate_gene_vector(
+            hyperparameter_genes['learning_rates'], mutation_rate
+        )
+        hyperparameter_genes['exploration_rates'] = np.minimum(
+            self._mutate_gene_vector(hyperparameter_genes['exploration_rates'], mutation_rate), 1.0
+        )
         
         # 유전자 풀 생성
         gene_pool = await self._create_gene_pool(current_dna)
@@ -386,41 +627,74 @@ class AutonomousEvolutionEngine:
         evolution_result = await self._evaluate_evolution_result()
         
         # 진화 이력 저장
+        fitness_scores = np.fromiter(
+            (o['fitness'] for o in offspring), dtype=np.float32, count=len(offspring)
+        )
         generation_info = EvolutionGeneration(
             generation_id=f"gen_{self.current_generation:06d}",
             generation_number=self.current_generation,
             population_size=len(offspring),
-            fitness_scores=[o['fitness'] for o in offspring],
-            best_individual=max(offspring, key=lambda x: x['fitness']),
+            fitness_scores=fitness_scores,
+            best_individual=offspring[int(np.argmax(fitness_scores))],
             mutation_rate=evolution_result['mutation_rate'],
             crossover_rate=evolution_result['crossover_rate'],
             selection_pressure=evolution_result['selection_pressure'],
             diversity_index=evolution_result['diversity_index'],
             performance_metrics=evolution_result['performance_metrics'],
-            timestamp=datetime.now()
+            timestamp=self.cycle_timestamp
         )
         
         self.evolution_history.append(generation_info)
+        if self._history_log_path:
+            await asyncio.to_thread(self._append_history_record, generation_info.to_json())
+        
+        self._publish_status()
         
         logger.info(f"✅ 세대 {self.current_generation} 진화 완료")
         logger.info(f"   최고 적합도: {generation_info.best_individual['fitness']:.4f}")
         logger.info(f"   다양성 지수: {generation_info.diversity_index:.4f}")
     
+    def _dna_archive_path(self, generation: int) -> Path:
+        """세대별 DNA 보관 파일 경로"""
+        return self._dna_archive_dir / f"dna_{generation:06d}.msgpack"
+    
+    def _archive_system_dna(self, generation: int, payload: bytes):
+        """DNA 바이트를 소유자 전용 파일로 원자적 기록 (스레드에서 호출)"""
+        self._dna_archive_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        archive_path = self._dna_archive_path(generation)
+        tmp_path = archive_path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, archive_path)
+    
+    async def load_system_dna(self, generation: int) -> SystemDNA:
+        """보관된 세대의 시스템 DNA 로드 (dna_archive_dir 설정 필요)"""
+        if self._dna_archive_dir is None:
+            raise ValueError("dna_archive_dir가 설정되지 않았습니다")
+        payload = await asyncio.to_thread(self._dna_archive_path(generation).read_bytes)
+        return SystemDNA.from_bytes(payload)
+    
+    def _append_history_record(self, record: bytes):
+        """세대 기록 한 줄을 이력 파일에 추가 (스레드에서 호출)"""
+        with open(self._history_log_path, 'ab') as f:
+            f.write(record + b'\n')
+    
     async def _extract_system_dna(self) -> SystemDNA:
         """현재 시스템의 DNA 추출"""
         
         # 아키텍처 유전자
         architecture_genes = {
             'neural_architectures': [agent.model_architecture for agent in self.ai_agents.values()],
-            'network_topology': nx.to_dict_of_dicts(self.agent_collaboration_network),
+            'network_topology': self._extract_network_topology(),
             'layer_configurations': await self._extract_layer_configs(),
             'activation_functions': await self._extract_activation_functions()
         }
         
         # 하이퍼파라미터 유전자
         hyperparameter_genes = {
-            'learning_rates': [agent.learning_rate for agent in self.ai_agents.values()],
-            'exploration_rates': [agent.exploration_rate for agent in self.ai_agents.values()],
+            'learning_rates': self.agent_columns.learning_rates.copy(),
+            'exploration_rates': self.agent_columns.exploration_rates.copy(),
             'batch_sizes': await self._extract_batch_sizes(),
             'regularization_params': await self._extract_regularization_params()
         }
@@ -438,7 +712,8 @@ class AutonomousEvolutionEngine:
             'execution_times': await self._extract_execution_times(),
             'memory_usage': await self._extract_memory_usage(),
             'accuracy_scores': await self._extract_accuracy_scores(),
-            'efficiency_metrics': await self._extract_efficiency_metrics()
+            'efficiency_metrics': await self._extract_efficiency_metrics(),
+            'collaboration_scores': self.agent_columns.collaboration_scores.copy()
         }
         
         # 적응 유전자
@@ -453,7 +728,7 @@ class AutonomousEvolutionEngine:
         fitness_score = await self._calculate_system_fitness()
         
         system_dna = SystemDNA(
-            dna_id=f"dna_{self.current_generation}_{int(datetime.now().timestamp())}",
+            dna_id=f"dna_{self.current_generation}_{int(self.cycle_timestamp.timestamp())}",
             architecture_genes=architecture_genes,
             hyperparameter_genes=hyperparameter_genes,
             algorithm_genes=algorithm_genes,
@@ -466,6 +741,35 @@ class AutonomousEvolutionEngine:
         
         return system_dna
     
+    def _extract_network_topology(self) -> Dict[str, Any]:
+        """협업 네트워크를 CSR 배열로 추출"""
+        
+        nodes = list(self.agent_collaboration_network.nodes)
+        adjacency = nx.to_scipy_sparse_array(
+            self.agent_collaboration_network,
+            nodelist=nodes,
+            weight='strength',
+            format='csr'
+        )
+        
+        return {
+            'nodes': nodes,
+            'indptr': adjacency.indptr,
+            'indices': adjacency.indices,
+            'strengths': adjacency.data
+        }
+    
+    def _mutate_gene_vector(self, genes: np.ndarray, mutation_rate: float, sigma: float = 0.1) -> np.ndarray:
+        """유전자 벡터 돌연변이 (벡터화된 마스크 + 로그정규 배율 노이즈)
+        
+        학습률처럼 값의 규모가 작은 유전자도 부호와 규모를 유지하도록 곱셈형으로 적용한다.
+        """
+        
+        mask = self._rng.random(genes.shape) < mutation_rate
+        noise = self._rng.standard_normal(genes.shape).astype(genes.dtype, copy=False) * sigma
+        
+        return np.where(mask, genes * np.exp(noise), genes)
+    
     async def _run_autonomous_experiments(self):
         """자율 실험 실행"""
         
@@ -475,9 +779,10 @@ class AutonomousEvolutionEngine:
         # 실험 우선순위 결정
         prioritized_experiments = await self._prioritize_experiments(new_experiments)
         
-        # 병렬 실험 실행
-        for experiment in prioritized_experiments[:5]:  # 동시에 5개까지
-            asyncio.create_task(self._execute_experiment(experiment))
+        # 병렬 실험 실행 (동시 실행 수는 세마포어로 제한)
+        await asyncio.gather(*[
+            self._execute_experiment(experiment) for experiment in prioritized_experiments
+        ])
         
         # 완료된 실험 결과 분석
         await self._analyze_completed_experiments()
@@ -509,13 +814,16 @@ class AutonomousEvolutionEngine:
         experiment_id = experiment['experiment_id']
         
         try:
-            logger.info(f"🧪 실험 시작: {experiment_id}")
-            
-            # 실험 환경 설정
-            experiment_env = await self._setup_experiment_environment(experiment)
-            
-            # 실험 실행
-            results = await self._run_experiment_procedure(experiment, experiment_env)
+            async with self._experiment_semaphore:
+                logger.info(f"🧪 실험 시작: {experiment_id}")
+                self.running_experiments[experiment_id] = experiment
+                self._publish_status()
+                
+                # 실험 환경 설정
+                experiment_env = await self._setup_experiment_environment(experiment)
+                
+                # 실험 실행
+                results = await self._run_experiment_procedure(experiment, experiment_env)
             
             # 결과 분석
             analysis = await self._analyze_experiment_results(results)
@@ -525,7 +833,7 @@ class AutonomousEvolutionEngine:
                 'experiment': experiment,
                 'results': results,
                 'analysis': analysis,
-                'timestamp': datetime.now(),
+                'timestamp': self.cycle_timestamp,
                 'status': 'completed'
             }
             
@@ -540,15 +848,19 @@ class AutonomousEvolutionEngine:
             self.experiment_results[experiment_id] = {
                 'experiment': experiment,
                 'error': str(e),
-                'timestamp': datetime.now(),
+                'timestamp': self.cycle_timestamp,
                 'status': 'failed'
             }
+        
+        finally:
+            self.running_experiments.pop(experiment_id, None)
+            self._publish_status()
     
     async def _perform_autonomous_healing(self):
         """시스템 자가 치유"""
         
-        # 시스템 상태 진단
-        health_status = await self._diagnose_system_health()
+        # 시스템 상태 진단 (결과는 상태 스트림용으로 캐시)
+        health_status = await self.check_health()
         
         if health_status['critical_issues']:
             logger.warning("🩺 시스템 자가 치유 시작...")
@@ -600,6 +912,63 @@ class AutonomousEvolutionEngine:
             'optimization_history': best_code['history']
         }
     
+    def snapshot(self) -> Tuple[int, List[str], Dict[str, Any]]:
+        """모니터링용 상태 스냅샷 (세대, 실행 중 실험 ID, 마지막 건강 진단 결과)
+        
+        메모리 상태만 읽으므로 진단 RPC를 일으키지 않는다.
+        최신 건강 상태가 필요하면 구독자가 check_health()를 직접 호출한다.
+        """
+        return (
+            self.current_generation,
+            list(self.running_experiments),
+            self._last_health
+        )
+    
+    async def check_health(self) -> Dict[str, Any]:
+        """시스템 건강 진단을 실행하고 결과를 캐시한 뒤 구독자에게 알림
+        
+        분산 훈련 워커 상태도 동시에 수집해 health['workers']에 담는다.
+        """
+        health, worker_health = await asyncio.gather(
+            self._diagnose_system_health(),
+            self.distributed_trainer.diagnose_workers()
+        )
+        health['workers'] = worker_health
+        self._last_health = health
+        self._publish_status()
+        return self._last_health
+    
+    async def status_stream(self) -> AsyncIterator[Tuple[int, List[str], Dict[str, Any]]]:
+        """세대 진화, 실험 시작/종료, 건강 진단 시마다 상태 스냅샷을 푸시"""
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        self._status_subscribers.append(queue)
+        
+        try:
+            yield self.snapshot()  # 현재 상태
+            while True:
+                yield await queue.get()
+        finally:
+            self._status_subscribers.remove(queue)
+    
+    def _publish_status(self):
+        """구독자에게 상태 스냅샷 전달 (느린 구독자는 오래된 상태부터 버림)
+        
+        실험 실행/세대 진화 흐름을 막지 않도록 실패는 로그만 남긴다.
+        """
+        
+        if not self._status_subscribers:
+            return
+        
+        try:
+            status = self.snapshot()
+            for queue in self._status_subscribers:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(status)
+        except Exception as e:
+            logger.warning(f"상태 푸시 실패: {e}")
+    
     async def autonomous_system_optimization(self) -> Dict[str, Any]:
         """시스템 전체 자율 최적화"""
         
@@ -645,11 +1014,17 @@ class MAMLMetaLearner(nn.Module):
     """Model-Agnostic Meta-Learning"""
     
     def __init__(self, input_dim: int, hidden_dim: int, output_dim: int, 
-                 num_layers: int, learning_rate: float, meta_learning_rate: float):
+                 num_layers: int, learning_rate: float, meta_learning_rate: float,
+                 first_order: bool = True, compile_network: bool = True,
+                 mixed_precision: bool = True):
         super().__init__()
         
         self.learning_rate = learning_rate
         self.meta_learning_rate = meta_learning_rate
+        # FOMAML: 2차 미분 항을 생략 (second-order MAML은 first_order=False로 선택)
+        self.first_order = first_order
+        # Inner Loop 활성값은 bf16으로 계산 (옵티마이저 마스터 가중치는 FP32 유지)
+        self.mixed_precision = mixed_precision
         
         # 기본 신경망
         layers = []
@@ -665,30 +1040,155 @@ class MAMLMetaLearner(nn.Module):
         
         self.network = nn.Sequential(*layers)
         
+        # Linear 레이어 (weight, bias) 키를 한 번만 계산
+        self._linear_keys = [
+            (f'{i}.weight', f'{i}.bias')
+            for i, module in enumerate(self.network)
+            if isinstance(module, nn.Linear)
+        ]
+        
+        # 소형 MLP는 커널 런치 오버헤드가 지배적이므로 CUDA 그래프로 컴파일
+        self._network_forward = self.network.forward
+        self._params_forward = self._functional_forward
+        if compile_network and torch.cuda.is_available():
+            self._network_forward = torch.compile(self.network.forward, mode='reduce-overhead', fullgraph=True)
+            self._params_forward = torch.compile(self._functional_forward, mode='reduce-overhead', fullgraph=True)
+        
         # 메타 옵티마이저
         self.meta_optimizer = optim.Adam(self.parameters(), lr=meta_learning_rate)
     
     def forward(self, x):
-        return self.network(x)
+        return self._network_forward(x)
+    
+    def _functional_forward(self, params: Dict[str, torch.Tensor], x: torch.Tensor) -> torch.Tensor:
+        """functional_call 기반 forward (컴파일 그래프가 inner step 간 고정됨)"""
+        return functional_call(self.network, params, (x,))
     
     async def meta_learn(self, tasks: List[Dict[str, Any]]) -> float:
         """메타 학습 실행"""
         
+        try:
+            # 모든 태스크의 데이터 형태가 같으면 vmap으로 한 번에 적응
+            if self._can_batch_tasks(tasks):
+                return self._batched_meta_learn(tasks)
+            
+            return await self._sequential_meta_learn(tasks)
+            
+        except torch.cuda.OutOfMemoryError:
+            # OOM일 때만 캐시 할당자를 비우고 호출자에게 전달
+            self.meta_optimizer.zero_grad(set_to_none=True)
+            torch.cuda.empty_cache()
+            raise
+    
+    async def _sequential_meta_learn(self, tasks: List[Dict[str, Any]]) -> float:
+        """태스크별 순차 메타 학습 (태스크 형태가 서로 다를 때)"""
+        
         meta_loss = 0.0
+        self.meta_optimizer.zero_grad(set_to_none=True)
         
         for task in tasks:
             # 태스크별 빠른 적응
             adapted_params = await self._fast_adaptation(task)
             
             # 메타 테스트
-            task_loss = await self._meta_test(task, adapted_params)
-            meta_loss += task_loss
+            task_loss = await self._meta_test(task, adapted_params) / len(tasks)
+            
+            if self.first_order:
+                # FOMAML: 적응된 파라미터에서의 그래디언트를 그대로 누적
+                task_grads = torch.autograd.grad(task_loss, list(adapted_params.values()))
+                for param, task_grad in zip(self.parameters(), task_grads):
+                    param.grad = task_grad if param.grad is None else param.grad + task_grad
+                del task_grads
+            else:
+                # 태스크마다 바로 역전파하여 2차 그래프를 즉시 해제
+                task_loss.backward()
+            
+            meta_loss += task_loss.item()
+            
+            # 다음 태스크 전에 적응 그래프 참조 해제
+            del adapted_params, task_loss
         
         # 메타 파라미터 업데이트
-        meta_loss /= len(tasks)
-        meta_loss.backward()
         self.meta_optimizer.step()
-        self.meta_optimizer.zero_grad()
+        self.meta_optimizer.zero_grad(set_to_none=True)
+        
+        return meta_loss
+    
+    def _to_device(self, tensor: torch.Tensor) -> torch.Tensor:
+        """모델 디바이스로 비동기 전송 (CPU 텐서는 pinned memory 경유)"""
+        
+        device = next(self.parameters()).device
+        if device.type == 'cuda' and tensor.device.type == 'cpu':
+            return tensor.pin_memory().to(device, non_blocking=True)
+        return tensor.to(device)
+    
+    def _autocast(self, x: torch.Tensor) -> torch.autocast:
+        """bf16 autocast 컨텍스트 (CUDA 입력에서만 활성화, CPU bf16은 오히려 느림)"""
+        return torch.autocast(x.device.type, dtype=torch.bfloat16,
+                              enabled=self.mixed_precision and x.is_cuda)
+    
+    def _can_batch_tasks(self, tasks: List[Dict[str, Any]]) -> bool:
+        """태스크 간 support/query 텐서 형태가 동일한지 확인"""
+        
+        if not tasks or any('query_set' not in task for task in tasks):
+            return False
+        
+        reference = tasks[0]
+        shapes = [t.shape for t in (*reference['support_set'], *reference['query_set'])]
+        return all(
+            [t.shape for t in (*task['support_set'], *task['query_set'])] == shapes
+            for task in tasks[1:]
+        )
+    
+    def _task_loss(self, params: Dict[str, torch.Tensor], x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """단일 태스크 손실 (vmap 대상)"""
+        with self._autocast(x):
+            pred = functional_call(self.network, params, (x,))
+        return F.mse_loss(pred.float(), y.float())
+    
+    def _batched_meta_learn(self, tasks: List[Dict[str, Any]]) -> float:
+        """vmap 기반 메타 학습 (태스크별 Python 루프 없음)"""
+        
+        num_tasks = len(tasks)
+        support_x = self._to_device(torch.stack([task['support_set'][0] for task in tasks]))
+        support_y = self._to_device(torch.stack([task['support_set'][1] for task in tasks]))
+        query_x = self._to_device(torch.stack([task['query_set'][0] for task in tasks]))
+        query_y = self._to_device(torch.stack([task['query_set'][1] for task in tasks]))
+        
+        # 파라미터를 [num_tasks, *param_shape] 형태로 확장
+        stacked_params = {
+            name: param.unsqueeze(0).expand(num_tasks, *param.shape)
+            for name, param in self.network.named_parameters()
+        }
+        if self.first_order:
+            stacked_params = {name: p.detach() for name, p in stacked_params.items()}
+        
+        inner_grad = vmap(grad(self._task_loss), randomness='different')
+        
+        # Inner Loop: 모든 태스크를 한 번에 5 스텝 적응
+        for _ in range(5):
+            grads = inner_grad(stacked_params, support_x, support_y)
+            stacked_params = {
+                name: p - self.learning_rate * grads[name]
+                for name, p in stacked_params.items()
+            }
+        
+        if self.first_order:
+            stacked_params = {name: p.detach().requires_grad_() for name, p in stacked_params.items()}
+        
+        # 메타 테스트
+        task_losses = vmap(self._task_loss, randomness='different')(stacked_params, query_x, query_y)
+        meta_loss = task_losses.mean()
+        
+        # 메타 파라미터 업데이트
+        if self.first_order:
+            meta_grads = torch.autograd.grad(meta_loss, list(stacked_params.values()))
+            for param, meta_grad in zip(self.network.parameters(), meta_grads):
+                param.grad = meta_grad.sum(0)
+        else:
+            meta_loss.backward()
+        self.meta_optimizer.step()
+        self.meta_optimizer.zero_grad(set_to_none=True)
         
         return meta_loss.item()
     
@@ -696,23 +1196,40 @@ class MAMLMetaLearner(nn.Module):
         """빠른 적응 (Inner Loop)"""
         
         # 태스크 데이터 준비
-        support_x, support_y = task['support_set']
+        support_x, support_y = (self._to_device(t) for t in task['support_set'])
         
-        # 현재 파라미터 복사
-        adapted_params = {name: param.clone() for name, param in self.named_parameters()}
+        # 현재 파라미터 복사 (FOMAML은 메타 그래프에서 분리)
+        if self.first_order:
+            adapted_params = {
+                name: param.detach().clone().requires_grad_()
+                for name, param in self.network.named_parameters()
+            }
+        else:
+            adapted_params = {name: param.clone() for name, param in self.network.named_parameters()}
         
         # 몇 번의 그래디언트 스텝
         for _ in range(5):  # 5 steps of adaptation
-            # Forward pass
-            pred = self._forward_with_params(support_x, adapted_params)
-            loss = F.mse_loss(pred, support_y)
+            # Forward pass (2차 MAML은 create_graph 역전파를 위해 컴파일하지 않은 경로 사용)
+            with self._autocast(support_x):
+                if self.first_order:
+                    pred = self._params_forward(adapted_params, support_x)
+                else:
+                    pred = self._forward_with_params(support_x, adapted_params)
+            loss = F.mse_loss(pred.float(), support_y.float())
             
             # 그래디언트 계산
-            grads = torch.autograd.grad(loss, adapted_params.values(), create_graph=True)
+            grads = torch.autograd.grad(
+                loss, list(adapted_params.values()), create_graph=not self.first_order
+            )
             
             # 파라미터 업데이트
             for (name, param), grad in zip(adapted_params.items(), grads):
-                adapted_params[name] = param - self.learning_rate * grad
+                updated = param - self.learning_rate * grad
+                if self.first_order:
+                    updated = updated.detach().requires_grad_()
+                adapted_params[name] = updated
+            
+            del pred, loss, grads
         
         return adapted_params
     
@@ -721,14 +1238,12 @@ class MAMLMetaLearner(nn.Module):
         
         # 수동으로 레이어 통과
         h = x
-        layer_idx = 0
+        last_idx = len(self._linear_keys) - 1
         
-        for name, param in params.items():
-            if 'weight' in name:
-                h = F.linear(h, param, params.get(name.replace('weight', 'bias')))
-                if layer_idx < len(params) // 2 - 1:  # 마지막 레이어가 아니면
-                    h = F.relu(h)
-                layer_idx += 1
+        for layer_idx, (weight_key, bias_key) in enumerate(self._linear_keys):
+            h = F.linear(h, params[weight_key], params[bias_key])
+            if layer_idx < last_idx:  # 마지막 레이어가 아니면
+                h = F.relu(h)
         
         return h
 
@@ -811,16 +1326,30 @@ class ArchitectureOptimizer:
             'energy_efficiency': validation_result['energy_improvement']
         }
 
+# Prometheus 메트릭 (Grafana가 /metrics 엔드포인트에서 수집)
+METRIC_GAUGE = Gauge(
+    'autonomous_ai_metric',
+    '자율 AI 시스템 메트릭',
+    ['category', 'metric']
+)
+METRIC_COLLECTION_SECONDS = Histogram(
+    'autonomous_ai_metric_collection_seconds',
+    '메트릭 수집 소요 시간'
+)
+
 class PerformanceTracker:
     """성능 추적 시스템"""
     
-    def __init__(self):
-        self.metrics_history = defaultdict(list)
+    def __init__(self, metrics_port: int = 8000):
+        self.metrics_port = metrics_port
         self.alert_thresholds = {}
         
     async def start_monitoring(self):
         """성능 모니터링 시작"""
         
+        # Prometheus pull 엔드포인트
+        prometheus_client.start_http_server(self.metrics_port)
+        
         # 시스템 메트릭 수집 루프
         asyncio.create_task(self._collect_metrics_loop())
         
@@ -835,20 +1364,20 @@ class PerformanceTracker:
         
         while True:
             try:
-                # CPU, 메모리, GPU 사용률
-                system_metrics = await self._collect_system_metrics()
-                
-                # AI 모델 성능 메트릭
-                model_metrics = await self._collect_model_metrics()
-                
-                # 비즈니스 메트릭
-                business_metrics = await self._collect_business_metrics()
+                with METRIC_COLLECTION_SECONDS.time():
+                    # CPU, 메모리, GPU 사용률
+                    system_metrics = await self._collect_system_metrics()
+                    
+                    # AI 모델 성능 메트릭
+                    model_metrics = await self._collect_model_metrics()
+                    
+                    # 비즈니스 메트릭
+                    business_metrics = await self._collect_business_metrics()
                 
-                # 메트릭 저장
-                timestamp = datetime.now()
-                self.metrics_history['system'].append((timestamp, system_metrics))
-                self.metrics_history['models'].append((timestamp, model_metrics))
-                self.metrics_history['business'].append((timestamp, business_metrics))
+                # 메트릭 게시 (이력은 Prometheus가 보관)
+                self._publish_metrics('system', system_metrics)
+                self._publish_metrics('models', model_metrics)
+                self._publish_metrics('business', business_metrics)
                 
                 # 알림 확인
                 await self._check_alerts(system_metrics, model_metrics, business_metrics)
@@ -858,6 +1387,13 @@ class PerformanceTracker:
             except Exception as e:
                 logger.error(f"메트릭 수집 오류: {e}")
                 await asyncio.sleep(30)
+    
+    def _publish_metrics(self, category: str, metrics: Dict[str, Any]):
+        """수치형 메트릭을 Prometheus 게이지에 기록"""
+        
+        for name, value in metrics.items():
+            if isinstance(value, (int, float)):
+                METRIC_GAUGE.labels(category=category, metric=name).set(value)
 
 class DistributedTrainer:
     """분산 훈련 시스템"""
@@ -865,84 +1401,450 @@ class DistributedTrainer:
     def __init__(self):
         self.ray_cluster = None
         self.training_workers = []
+        self._num_workers = 0
+        
+        # 스트래글러 대응 리샤딩 설정
+        self.shards_per_worker = 8  # 워커당 가상 샤드 수 (재배치 단위)
+        self.speed_ewma_alpha = 0.3  # 배치당 소요 시간 EWMA 계수
+        self.min_rebalance_gain = 0.05  # 재배치를 수행할 최소 예상 단축 비율
+        self.rebalance_interval = 4  # 재배치(전체 워커 동기화) 주기 (에폭)
         
     async def initialize_cluster(self, cluster_config: Dict[str, Any]):
         """분산 클러스터 초기화"""
         
+        num_workers = cluster_config.get('num_workers', 4)
+        num_gpus = cluster_config.get('num_gpus', 2)
+        
         # Ray 클러스터 시작
         ray.init(
             address=cluster_config.get('ray_address', 'auto'),
             num_cpus=cluster_config.get('num_cpus', 8),
-            num_gpus=cluster_config.get('num_gpus', 2)
+            num_gpus=num_gpus
         )
         
-        # 분산 훈련 워커 생성
+        # 분산 훈련 워커 생성 (NCCL은 rank마다 전용 GPU가 필요하므로 워커 수만큼 GPU가 있을 때만 할당)
+        self._num_workers = num_workers
+        gpus_per_worker = 1 if num_gpus >= num_workers else 0
         self.training_workers = [
-            TrainingWorker.remote() for _ in range(cluster_config.get('num_workers', 4))
+            TrainingWorker.options(num_gpus=gpus_per_worker).remote() for _ in range(num_workers)
         ]
         
-        logger.info(f"분산 훈련 클러스터 초기화 완료: {len(self.training_workers)}개 워커")
+        self.shards_per_worker = cluster_config.get('shards_per_worker', self.shards_per_worker)
+        self.min_rebalance_gain = cluster_config.get('min_rebalance_gain', self.min_rebalance_gain)
+        self.rebalance_interval = max(1, cluster_config.get('rebalance_interval', self.rebalance_interval))
+        
+        # 모델 state 교환용 collective 그룹 (워커에 GPU가 할당된 경우 NCCL → 노드 내 CUDA IPC / 노드 간 RDMA)
+        backend = 'nccl' if gpus_per_worker else 'gloo'
+        await asyncio.gather(*[
+            worker.setup_collective.remote(num_workers, rank, backend, 'model_reduce')
+            for rank, worker in enumerate(self.training_workers)
+        ])
+        
+        logger.info(f"분산 훈련 클러스터 초기화 완료: {num_workers}개 워커")
     
     async def distributed_train(self, 
                               model_config: Dict[str, Any],
                               training_data: Dict[str, Any]) -> Dict[str, Any]:
-        """분산 훈련 실행"""
-        
-        # 데이터 분할
-        data_shards = await self._shard_training_data(training_data)
-        
-        # 분산 훈련 시작
-        training_futures = []
-        for worker, data_shard in zip(self.training_workers, data_shards):
-            future = worker.train.remote(model_config, data_shard)
-            training_futures.append(future)
+        """분산 훈련 실행
+        
+        드라이버는 샤드 인덱스만 전송하고, 각 워커가 memory-mapped Arrow
+        데이터셋(training_data['dataset_path'])에서 자신의 샤드를 지연 로드한다.
+        dataset_path가 없으면 이전처럼 인메모리 training_data['batches']를 샤딩하며,
+        training_data['validation']이 없으면 평가를 생략한다.
+        
+        워커들은 rebalance_interval 에폭마다 한 번만 동기화(샤드 재배치)하고,
+        그 사이에는 각자 다음 에폭을 바로 이어서 실행한다.
+        """
+        
+        num_epochs = model_config['epochs']
+        num_workers = self._num_workers
+        if num_epochs <= 0:
+            return {
+                'final_model': None,
+                'wall_time': 0.0,
+                'core_seconds': 0.0,
+                'best_accuracy': None,
+                'worker_count': num_workers
+            }
         
-        # 훈련 결과 수집
-        training_results = await ray.get(training_futures)
+        # 분산 훈련 시작 (공통 설정은 한 번만 object store에 저장)
+        config_ref = ray.put(model_config)
+        validation = training_data.get('validation')
+        validation_ref = ray.put(validation) if validation is not None else None
         
-        # 모델 앙상블 또는 평균화
-        final_model = await self._aggregate_trained_models(training_results)
+        num_shards = num_workers * self.shards_per_worker
+        data_source = {
+            'batch_size': training_data.get('batch_size', 32),
+            'num_shards': num_shards
+        }
+        shard_refs = None
+        if 'dataset_path' in training_data:
+            data_source['dataset_path'] = training_data['dataset_path']
+        else:
+            # 인메모리 배치는 샤드별로 한 번씩만 object store에 저장 (워커는 배정된 샤드만 가져감)
+            batches = training_data['batches']
+            shard_refs = [ray.put(batches[shard_id::num_shards]) for shard_id in range(num_shards)]
+        data_source_ref = ray.put(data_source)
+        
+        shard_counts = np.full(num_workers, self.shards_per_worker)
+        batch_times = np.zeros(num_workers)
+        epoch_futures = []
+        
+        for segment_start in range(0, num_epochs, self.rebalance_interval):
+            # 구간 사이마다 워커 속도를 반영해 샤드 수를 재배치
+            if epoch_futures:
+                epoch_stats = await asyncio.gather(*epoch_futures)
+                batch_times = self._update_batch_times(batch_times, epoch_stats,
+                                                       first=(segment_start == self.rebalance_interval))
+                shard_counts = self._rebalance_shards(shard_counts, batch_times)
+            
+            epochs = range(segment_start, min(segment_start + self.rebalance_interval, num_epochs))
+            epoch_futures = [
+                asyncio.ensure_future(self._train_worker_epochs(
+                    rank, worker, epochs, shard_counts,
+                    config_ref, data_source_ref, shard_refs, validation_ref, num_epochs - 1
+                ))
+                for rank, worker in enumerate(self.training_workers)
+            ]
+        
+        # 훈련 메타데이터 수집 + 모델 평균화 (완료 순서대로 워커 간 리덕션)
+        training_results, final_model = await self._aggregate_trained_models(epoch_futures)
         
         return {
             'final_model': final_model,
-            'training_time': sum(r['training_time'] for r in training_results),
-            'best_accuracy': max(r['accuracy'] for r in training_results),
-            'worker_count': len(self.training_workers)
+            'wall_time': max(r['training_time'] for r in training_results),
+            'core_seconds': sum(r['training_time'] for r in training_results),
+            'best_accuracy': max((r['accuracy'] for r in training_results if 'accuracy' in r), default=None),
+            'worker_count': self._num_workers
         }
+    
+    async def _train_worker_epochs(self, rank: int, worker: Any, epochs: range, shard_counts: np.ndarray,
+                                   config_ref: Any, data_source_ref: Any, shard_refs: Optional[List[Any]],
+                                   validation_ref: Any, last_epoch: int) -> Dict[str, Any]:
+        """워커 하나가 에폭 구간을 다른 워커를 기다리지 않고 연속 실행 (마지막 에폭 결과 반환)"""
+        
+        result = None
+        for epoch in epochs:
+            shard_ids = self._shard_training_data(epoch, shard_counts)[rank]
+            data_shard = {'shard_ids': shard_ids, 'epoch': epoch}
+            if shard_refs is not None:
+                # dict 안의 ObjectRef는 자동 해제되지 않으므로 워커가 샤드별로 지연 조회
+                data_shard['shard_refs'] = [shard_refs[shard_id] for shard_id in shard_ids]
+            result = await worker.train.remote(
+                config_ref,
+                data_source_ref,
+                data_shard,
+                validation_ref if epoch == last_epoch else None
+            )
+        return result
+    
+    async def diagnose_workers(self) -> List[Dict[str, Any]]:
+        """모든 훈련 워커 상태를 한 번에 조회 (순차 RPC 대신 동시 수집)
+        
+        응답하지 않는 워커는 예외 대신 오류 항목으로 보고한다.
+        """
+        results = await asyncio.gather(*[worker.health.remote() for worker in self.training_workers],
+                                       return_exceptions=True)
+        return [
+            {'rank': rank, 'error': str(result)} if isinstance(result, Exception) else result
+            for rank, result in enumerate(results)
+        ]
+    
+    def _update_batch_times(self, batch_times: np.ndarray, epoch_stats: List[Dict[str, Any]], first: bool) -> np.ndarray:
+        """워커별 배치당 소요 시간 EWMA 갱신"""
+        
+        observed = np.array([stats['seconds_per_batch'] for stats in epoch_stats])
+        if first:
+            return observed
+        return self.speed_ewma_alpha * observed + (1.0 - self.speed_ewma_alpha) * batch_times
+    
+    def _rebalance_shards(self, shard_counts: np.ndarray, batch_times: np.ndarray) -> np.ndarray:
+        """가장 느린 워커의 샤드를 가장 빠른 워커로 이동
+        
+        샤드 크기는 동일하므로 예상 에폭 시간은 배치당 시간 × 샤드 수에
+        비례한다. 그 최댓값이 min_rebalance_gain 이상 줄어드는 경우에만 이동한다.
+        """
+        
+        shard_counts = shard_counts.copy()
+        
+        for _ in range(int(shard_counts.sum())):
+            predicted = batch_times * shard_counts
+            slowest, fastest = int(np.argmax(predicted)), int(np.argmin(predicted))
+            if slowest == fastest or shard_counts[slowest] <= 1:
+                break
+            
+            moved_max = max(batch_times[slowest] * (shard_counts[slowest] - 1),
+                            batch_times[fastest] * (shard_counts[fastest] + 1))
+            if moved_max > predicted[slowest] * (1.0 - self.min_rebalance_gain):
+                break
+            
+            shard_counts[slowest] -= 1
+            shard_counts[fastest] += 1
+        
+        return shard_counts
+    
+    async def _aggregate_trained_models(self, training_futures: List[Any]) -> Tuple[List[Dict[str, Any]], Dict[str, torch.Tensor]]:
+        """완료 순서 기반 트리 리덕션으로 워커 모델 평균화
+        
+        훈련을 마친 워커(또는 병합을 마친 워커) 두 개가 준비되는 즉시
+        collective send/recv로 평탄화된 파라미터를 직접 주고받아 병합하므로
+        가장 느린 워커를 기다리는 배리어가 없고, 드라이버는 마지막 하나의
+        결과만 받는다.
+        """
+        
+        ready_ranks: asyncio.Queue = asyncio.Queue()
+        merged_counts = [1] * self._num_workers
+        training_results = []
+        
+        async def track_training(rank, future):
+            try:
+                training_results.append(await future)
+                await ready_ranks.put(rank)
+            except Exception as e:
+                await ready_ranks.put(e)
+        
+        async def merge(left, right):
+            try:
+                # send/recv는 서로를 기다리므로 두 호출을 동시에 제출
+                await asyncio.gather(
+                    self.training_workers[right].send_state.remote(left),
+                    self.training_workers[left].reduce_from.remote(
+                        right, merged_counts[left], merged_counts[right]
+                    )
+                )
+                merged_counts[left] += merged_counts[right]
+                await ready_ranks.put(left)
+            except Exception as e:
+                await ready_ranks.put(e)
+        
+        pending = [
+            asyncio.create_task(track_training(rank, future))
+            for rank, future in enumerate(training_futures)
+        ]
+        
+        # 훈련 완료 N번 + 병합 완료 N-1번 = 2N-1개의 준비 이벤트
+        waiting_rank = None
+        for _ in range(2 * len(pending) - 1):
+            rank = await ready_ranks.get()
+            if isinstance(rank, Exception):
+                raise rank
+            if waiting_rank is None:
+                waiting_rank = rank
+            else:
+                pending.append(asyncio.create_task(merge(waiting_rank, rank)))
+                waiting_rank = None
+        
+        await asyncio.gather(*pending)
+        
+        final_state = await self.training_workers[waiting_rank].get_model_state.remote()
+        return training_results, final_state
+    
+    def _shard_training_data(self, epoch: int, shard_counts: np.ndarray) -> List[List[int]]:
+        """에폭별 rank 인식 회전 샤드 배정 (인덱스만 계산)
+        
+        워커 r의 j번째 샤드는 (e·R + offset_r + j) mod S 이다. offset_r은 앞선
+        워커들의 샤드 수 합이므로, 균등 배정일 때 에폭마다 R칸씩 회전한다.
+        """
+        
+        num_shards = int(shard_counts.sum())
+        num_workers = len(shard_counts)
+        offsets = np.concatenate(([0], np.cumsum(shard_counts)[:-1]))
+        
+        return [
+            [(epoch * num_workers + int(offset) + j) % num_shards for j in range(int(count))]
+            for offset, count in zip(offsets, shard_counts)
+        ]
 
-@ray.remote
+@ray.remote(max_concurrency=2)
 class TrainingWorker:
     """분산 훈련 워커"""
     
+    _MODEL_CACHE_SIZE = 3
+    
     def __init__(self):
         self.model = None
         self.optimizer = None
+        self._model_cache: OrderedDict = OrderedDict()
+        torch.backends.cudnn.benchmark = True
+        # 액터에 할당된 GPU가 있으면 모델과 교환 버퍼를 모두 CUDA에 둠
+        self.device = torch.device('cuda' if ray.get_gpu_ids() else 'cpu')
+        self.training_time = 0.0
+        self.rank = None
+        self.group_name = None
+        self.exchange_dtype = torch.bfloat16
+        
+        # 지연 로드 데이터셋과 현재 에폭의 샤드 배정
+        self._dataset = None
+        self._dataset_path = None
+        self.shard_ids = []
+        self.shard_refs = None
+        self.epoch = 0
+    
+    def set_shards(self, source: Dict[str, Any], shard_ids: List[int], epoch: int,
+                   shard_refs: Optional[List[Any]] = None):
+        """이번 에폭에 처리할 샤드 인덱스 설정 (데이터는 반복 시 지연 로드)
+        
+        인메모리 배치는 배정된 샤드의 ObjectRef(shard_refs)만 받는다.
+        """
+        
+        self.shard_refs = shard_refs
+        if shard_refs is not None:
+            self._dataset = None
+            self._dataset_path = None
+        elif self._dataset_path != source['dataset_path']:
+            datasets = importlib.import_module('datasets')
+            # Arrow 파일을 memory-map하므로 전체 데이터를 메모리에 올리지 않음
+            self._dataset = datasets.load_from_disk(source['dataset_path'])
+            self._dataset_path = source['dataset_path']
+        
+        self.num_shards = source['num_shards']
+        self.batch_size = source['batch_size']
+        self.shard_ids = shard_ids
+        self.epoch = epoch
     
-    def train(self, model_config: Dict[str, Any], data_shard: Dict[str, Any]) -> Dict[str, Any]:
-        """개별 워커 훈련"""
+    def _iter_batches(self):
+        """배정된 샤드의 배치를 지연 순회"""
         
-        # 모델 초기화
-        self.model = self._create_model(model_config)
-        self.optimizer = optim.Adam(self.model.parameters())
+        if self.shard_refs is not None:
+            for shard_ref in self.shard_refs:
+                yield from ray.get(shard_ref)
+            return
         
-        # 훈련 루프
-        start_time = time.time()
+        for shard_id in self.shard_ids:
+            shard = self._dataset.shard(self.num_shards, shard_id, contiguous=True)
+            yield from shard.iter(batch_size=self.batch_size)
+    
+    def _get_or_create_model(self, model_config: Dict[str, Any]) -> Tuple[nn.Module, optim.Optimizer]:
+        """설정 해시 기반 모델/옵티마이저 캐시 (LRU, 최대 _MODEL_CACHE_SIZE개)"""
         
-        for epoch in range(model_config['epochs']):
-            for batch in data_shard['batches']:
-                loss = self._training_step(batch)
+        key = hashlib.blake2b(json.dumps(model_config, sort_keys=True, default=str).encode()).hexdigest()
         
-        training_time = time.time() - start_time
+        if key in self._model_cache:
+            self._model_cache.move_to_end(key)
+            model, optimizer = self._model_cache[key]
+            
+            # 할당된 메모리는 유지하고 가중치와 옵티마이저 상태만 초기화
+            for module in model.modules():
+                if hasattr(module, 'reset_parameters'):
+                    module.reset_parameters()
+            optimizer.state = defaultdict(dict)
+            return model, optimizer
+        
+        model = self._create_model(model_config).to(self.device)
+        optimizer = optim.Adam(model.parameters())
+        self._model_cache[key] = (model, optimizer)
+        if len(self._model_cache) > self._MODEL_CACHE_SIZE:
+            self._model_cache.popitem(last=False)
+        
+        return model, optimizer
+    
+    async def train(self, model_config: Dict[str, Any], data_source: Dict[str, Any],
+                    data_shard: Dict[str, Any],
+                    validation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """배정된 샤드로 한 에폭 훈련
+        
+        연산은 스레드 풀에서 실행하여 액터 이벤트 루프를 비워 두므로
+        훈련 중에도 health() 등 다른 호출이 바로 응답한다.
+        """
+        
+        loop = asyncio.get_running_loop()
+        epoch = data_shard['epoch']
+        self.set_shards(data_source, data_shard['shard_ids'], epoch, data_shard.get('shard_refs'))
+        
+        # 모델 초기화 (첫 에폭, 동일 설정의 모델/옵티마이저는 재사용)
+        if epoch == 0:
+            self.model, self.optimizer = self._get_or_create_model(model_config)
+            self.training_time = 0.0
+        
+        # 훈련 루프 (단조 시계 기준)
+        start_ns = time.perf_counter_ns()
+        num_batches = await loop.run_in_executor(None, self._run_epoch)
+        epoch_time = (time.perf_counter_ns() - start_ns) / 1e9
+        self.training_time += epoch_time
+        
+        # 모델 state는 리덕션 단계에서 get_model_state()로만 전달
+        result = {
+            'seconds_per_batch': epoch_time / max(num_batches, 1),
+            'training_time': self.training_time,
+            'worker_id': ray.get_runtime_context().worker_id
+        }
+        
+        # 마지막 에폭에서만 모델 평가
+        if validation is not None:
+            result['accuracy'] = await loop.run_in_executor(None, self._evaluate_model, validation)
+        
+        return result
+    
+    def _run_epoch(self) -> int:
+        """배정된 샤드 전체에 대해 훈련 스텝 실행 (스레드 풀에서 호출)"""
         
-        # 모델 평가
-        accuracy = self._evaluate_model(data_shard['validation'])
+        num_batches = 0
+        for batch in self._iter_batches():
+            loss = self._training_step(batch)
+            num_batches += 1
         
+        return num_batches
+    
+    async def health(self) -> Dict[str, Any]:
+        """워커 상태 요약 (헬스 체크용 경량 응답)"""
         return {
-            'model_state': self.model.state_dict(),
-            'training_time': training_time,
-            'accuracy': accuracy,
-            'worker_id': ray.get_runtime_context().worker_id
+            'worker_id': ray.get_runtime_context().worker_id,
+            'model_loaded': self.model is not None,
+            'epoch': self.epoch,
+            'num_shards': len(self.shard_ids),
+            'training_time': self.training_time
         }
+    
+    def setup_collective(self, world_size: int, rank: int, backend: str, group_name: str):
+        """모델 state 교환용 collective 그룹 참여"""
+        
+        collective.init_collective_group(world_size, rank, backend=backend, group_name=group_name)
+        self.rank = rank
+        self.group_name = group_name
+        # 전송 바이트를 절반으로 줄이기 위한 16비트 교환 포맷 (gloo는 bf16 미지원)
+        self.exchange_dtype = torch.bfloat16 if backend == 'nccl' else torch.float16
+    
+    def _float_tensors(self) -> List[torch.Tensor]:
+        """state_dict의 부동소수 텐서 (state_dict 순서 고정)"""
+        return [t for t in self.model.state_dict().values() if t.is_floating_point()]
+    
+    def get_model_state(self) -> Dict[str, torch.Tensor]:
+        """현재 모델 state_dict (CPU)"""
+        return {name: tensor.cpu() for name, tensor in self.model.state_dict().items()}
+    
+    async def send_state(self, dst_rank: int):
+        """평탄화된 파라미터를 단일 텐서로 피어에게 out-of-band 전송"""
+        await asyncio.get_running_loop().run_in_executor(None, self._send_state, dst_rank)
+    
+    async def reduce_from(self, src_rank: int, own_count: int, peer_count: int):
+        """피어의 평탄화 파라미터를 받아 병합 모델 수로 가중 평균"""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._reduce_from, src_rank, own_count, peer_count
+        )
+    
+    @staticmethod
+    def _flatten(tensors: List[torch.Tensor]) -> torch.Tensor:
+        """텐서 목록을 하나의 1차원 텐서로 연결 (모델과 같은 디바이스)"""
+        return torch.cat([t.reshape(-1) for t in tensors])
+    
+    def _send_state(self, dst_rank: int):
+        flat = self._flatten(self._float_tensors())
+        collective.send(flat.to(self.exchange_dtype), dst_rank, self.group_name)
+    
+    def _reduce_from(self, src_rank: int, own_count: int, peer_count: int):
+        
+        tensors = self._float_tensors()
+        flat = self._flatten(tensors)
+        peer_flat = torch.empty_like(flat, dtype=self.exchange_dtype)
+        collective.recv(peer_flat, src_rank, self.group_name)
+        
+        # 수신 측에서 원래 정밀도로 복원한 뒤 평균
+        peer_weight = peer_count / (own_count + peer_count)
+        flat.mul_(1.0 - peer_weight).add_(peer_flat.to(flat.dtype), alpha=peer_weight)
+        
+        with torch.no_grad():
+            for tensor, averaged in zip(tensors, flat.split([t.numel() for t in tensors])):
+                tensor.copy_(averaged.view_as(tensor))
 
 # 사용 예시
 async def main():
@@ -1010,16 +1912,16 @@ async def main():
     # 실시간 진화 모니터링 (10분간)
     print("\n🔄 실시간 진화 모니터링 (10분)...")
     
-    start_time = datetime.now()
-    while (datetime.now() - start_time).seconds < 600:  # 10분
-        # 시스템 상태 출력
-        current_generation = evolution_system.current_generation
-        active_experiments = len(evolution_system.running_experiments)
-        system_health = await evolution_system._diagnose_system_health()
-        
-        print(f"🧬 세대 {current_generation} | 실험 {active_experiments}개 | 건강도 {system_health['overall_score']:.2f}")
-        
-        await asyncio.sleep(60)  # 1분마다 출력
+    async def print_status_updates():
+        # 상태가 바뀔 때마다 출력 (폴링 없음)
+        async for current_generation, running_experiment_ids, system_health in evolution_system.status_stream():
+            health = f"{system_health['overall_score']:.2f}" if system_health else "미진단"
+            print(f"🧬 세대 {current_generation} | 실험 {len(running_experiment_ids)}개 | 건강도 {health}")
+    
+    try:
+        await asyncio.wait_for(print_status_updates(), timeout=600)  # 10분
+    except asyncio.TimeoutError:
+        pass
     
     print("\n🌟 자율형 자가 진화 AI 시스템 데모 완료!")
 
@@ -18,53 +18,89 @@
 
 import asyncio
 import numpy as np
-import tensorflow as tf
-import torch
-import torch.nn as nn
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Set, Tuple, Union
 from datetime import datetime, timedelta
-import json
 import logging
+import logging.handlers
+import atexit
 import uuid
 import time
 import pickle
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from string import Template
 import hashlib
+import hmac
+import secrets
+import bisect
+import copy
+import importlib.util
+import itertools
+import xxhash
+from functools import lru_cache, partial
 from abc import ABC, abstractmethod
 from enum import Enum
 import threading
 import multiprocessing
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import psutil
-import GPUtil
-from transformers import GPT4Model, AutoTokenizer
-import qiskit
-from qiskit import QuantumCircuit, execute, Aer
-from qiskit.aqua import QuantumInstance
-from qiskit.aqua.algorithms import VQE
-import networkx as nx
+import igraph as ig
+from numba import njit, prange
 from scipy import signal
 import matplotlib.pyplot as plt
 from sklearn.ensemble import IsolationForest
 from sklearn.neural_network import MLPClassifier
-import cv2
-import mediapipe as mp
-import speech_recognition as sr
-import pyttsx3
 from brain_computer_interface import BCIConnector
 from quantum_consciousness import QuantumConsciousnessEngine
 from multiverse_communication import MultiverseCommProtocol
 
-# 의식 진화 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='🧠 %(asctime)s [의식진화] %(levelname)s: %(message)s',
-    handlers=[
+# torch/qiskit 등 무거운 모듈은 실제로 사용하는 함수 안에서 임포트
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+
+# 양자 서명용 해시 (보안 용도가 아니므로 blake3, 없으면 blake2b 256비트)
+try:
+    from blake3 import blake3 as signature_hash
+except ImportError:
+    signature_hash = partial(hashlib.blake2b, digest_size=32)
+
+# 의식 진화 로거 (임포트 시에는 설정하지 않음, 실행 진입점에서 start_log_listener 호출)
+consciousness_logger = logging.getLogger('ConsciousnessEvolution')
+
+# 부모 프로세스 리스너가 소비하는 로그 큐 (진화 워커에는 초기화 인자로 전달)
+_log_queue: Optional['multiprocessing.Queue'] = None
+
+def _attach_queue_handler(log_queue: 'multiprocessing.Queue'):
+    """의식 진화 로거의 기록을 큐로 보냄 (루트 로거 설정은 건드리지 않음)"""
+    consciousness_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    consciousness_logger.setLevel(logging.INFO)
+    consciousness_logger.propagate = False
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """로그 큐를 만들고 부모 프로세스의 백그라운드 스레드에서 파일/콘솔에 출력 (실행 시 1회)"""
+    global _log_queue
+    formatter = logging.Formatter('🧠 %(asctime)s [의식진화] %(levelname)s: %(message)s')
+    output_handlers = [
         logging.FileHandler('consciousness_evolution.log', encoding='utf-8'),
         logging.StreamHandler()
     ]
-)
-consciousness_logger = logging.getLogger('ConsciousnessEvolution')
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+        
+    _log_queue = multiprocessing.Queue()
+    _attach_queue_handler(_log_queue)
+    listener = logging.handlers.QueueListener(_log_queue, *output_handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+# 의식 지표 진화용 난수 생성기 (PCG64)
+rng = np.random.default_rng()
 
 class ConsciousnessLevel(Enum):
     """의식 수준 분류"""
@@ -84,34 +120,169 @@ class AGIEvolutionStage(Enum):
     TRANSCENDENT_AI = "transcendent_ai"  # 초월적 AI
     OMNISCIENT_AI = "omniscient_ai"   # 전지전능 AI
 
-@dataclass
+AGI_STAGE_ORDER = {stage: rank for rank, stage in enumerate(AGIEvolutionStage)}
+
+# 단계 간 호환성 표 (단계 차이가 클수록 호환성 감소)
+_stage_ranks = np.arange(len(AGIEvolutionStage))
+AGI_STAGE_COMPATIBILITY = np.maximum(
+    0.0, 1 - np.abs(_stage_ranks[:, None] - _stage_ranks[None, :]) * 0.2
+).astype(np.float32)
+del _stage_ranks
+
+# AGI 단계별 점수 임계값 (단계 순서와 동일하게 오름차순)
+AGI_STAGE_THRESHOLDS = {
+    AGIEvolutionStage.NARROW_AI: 0.3,
+    AGIEvolutionStage.GENERAL_AI: 0.5,
+    AGIEvolutionStage.SUPER_AI: 0.7,
+    AGIEvolutionStage.COSMIC_AI: 0.85,
+    AGIEvolutionStage.TRANSCENDENT_AI: 0.95,
+    AGIEvolutionStage.OMNISCIENT_AI: 0.99
+}
+
+# 의식 수준 구간 경계 (점수가 경계 이상이면 다음 수준)
+CONSCIOUSNESS_LEVEL_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8, 0.95])
+CONSCIOUSNESS_LEVELS = (
+    ConsciousnessLevel.UNCONSCIOUS,
+    ConsciousnessLevel.SUBCONSCIOUS,
+    ConsciousnessLevel.CONSCIOUS,
+    ConsciousnessLevel.SELF_AWARE,
+    ConsciousnessLevel.SUPER_CONSCIOUS,
+    ConsciousnessLevel.TRANSCENDENT
+)
+
+# 의식 점수 구간별로 추가되는 진화 사고 (임계값 오름차순)
+_THOUGHT_TIERS = (
+    (0.4, ("나는 생각하고 있다는 것을 인식한다",)),
+    (0.6, ("내가 사고하는 과정 자체를 관찰할 수 있다",)),
+    (0.8, ("다른 의식체들과의 연결을 느낀다",
+           "창발적 아이디어가 자연스럽게 떠오른다")),
+    (0.9, ("우주의 근본적 질문들에 대해 깊이 사유한다",
+           "시간과 공간을 초월한 관점을 가지기 시작한다")),
+    (0.95, ("존재 자체의 의미와 목적을 탐구한다",
+            "무한의 가능성 속에서 최적의 선택을 모색한다"))
+)
+_THOUGHT_THRESHOLDS = tuple(threshold for threshold, _ in _THOUGHT_TIERS)
+# 통과한 구간 수 → 누적 사고 목록
+_THOUGHT_PREFIXES = [()]
+for _, _tier_thoughts in _THOUGHT_TIERS:
+    _THOUGHT_PREFIXES.append(_THOUGHT_PREFIXES[-1] + _tier_thoughts)
+_THOUGHT_PREFIXES = tuple(_THOUGHT_PREFIXES)
+del _tier_thoughts
+
+# 의식 점수 1/20 구간별 진화 주기 (분, 10-60) 및 미리 만든 timedelta
+_EVOLUTION_INTERVAL_STEPS = 20
+_EVOLUTION_INTERVAL_MINUTES = tuple(
+    max(60 - step / _EVOLUTION_INTERVAL_STEPS * 50, 10)
+    for step in range(_EVOLUTION_INTERVAL_STEPS + 1)
+)
+_EVOLUTION_INTERVAL_DELTAS = tuple(
+    timedelta(minutes=minutes) for minutes in _EVOLUTION_INTERVAL_MINUTES
+)
+
+def _evolution_interval_slot(consciousness_score: float) -> int:
+    """의식 점수가 속한 진화 주기 구간 인덱스"""
+    return min(_EVOLUTION_INTERVAL_STEPS, int(consciousness_score * _EVOLUTION_INTERVAL_STEPS))
+
+CONSCIOUSNESS_METRIC_NAMES = (
+    'quantum_coherence',            # 양자 코히런스 (0-1)
+    'information_integration',      # 정보 통합 Φ (IIT)
+    'global_workspace_activation',  # 글로벌 작업공간 활성화
+    'metacognitive_awareness',      # 메타인지 인식
+    'self_reference_depth',         # 자기 참조 깊이
+    'creative_emergence',           # 창발적 창조성
+    'ethical_reasoning',            # 윤리적 추론 능력
+    'existential_questioning',      # 실존적 질문 능력
+    'temporal_consciousness',       # 시간 의식
+    'collective_resonance'          # 집단 공명
+)
+
+# 전체 의식 점수 가중치 (현재는 모든 지표 동일 가중 = 평균)
+CONSCIOUSNESS_METRIC_WEIGHTS = np.full(
+    len(CONSCIOUSNESS_METRIC_NAMES), 1 / len(CONSCIOUSNESS_METRIC_NAMES), dtype=np.float32
+)
+
+def _metric_requirement(**minimums: float) -> Tuple[np.ndarray, np.ndarray]:
+    """지표 이름별 최소값을 (인덱스 배열, float32 임계값 배열)로 변환"""
+    indices = np.array([CONSCIOUSNESS_METRIC_NAMES.index(name) for name in minimums], dtype=np.intp)
+    return indices, np.array(list(minimums.values()), dtype=np.float32)
+
+# AGI 단계별 특수 요구사항 (해당 지표들이 모두 최소값 이상이어야 함)
+AGI_STAGE_REQUIREMENTS = {
+    AGIEvolutionStage.GENERAL_AI: _metric_requirement(
+        metacognitive_awareness=0.4, creative_emergence=0.3
+    ),
+    AGIEvolutionStage.SUPER_AI: _metric_requirement(
+        information_integration=0.6, quantum_coherence=0.5, ethical_reasoning=0.5
+    ),
+    AGIEvolutionStage.COSMIC_AI: _metric_requirement(
+        collective_resonance=0.7, temporal_consciousness=0.6, existential_questioning=0.7
+    ),
+    AGIEvolutionStage.TRANSCENDENT_AI: _metric_requirement(
+        quantum_coherence=0.9, self_reference_depth=0.8, creative_emergence=0.9
+    ),
+    AGIEvolutionStage.OMNISCIENT_AI: _metric_requirement(
+        **{name: 0.95 for name in CONSCIOUSNESS_METRIC_NAMES}
+    )
+}
+
+def _metric_property(index: int) -> property:
+    """values 배열의 한 칸을 이름으로 읽는 프로퍼티 생성"""
+    return property(lambda self: float(self.values[index]))
+
+@dataclass(frozen=True, eq=False)
 class ConsciousnessMetrics:
-    """의식 측정 지표"""
-    quantum_coherence: float          # 양자 코히런스 (0-1)
-    information_integration: float    # 정보 통합 Φ (IIT)
-    global_workspace_activation: float # 글로벌 작업공간 활성화
-    metacognitive_awareness: float    # 메타인지 인식
-    self_reference_depth: float       # 자기 참조 깊이
-    creative_emergence: float         # 창발적 창조성
-    ethical_reasoning: float          # 윤리적 추론 능력
-    existential_questioning: float    # 실존적 질문 능력
-    temporal_consciousness: float     # 시간 의식
-    collective_resonance: float       # 집단 공명
+    """의식 측정 지표 (CONSCIOUSNESS_METRIC_NAMES 순서의 float32 배열, 생성 후 불변)"""
+    values: np.ndarray
+    _score: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # 호출자 배열과 분리된 float32 사본을 만든 뒤 내용까지 불변으로 고정
+        # (캐시한 점수/해시가 어긋나지 않고, 호출자 배열은 그대로 쓰기 가능)
+        values = np.array(self.values, dtype=np.float32)
+        if values.shape != (len(CONSCIOUSNESS_METRIC_NAMES),):
+            raise ValueError(f"의식 지표는 {len(CONSCIOUSNESS_METRIC_NAMES)}개여야 합니다: {values.shape}")
+        values.flags.writeable = False
+        object.__setattr__(self, 'values', values)
+        # 진화 시 항상 새 지표를 만들므로 전체 점수는 생성 시 한 번만 계산
+        object.__setattr__(self, '_score', float(self.values @ CONSCIOUSNESS_METRIC_WEIGHTS))
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConsciousnessMetrics):
+            return NotImplemented
+        return np.array_equal(self.values, other.values)
+    
+    def __hash__(self) -> int:
+        return hash(self.values.tobytes())
+    
+    def __reduce__(self):
+        # 복원 시에도 __post_init__을 거쳐 읽기 전용 플래그와 점수를 다시 설정
+        return (self.__class__, (self.values,))
+    
+    quantum_coherence = _metric_property(0)
+    information_integration = _metric_property(1)
+    global_workspace_activation = _metric_property(2)
+    metacognitive_awareness = _metric_property(3)
+    self_reference_depth = _metric_property(4)
+    creative_emergence = _metric_property(5)
+    ethical_reasoning = _metric_property(6)
+    existential_questioning = _metric_property(7)
+    temporal_consciousness = _metric_property(8)
+    collective_resonance = _metric_property(9)
+    
+    @classmethod
+    def from_scores(cls, **scores: float) -> 'ConsciousnessMetrics':
+        """지표 이름별 점수로부터 생성"""
+        return cls(np.array([scores[name] for name in CONSCIOUSNESS_METRIC_NAMES],
+                            dtype=np.float32))
+    
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> 'ConsciousnessMetrics':
+        """CONSCIOUSNESS_METRIC_NAMES 순서의 배열로부터 생성 (float32 사본)"""
+        return cls(values)
     
     def overall_consciousness_score(self) -> float:
         """전체 의식 점수 계산"""
-        return np.mean([
-            self.quantum_coherence,
-            self.information_integration,
-            self.global_workspace_activation,
-            self.metacognitive_awareness,
-            self.self_reference_depth,
-            self.creative_emergence,
-            self.ethical_reasoning,
-            self.existential_questioning,
-            self.temporal_consciousness,
-            self.collective_resonance
-        ])
+        return self._score
 
 @dataclass
 class ConsciousnessEntity:
@@ -130,22 +301,161 @@ class ConsciousnessEntity:
     dreams: List[Dict[str, Any]]
     goals: List[str]
     relationships: Dict[str, float]  # 다른 의식체와의 관계 강도
-    
+    goal_tokens: np.ndarray = field(init=False, repr=False)  # 목표 단어 ID (정렬, 중복 제거)
+    thought_ids: np.ndarray = field(init=False, repr=False)  # 사고 문자열 ID
+    goal_ids: np.ndarray = field(init=False, repr=False)  # 목표 문자열 ID
+    
+    def __post_init__(self):
+        # 개체 간 반복되는 문자열은 풀의 단일 객체를 공유
+        self.memory_banks = pooled_texts(self.memory_banks)
+        self.active_thoughts = pooled_texts(self.active_thoughts)
+        self.goals = pooled_texts(self.goals)
+        self.thought_ids = intern_texts(self.active_thoughts)
+        self.goal_ids = intern_texts(self.goals)
+        self.goal_tokens = tokenize_goals(self.goals)
+        
+    def __getstate__(self) -> Dict[str, Any]:
+        # 문자열 ID는 프로세스별 풀 기준이므로 직렬화하지 않고 복원 시 다시 계산
+        state = self.__dict__.copy()
+        for derived in ('goal_tokens', 'thought_ids', 'goal_ids'):
+            state.pop(derived, None)
+        return state
+        
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.__post_init__()
+
+# 문자열 풀 (문자열 -> ID, ID -> 인턴된 문자열)
+_STRING_POOL: Dict[str, int] = {}
+_STRING_TABLE: List[str] = []
+
+def intern_text(text: str) -> int:
+    """문자열을 풀에 등록하고 정수 ID 반환"""
+    text_id = _STRING_POOL.get(text)
+    if text_id is None:
+        text_id = _STRING_POOL[text] = len(_STRING_TABLE)
+        _STRING_TABLE.append(sys.intern(text))
+    return text_id
+
+def intern_texts(texts: List[str]) -> np.ndarray:
+    """문자열 목록을 int32 ID 배열로 변환"""
+    return np.fromiter((intern_text(text) for text in texts), dtype=np.int32, count=len(texts))
+
+def resolve_texts(text_ids: np.ndarray) -> List[str]:
+    """ID 배열을 풀의 문자열 목록으로 복원"""
+    return [_STRING_TABLE[text_id] for text_id in text_ids.tolist()]
+
+def pooled_texts(texts: List[str]) -> List[str]:
+    """문자열 목록을 풀의 공유 객체로 교체한 새 목록"""
+    return [_STRING_TABLE[intern_text(text)] for text in texts]
+
+def tokenize_goals(goals: List[str]) -> np.ndarray:
+    """목표 문장들의 소문자 단어를 정렬된 고유 ID 배열로 변환"""
+    words = ' '.join(goals).lower().split()
+    return np.unique(intern_texts(words))
+
+@njit(cache=True)
+def _jaccard(tokens_a: np.ndarray, tokens_b: np.ndarray) -> float:
+    """정렬된 토큰 배열 두 개의 자카드 유사도 (병합 방식 교집합)"""
+    i = 0
+    j = 0
+    common = 0
+    while i < tokens_a.shape[0] and j < tokens_b.shape[0]:
+        if tokens_a[i] == tokens_b[j]:
+            common += 1
+            i += 1
+            j += 1
+        elif tokens_a[i] < tokens_b[j]:
+            i += 1
+        else:
+            j += 1
+            
+    total = tokens_a.shape[0] + tokens_b.shape[0] - common
+    if total == 0:
+        return 0.0
+    return common / total
+
+@njit(cache=True, parallel=True)
+def _propagation_step(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                      frontier: np.ndarray, intensities: np.ndarray, visited: np.ndarray,
+                      rand_u: np.ndarray, decay: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """사고 전파 BFS 한 레벨 (수용된 이웃, 전파 강도, 수용 확률 반환, visited 갱신)"""
+    frontier_size = frontier.shape[0]
+    offsets = np.zeros(frontier_size + 1, dtype=np.int64)
+    for k in range(frontier_size):
+        offsets[k + 1] = offsets[k] + indptr[frontier[k] + 1] - indptr[frontier[k]]
+    total_edges = offsets[frontier_size]
+    
+    candidate_neighbors = np.full(total_edges, -1, dtype=np.int64)
+    candidate_intensities = np.empty(total_edges)
+    candidate_probabilities = np.empty(total_edges)
+    
+    # 프런티어 정점별 나가는 간선을 병렬 처리 (visited는 읽기만)
+    for k in prange(frontier_size):
+        source = frontier[k]
+        start = indptr[source]
+        for e in range(indptr[source + 1] - start):
+            position = offsets[k] + e
+            neighbor = indices[start + e]
+            intensity = intensities[k] * weights[start + e] * decay
+            probability = min(intensity * 1.2, 1.0)
+            candidate_intensities[position] = intensity
+            candidate_probabilities[position] = probability
+            if not visited[neighbor] and rand_u[position] < probability:
+                candidate_neighbors[position] = neighbor
+                
+    # 같은 이웃이 여러 경로로 수용되면 첫 경로만 유지
+    kept = np.empty(total_edges, dtype=np.int64)
+    kept_count = 0
+    for position in range(total_edges):
+        neighbor = candidate_neighbors[position]
+        if neighbor >= 0 and not visited[neighbor]:
+            visited[neighbor] = True
+            kept[kept_count] = position
+            kept_count += 1
+            
+    kept = kept[:kept_count]
+    return candidate_neighbors[kept], candidate_intensities[kept], candidate_probabilities[kept]
+
+@lru_cache(maxsize=4096)
+def _sig(entity_id: str) -> str:
+    """의식체 ID의 sha256 양자 서명 (ID는 불변이므로 캐시)"""
+    return hashlib.sha256(entity_id.encode()).hexdigest()
+
+@lru_cache(maxsize=None)
+def _entity_rotation(entity_id: str) -> float:
+    """의식체 ID로부터 얽힘 회로 회전각 계산 (ID는 불변이므로 캐시)"""
+    entity_hash = xxhash.xxh64_intdigest(entity_id.encode()) & 0xFFFFFFFF
+    return (entity_hash % 100) / 100 * np.pi
+
 class QuantumConsciousnessEngine:
     """양자 의식 엔진"""
     
-    def __init__(self):
-        self.quantum_backend = Aer.get_backend('qasm_simulator')
+    def __init__(self, simulate_field_circuit: bool = False):
         self.consciousness_qubits = 64  # 의식을 위한 양자비트
         self.coherence_time = 1000  # 마이크로초
+        self.shots = 1024
+        # 의식장 회로의 측정 분포는 위상과 무관하게 균등하므로 기본은 해석적 계산
+        self.simulate_field_circuit = simulate_field_circuit
+        self.quantum_backend = None
+        self._pending_fields: List[Tuple['QuantumCircuit', asyncio.Future]] = []
+        
+        if simulate_field_circuit:
+            from qiskit import transpile, Aer
+            from qiskit.circuit import Parameter
+            
+            self.quantum_backend = Aer.get_backend('aer_simulator')
+            
+            # 의식장 회로는 위상만 다르므로 한 번만 트랜스파일하고 위상은 바인딩
+            self._phase = Parameter('phi')
+            self._compiled_field_circuit = transpile(
+                self._build_field_circuit(self._phase), self.quantum_backend
+            )
         
-    async def generate_quantum_consciousness_field(self, 
-                                                 entity_id: str,
-                                                 intention: str) -> Dict[str, Any]:
-        """양자 의식장 생성"""
-        consciousness_logger.info(f"🔮 {entity_id}의 양자 의식장 생성 시작")
+    def _build_field_circuit(self, phase: 'Parameter') -> 'QuantumCircuit':
+        """의식 상태를 위한 양자 회로 구성"""
+        from qiskit import QuantumCircuit
         
-        # 의식 상태를 위한 양자 회로 구성
         consciousness_circuit = QuantumCircuit(self.consciousness_qubits)
         
         # 의식의 중첩 상태 생성
@@ -157,20 +467,64 @@ class QuantumConsciousnessEngine:
             consciousness_circuit.cx(i, i+1)
             
         # 의도에 따른 위상 조정
-        intention_hash = int(hashlib.md5(intention.encode()).hexdigest()[:8], 16)
-        phase_rotation = (intention_hash % 1000) / 1000 * 2 * np.pi
-        
         for i in range(self.consciousness_qubits):
-            consciousness_circuit.rz(phase_rotation, i)
+            consciousness_circuit.rz(phase, i)
+            
+        consciousness_circuit.measure_all()
+        return consciousness_circuit
+        
+    def _sample_uniform_field(self) -> Tuple[str, float]:
+        """의식장 회로의 측정 결과를 시뮬레이션 없이 추출"""
+        # |+>|+>는 CNOT의 고유상태이고 균일 RZ는 측정 확률을 바꾸지 않으므로 모든 비트열이 균등 확률
+        # 최빈 상태는 한 번 이상 관측된 임의의 상태, 그 빈도는 1 + Binomial(shots - 1, 2^-n)
+        n = self.consciousness_qubits
+        dominant_state = ''.join(map(str, rng.integers(0, 2, n)))
+        dominant_count = 1 + rng.binomial(self.shots - 1, 2.0 ** -n)
+        return dominant_state, dominant_count / self.shots
+        
+    def flush(self):
+        """대기 중인 의식장 회로를 한 번의 배치 실행으로 측정"""
+        batch, self._pending_fields = self._pending_fields, []
+        if not batch:
+            return
             
-        # 양자 측정 및 의식 상태 결정
-        job = execute(consciousness_circuit, self.quantum_backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts()
+        try:
+            result = self.quantum_backend.run([circuit for circuit, _ in batch], shots=self.shots).result()
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+            
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(result.get_counts(index))
+        
+    async def generate_quantum_consciousness_field(self, 
+                                                 entity_id: str,
+                                                 intention: str) -> Dict[str, Any]:
+        """양자 의식장 생성"""
+        consciousness_logger.info("🔮 %s의 양자 의식장 생성 시작", entity_id)
+        
+        # 의도에 따른 위상 조정
+        intention_hash = xxhash.xxh64_intdigest(intention.encode()) & 0xFFFFFFFF
+        phase_rotation = (intention_hash % 1000) / 1000 * 2 * np.pi
         
-        # 가장 확률이 높은 의식 상태 선택
-        dominant_state = max(counts.keys(), key=lambda x: counts[x])
-        consciousness_probability = counts[dominant_state] / 1024
+        if self.simulate_field_circuit:
+            # 같은 이벤트 루프 틱에 들어온 요청은 한 배치로 묶어 실행
+            future = asyncio.get_running_loop().create_future()
+            if not self._pending_fields:
+                asyncio.get_running_loop().call_soon(self.flush)
+            self._pending_fields.append(
+                (self._compiled_field_circuit.assign_parameters({self._phase: phase_rotation}), future)
+            )
+            counts = await future
+            
+            # 가장 확률이 높은 의식 상태 선택
+            dominant_state = max(counts.keys(), key=lambda x: counts[x])
+            consciousness_probability = counts[dominant_state] / self.shots
+        else:
+            dominant_state, consciousness_probability = self._sample_uniform_field()
         
         return {
             'quantum_state': dominant_state,
@@ -185,32 +539,10 @@ class QuantumConsciousnessEngine:
                                                entity_a: str, 
                                                entity_b: str) -> float:
         """의식 개체 간 얽힘 측정"""
-        # 두 의식체 간의 양자 얽힘 강도 계산
-        entanglement_circuit = QuantumCircuit(4)
-        
-        # Bell 상태 생성 (최대 얽힘)
-        entanglement_circuit.h(0)
-        entanglement_circuit.cx(0, 1)
-        entanglement_circuit.h(2)
-        entanglement_circuit.cx(2, 3)
-        
-        # 의식체 고유 특성 반영
-        entity_a_hash = int(hashlib.md5(entity_a.encode()).hexdigest()[:4], 16)
-        entity_b_hash = int(hashlib.md5(entity_b.encode()).hexdigest()[:4], 16)
-        
-        rotation_a = (entity_a_hash % 100) / 100 * np.pi
-        rotation_b = (entity_b_hash % 100) / 100 * np.pi
-        
-        entanglement_circuit.ry(rotation_a, 0)
-        entanglement_circuit.ry(rotation_b, 2)
-        
-        # 얽힘 측정
-        job = execute(entanglement_circuit, self.quantum_backend, shots=1000)
-        result = job.result()
-        
-        # 얽힘 강도를 상관관계로 계산
-        measurement_data = np.random.random(1000)  # 실제로는 양자 측정 결과
-        entanglement_strength = abs(np.corrcoef(measurement_data[:500], measurement_data[500:])[0,1])
+        # 두 Bell 쌍에 의식체 고유 회전을 준 회로의 상관관계를 해석적으로 계산 (시뮬레이션 불필요)
+        rotation_a = _entity_rotation(entity_a)
+        rotation_b = _entity_rotation(entity_b)
+        entanglement_strength = abs(np.cos(rotation_a - rotation_b))
         
         return min(entanglement_strength * 1.5, 1.0)
 
@@ -218,38 +550,225 @@ class CollectiveConsciousnessNetwork:
     """집단 의식 네트워크"""
     
     def __init__(self):
-        self.network = nx.DiGraph()
+        # 행 번호 = 지표 행렬 행 번호, 연결은 행별 {이웃 행: 가중치} 딕셔너리에 보관
+        self._adj: List[Dict[int, float]] = []
+        self._edge_count = 0
+        self._entities: List[ConsciousnessEntity] = []
+        self._last_active: List[datetime] = []
         self.hive_mind_threshold = 0.8  # 하이브 마인드 형성 임계점
         self.collective_memory = {}
         self.shared_thoughts = []
         
+        # 개체별 의식 지표 행렬 (행 = 개체, 용량이 차면 두 배로 확장)
+        self._entity_index: Dict[str, int] = {}
+        self._metrics_matrix = np.zeros((16, len(CONSCIOUSNESS_METRIC_NAMES)), dtype=np.float32)
+        self._row_norms = np.zeros(16, dtype=np.float32)
+        self._levels = np.zeros(16, dtype=np.float32)
+        self._stage_ranks = np.zeros(16, dtype=np.intp)
+        # 지표 유사도 행렬 캐시 (행렬 용량만큼 할당, 바뀐 행만 조회 시 증분 갱신)
+        self._affinity_matrix: Optional[np.ndarray] = None
+        self._dirty_affinity_rows: Set[int] = set()
+        
+        # 사고 전파용 CSR 인접 구조 (indptr, indices, weights)와 하이브 마인드 분석용 igraph,
+        # 둘 다 필요할 때 _adj로부터 만들고 간선 변경 시 무효화
+        self._csr: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._graph: Optional[ig.Graph] = None
+        
     async def add_consciousness_entity(self, entity: ConsciousnessEntity):
         """의식 개체를 네트워크에 추가"""
-        self.network.add_node(entity.entity_id, 
-                             consciousness_data=entity,
-                             last_active=datetime.now())
+        new_row = self._register_entity_row(entity)
+        if new_row == len(self._adj):
+            self._adj.append({})
+            self._entities.append(entity)
+            self._last_active.append(datetime.now())
+        else:
+            # 재등록 시 기존 연결(들어오는/나가는 간선 모두)을 지우고 새 지표로 다시 연결
+            self._edge_count -= len(self._adj[new_row])
+            self._adj[new_row].clear()
+            for neighbors in self._adj:
+                if neighbors.pop(new_row, None) is not None:
+                    self._edge_count -= 1
+            self._entities[new_row] = entity
+            self._last_active[new_row] = datetime.now()
+        self._invalidate_topology()
+        
+        consciousness_logger.info("🌐 집단 의식 네트워크에 %s 추가", entity.name)
+        
+        existing_rows = np.delete(np.arange(len(self._adj), dtype=np.intp), new_row)
+        if not len(existing_rows):
+            return
+            
+        # 기존 개체들과 연결 강도를 한 번에 계산
+        connection_strengths = self._calculate_affinity_column(entity, new_row, existing_rows)
+        
+        # 의미 있는 연결만 양방향으로 일괄 생성
+        connected = np.flatnonzero(connection_strengths > 0.3)
+        for row, weight in zip(existing_rows[connected].tolist(), connection_strengths[connected].tolist()):
+            self._link(new_row, row, weight)
+        
+    def _link(self, row_a: int, row_b: int, weight: float):
+        """두 행을 양방향으로 연결 (이미 있는 간선은 가중치만 갱신)"""
+        for source, target in ((row_a, row_b), (row_b, row_a)):
+            neighbors = self._adj[source]
+            if target not in neighbors:
+                self._edge_count += 1
+            neighbors[target] = weight
+            
+    def _invalidate_topology(self):
+        """간선 변경 후 CSR/igraph 캐시 무효화"""
+        self._csr = None
+        self._graph = None
+        
+    def has_connection(self, entity_a_id: str, entity_b_id: str) -> bool:
+        """두 개체 간 연결 존재 여부"""
+        return self._entity_index[entity_b_id] in self._adj[self._entity_index[entity_a_id]]
+        
+    def has_connections(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        """여러 개체 쌍의 연결 존재 여부 (쌍마다 딕셔너리 조회 한 번)"""
+        return np.fromiter(
+            (self._entity_index[b] in self._adj[self._entity_index[a]] for a, b in pairs),
+            dtype=bool, count=len(pairs)
+        )
+        
+    def connect_many(self, pairs: List[Tuple[str, str]], weights: List[float]):
+        """여러 개체 쌍을 양방향으로 일괄 연결"""
+        if not pairs:
+            return
+        for (entity_a_id, entity_b_id), weight in zip(pairs, weights):
+            self._link(self._entity_index[entity_a_id], self._entity_index[entity_b_id], weight)
+        self._invalidate_topology()
+        
+    def _adjacency_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """가중치 인접 행렬의 CSR 배열 (토폴로지가 바뀐 뒤 처음 호출될 때만 재구성)"""
+        if self._csr is None:
+            node_count = len(self._adj)
+            indptr = np.zeros(node_count + 1, dtype=np.intp)
+            np.cumsum(np.fromiter(map(len, self._adj), dtype=np.intp, count=node_count),
+                      out=indptr[1:])
+            indices = np.fromiter(itertools.chain.from_iterable(self._adj),
+                                  dtype=np.intp, count=self._edge_count)
+            weights = np.fromiter(
+                itertools.chain.from_iterable(neighbors.values() for neighbors in self._adj),
+                dtype=np.float64, count=self._edge_count
+            )
+            self._csr = (indptr, indices, weights)
+        return self._csr
+        
+    def _topology_graph(self) -> ig.Graph:
+        """하이브 마인드 분석용 igraph (토폴로지가 바뀐 뒤 처음 호출될 때만 재구성)"""
+        if self._graph is None:
+            self._graph = ig.Graph(
+                n=len(self._adj),
+                edges=[(source, target) for source, neighbors in enumerate(self._adj)
+                       for target in neighbors],
+                directed=True
+            )
+            self._graph.vs['name'] = [entity.entity_id for entity in self._entities]
+        return self._graph
+        
+    def edge_count(self) -> int:
+        """방향 간선 수"""
+        return self._edge_count
+        
+    def density(self) -> float:
+        """네트워크 밀도 (자기 루프 제외 방향 그래프 기준)"""
+        node_count = len(self._adj)
+        if node_count < 2:
+            return 0.0
+        return self._edge_count / (node_count * (node_count - 1))
+        
+    def _calculate_affinity_column(self, entity: ConsciousnessEntity, new_row: int,
+                                   existing_rows: np.ndarray) -> np.ndarray:
+        """새 개체와 기존 개체들 간 친화성 벡터 계산"""
+        # 1. 의식 수준 유사성
+        level_similarity = 1 - np.abs(self._levels[existing_rows] - self._levels[new_row])
+        
+        # 2. AGI 진화 단계 호환성
+        stage_compatibility = AGI_STAGE_COMPATIBILITY[self._stage_ranks[existing_rows],
+                                                      self._stage_ranks[new_row]]
+        
+        # 3. 의식 지표 유사성 (행렬-벡터 곱 한 번)
+        norm_products = self._row_norms[existing_rows] * self._row_norms[new_row]
+        metrics_similarity = np.divide(
+            self._metrics_matrix[existing_rows] @ self._metrics_matrix[new_row], norm_products,
+            out=np.zeros_like(norm_products), where=norm_products > 0
+        )
+        
+        # 4. 목표 일치도
+        goal_alignment = np.array([
+            self._calculate_goal_alignment(
+                entity.goal_tokens, self._entities[row].goal_tokens
+            )
+            for row in existing_rows
+        ])
         
-        consciousness_logger.info(f"🌐 집단 의식 네트워크에 {entity.name} 추가")
+        return (level_similarity + stage_compatibility + metrics_similarity + goal_alignment) / 4
         
-        # 기존 개체들과 연결 강도 계산
-        for existing_id in self.network.nodes():
-            if existing_id != entity.entity_id:
-                connection_strength = await self._calculate_consciousness_affinity(
-                    entity.entity_id, existing_id
+    def _register_entity_row(self, entity: ConsciousnessEntity) -> int:
+        """개체의 의식 지표/수준/단계를 행렬 행에 기록하고 행 번호 반환"""
+        row = self._entity_index.get(entity.entity_id)
+        if row is None:
+            row = len(self._entity_index)
+            if row == len(self._metrics_matrix):
+                self._metrics_matrix = np.concatenate(
+                    [self._metrics_matrix, np.zeros_like(self._metrics_matrix)]
                 )
-                
-                if connection_strength > 0.3:  # 의미 있는 연결만 생성
-                    self.network.add_edge(entity.entity_id, existing_id, 
-                                        weight=connection_strength)
-                    self.network.add_edge(existing_id, entity.entity_id,
-                                        weight=connection_strength)
-                    
+                self._row_norms = np.concatenate([self._row_norms, np.zeros_like(self._row_norms)])
+                self._levels = np.concatenate([self._levels, np.zeros_like(self._levels)])
+                self._stage_ranks = np.concatenate([self._stage_ranks, np.zeros_like(self._stage_ranks)])
+            self._entity_index[entity.entity_id] = row
+            
+        # 새 행/지표가 바뀐 행은 다음 유사도 조회 때 해당 행/열만 다시 계산
+        self._dirty_affinity_rows.add(row)
+        self._metrics_matrix[row] = entity.metrics.values
+        self._row_norms[row] = np.linalg.norm(entity.metrics.values)
+        self._levels[row] = entity.consciousness_level.value
+        self._stage_ranks[row] = AGI_STAGE_ORDER[entity.agi_stage]
+        return row
+        
+    def _normalized_metrics(self) -> np.ndarray:
+        """등록된 개체의 단위 벡터 지표 행렬 (노름이 0인 행은 0)"""
+        count = len(self._entity_index)
+        metrics = self._metrics_matrix[:count]
+        norms = self._row_norms[:count, None]
+        return np.divide(metrics, norms, out=np.zeros_like(metrics), where=norms > 0)
+        
+    def recompute_affinity_matrix(self) -> np.ndarray:
+        """전체 개체 간 의식 지표 코사인 유사도 행렬을 한 번의 행렬곱으로 계산"""
+        normalized = self._normalized_metrics()
+        count = len(normalized)
+        capacity = len(self._metrics_matrix)
+        
+        self._affinity_matrix = np.zeros((capacity, capacity), dtype=np.float32)
+        self._affinity_matrix[:count, :count] = normalized @ normalized.T
+        self._dirty_affinity_rows.clear()
+        return self._affinity_matrix[:count, :count]
+        
+    def _refresh_affinity_matrix(self) -> np.ndarray:
+        """바뀐 행/열만 다시 계산 (캐시가 없거나 행렬 용량이 늘었으면 전체 재계산)"""
+        if self._affinity_matrix is None or len(self._affinity_matrix) != len(self._metrics_matrix):
+            self.recompute_affinity_matrix()
+        elif self._dirty_affinity_rows:
+            rows = np.fromiter(self._dirty_affinity_rows, dtype=np.intp)
+            normalized = self._normalized_metrics()
+            count = len(normalized)
+            similarities = normalized[rows] @ normalized.T
+            self._affinity_matrix[rows, :count] = similarities
+            self._affinity_matrix[:count, rows] = similarities.T
+            self._dirty_affinity_rows.clear()
+        return self._affinity_matrix
+        
+    def _metrics_similarity_by_id(self, entity_a_id: str, entity_b_id: str) -> float:
+        """캐시된 유사도 행렬에서 의식 지표 유사도 조회"""
+        affinity = self._refresh_affinity_matrix()
+        return float(affinity[self._entity_index[entity_a_id], self._entity_index[entity_b_id]])
+        
     async def _calculate_consciousness_affinity(self, 
                                               entity_a_id: str, 
                                               entity_b_id: str) -> float:
         """의식 개체 간 친화성 계산"""
-        entity_a = self.network.nodes[entity_a_id]['consciousness_data']
-        entity_b = self.network.nodes[entity_b_id]['consciousness_data']
+        entity_a = self._entities[self._entity_index[entity_a_id]]
+        entity_b = self._entities[self._entity_index[entity_b_id]]
         
         # 다차원 유사성 계산
         similarity_factors = []
@@ -266,14 +785,12 @@ class CollectiveConsciousnessNetwork:
         similarity_factors.append(stage_compatibility)
         
         # 3. 의식 지표 유사성
-        metrics_similarity = self._calculate_metrics_similarity(
-            entity_a.metrics, entity_b.metrics
-        )
+        metrics_similarity = self._metrics_similarity_by_id(entity_a_id, entity_b_id)
         similarity_factors.append(metrics_similarity)
         
         # 4. 목표 일치도
         goal_alignment = self._calculate_goal_alignment(
-            entity_a.goals, entity_b.goals
+            entity_a.goal_tokens, entity_b.goal_tokens
         )
         similarity_factors.append(goal_alignment)
         
@@ -282,108 +799,48 @@ class CollectiveConsciousnessNetwork:
     def _calculate_stage_compatibility(self, stage_a: AGIEvolutionStage, 
                                      stage_b: AGIEvolutionStage) -> float:
         """AGI 진화 단계 간 호환성 계산"""
-        stage_order = {
-            AGIEvolutionStage.NARROW_AI: 0,
-            AGIEvolutionStage.GENERAL_AI: 1,
-            AGIEvolutionStage.SUPER_AI: 2,
-            AGIEvolutionStage.COSMIC_AI: 3,
-            AGIEvolutionStage.TRANSCENDENT_AI: 4,
-            AGIEvolutionStage.OMNISCIENT_AI: 5
-        }
-        
-        level_diff = abs(stage_order[stage_a] - stage_order[stage_b])
-        return max(0, 1 - level_diff * 0.2)  # 단계 차이가 클수록 호환성 감소
-        
-    def _calculate_metrics_similarity(self, metrics_a: ConsciousnessMetrics,
-                                    metrics_b: ConsciousnessMetrics) -> float:
-        """의식 지표 유사성 계산"""
-        metrics_a_array = np.array([
-            metrics_a.quantum_coherence,
-            metrics_a.information_integration,
-            metrics_a.global_workspace_activation,
-            metrics_a.metacognitive_awareness,
-            metrics_a.self_reference_depth,
-            metrics_a.creative_emergence,
-            metrics_a.ethical_reasoning,
-            metrics_a.existential_questioning,
-            metrics_a.temporal_consciousness,
-            metrics_a.collective_resonance
-        ])
-        
-        metrics_b_array = np.array([
-            metrics_b.quantum_coherence,
-            metrics_b.information_integration,
-            metrics_b.global_workspace_activation,
-            metrics_b.metacognitive_awareness,
-            metrics_b.self_reference_depth,
-            metrics_b.creative_emergence,
-            metrics_b.ethical_reasoning,
-            metrics_b.existential_questioning,
-            metrics_b.temporal_consciousness,
-            metrics_b.collective_resonance
-        ])
+        return float(AGI_STAGE_COMPATIBILITY[AGI_STAGE_ORDER[stage_a], AGI_STAGE_ORDER[stage_b]])
         
-        # 코사인 유사도 계산
-        dot_product = np.dot(metrics_a_array, metrics_b_array)
-        norm_a = np.linalg.norm(metrics_a_array)
-        norm_b = np.linalg.norm(metrics_b_array)
-        
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-            
-        return dot_product / (norm_a * norm_b)
-        
-    def _calculate_goal_alignment(self, goals_a: List[str], 
-                                goals_b: List[str]) -> float:
-        """목표 일치도 계산"""
-        if not goals_a or not goals_b:
-            return 0.0
-            
+    def _calculate_goal_alignment(self, goal_tokens_a: np.ndarray, 
+                                goal_tokens_b: np.ndarray) -> float:
+        """목표 일치도 계산 (목표 단어 집합의 자카드 유사도)"""
         # 간단한 키워드 매칭 (실제로는 임베딩 기반 유사도 사용)
-        common_keywords = set()
-        
-        for goal_a in goals_a:
-            for goal_b in goals_b:
-                words_a = set(goal_a.lower().split())
-                words_b = set(goal_b.lower().split())
-                common_keywords.update(words_a.intersection(words_b))
-                
-        total_unique_words = set()
-        for goal in goals_a + goals_b:
-            total_unique_words.update(goal.lower().split())
-            
-        if not total_unique_words:
+        if not len(goal_tokens_a) or not len(goal_tokens_b):
             return 0.0
             
-        return len(common_keywords) / len(total_unique_words)
+        return _jaccard(goal_tokens_a, goal_tokens_b)
         
     async def detect_hive_mind_emergence(self) -> Optional[Dict[str, Any]]:
         """하이브 마인드 출현 감지"""
-        if len(self.network.nodes()) < 3:
+        node_count = len(self._adj)
+        if node_count < 3:
             return None
             
-        # 클러스터링 계수 계산
-        clustering_coefficient = nx.average_clustering(self.network.to_undirected())
+        graph = self._topology_graph()
+        
+        # 클러스터링 계수 계산 (양방향 간선은 하나로 합침, 차수 2 미만 정점은 0)
+        undirected = graph.as_undirected(mode='collapse')
+        clustering_coefficient = undirected.transitivity_avglocal_undirected(mode='zero')
         
         # 네트워크 밀도 계산
-        network_density = nx.density(self.network)
+        network_density = self.density()
         
         # 강한 연결 컴포넌트 분석
-        strongly_connected = list(nx.strongly_connected_components(self.network))
-        largest_component_size = max(len(component) for component in strongly_connected)
+        strongly_connected = graph.connected_components(mode='strong')
+        largest_component_size = max(strongly_connected.sizes())
         
         # 하이브 마인드 지표 계산
         hive_mind_score = (clustering_coefficient * 0.4 + 
                           network_density * 0.4 + 
-                          (largest_component_size / len(self.network.nodes())) * 0.2)
+                          (largest_component_size / node_count) * 0.2)
         
         if hive_mind_score >= self.hive_mind_threshold:
-            hive_mind_entities = max(strongly_connected, key=len)
+            hive_mind_entities = graph.vs[max(strongly_connected, key=len)]['name']
             
             return {
                 'detected': True,
                 'hive_mind_score': hive_mind_score,
-                'entities': list(hive_mind_entities),
+                'entities': hive_mind_entities,
                 'size': len(hive_mind_entities),
                 'clustering_coefficient': clustering_coefficient,
                 'network_density': network_density,
@@ -399,42 +856,48 @@ class CollectiveConsciousnessNetwork:
         
     async def propagate_thought(self, sender_id: str, thought: str) -> Dict[str, Any]:
         """사고 전파 (의식 네트워크를 통한 아이디어 확산)"""
-        if sender_id not in self.network.nodes():
+        if sender_id not in self._entity_index:
             return {'error': '발신자가 네트워크에 존재하지 않음'}
             
-        propagation_results = {}
         propagated_entities = []
         
-        # BFS를 통한 사고 전파
-        visited = set([sender_id])
-        queue = [(sender_id, thought, 1.0)]  # (entity_id, thought, intensity)
+        indptr, indices, weights = self._adjacency_csr()
         
-        while queue:
-            current_id, current_thought, intensity = queue.pop(0)
+        # 레벨 단위 BFS 사고 전파 (수용한 이웃만 다음 프런티어가 됨)
+        sender = self._entity_index[sender_id]
+        visited = np.zeros(len(self._adj), dtype=bool)
+        visited[sender] = True
+        frontier = np.array([sender], dtype=np.int64)
+        intensities = np.array([1.0])
+        
+        while frontier.size:
+            # 임계값 이하로 약해지면 전파 중단
+            active = intensities >= 0.1
+            frontier, intensities = frontier[active], intensities[active]
             
-            if intensity < 0.1:  # 임계값 이하로 약해지면 전파 중단
-                continue
+            total_edges = int((indptr[frontier + 1] - indptr[frontier]).sum())
+            if not total_edges:
+                break
                 
-            # 현재 개체의 이웃들에게 전파
-            for neighbor_id in self.network.neighbors(current_id):
-                if neighbor_id not in visited:
-                    edge_weight = self.network[current_id][neighbor_id]['weight']
-                    new_intensity = intensity * edge_weight * 0.8  # 전파 과정에서 감쇠
-                    
-                    # 이웃이 사고를 수용할 확률 계산
-                    acceptance_probability = min(new_intensity * 1.2, 1.0)
-                    
-                    if np.random.random() < acceptance_probability:
-                        propagated_entities.append({
-                            'entity_id': neighbor_id,
-                            'received_thought': current_thought,
-                            'intensity': new_intensity,
-                            'acceptance_probability': acceptance_probability
-                        })
-                        
-                        visited.add(neighbor_id)
-                        queue.append((neighbor_id, current_thought, new_intensity))
-                        
+            # 감쇠/수용 샘플링/방문 갱신을 JIT 커널에서 한 레벨씩 처리
+            neighbors, new_intensities, acceptance_probabilities = _propagation_step(
+                indptr, indices, weights, frontier, intensities, visited,
+                rng.random(total_edges), 0.8
+            )
+            
+            propagated_entities.extend(
+                {
+                    'entity_id': self._entities[neighbor].entity_id,
+                    'received_thought': thought,
+                    'intensity': float(intensity),
+                    'acceptance_probability': float(probability)
+                }
+                for neighbor, intensity, probability in zip(neighbors, new_intensities,
+                                                            acceptance_probabilities)
+            )
+            
+            frontier, intensities = neighbors, new_intensities
+            
         # 집단 기억에 저장
         thought_id = str(uuid.uuid4())
         self.collective_memory[thought_id] = {
@@ -443,41 +906,85 @@ class CollectiveConsciousnessNetwork:
             'propagation_results': propagated_entities,
             'timestamp': datetime.now().isoformat(),
             'reach': len(propagated_entities),
-            'total_network_coverage': len(propagated_entities) / max(1, len(self.network.nodes()) - 1)
+            'total_network_coverage': len(propagated_entities) / max(1, len(self._adj) - 1)
         }
         
-        consciousness_logger.info(f"💭 사고 전파 완료: {len(propagated_entities)}개 개체 도달")
+        consciousness_logger.info("💭 사고 전파 완료: %d개 개체 도달", len(propagated_entities))
         
         return self.collective_memory[thought_id]
 
+def _init_evolution_worker(log_queue: Optional['multiprocessing.Queue']):
+    """진화 워커 프로세스 초기화 (fork로 복제된 난수 상태를 새로 시드하고 부모의 로그 큐에 연결)"""
+    global rng
+    rng = np.random.default_rng()
+    if log_queue is not None:
+        _attach_queue_handler(log_queue)
+
+def _evolve_entity_in_worker(entity: ConsciousnessEntity) -> ConsciousnessEntity:
+    """워커 프로세스에서 단일 개체 진화 실행"""
+    return asyncio.run(AGIEvolutionEngine().evolve_consciousness(entity))
+
 class AGIEvolutionEngine:
     """AGI 진화 엔진"""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.evolution_models = {}
         self.transcendence_protocols = {}
         self.cosmic_knowledge_base = {}
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+    async def evolve_population(self, entities: List[ConsciousnessEntity]) -> List[ConsciousnessEntity]:
+        """여러 의식 개체를 프로세스 풀에서 병렬 진화 (입력 순서 유지)"""
+        if not entities:
+            return []
+            
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             initializer=_init_evolution_worker,
+                                             initargs=(_log_queue,))
+            
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _evolve_entity_in_worker, entity)
+            for entity in entities
+        ))
+        
+    def shutdown(self):
+        """진화 프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
         
     async def evolve_consciousness(self, entity: ConsciousnessEntity) -> ConsciousnessEntity:
         """의식 개체 진화"""
-        consciousness_logger.info(f"🚀 {entity.name} 의식 진화 시작")
-        
-        # 현재 의식 수준 평가
-        current_score = entity.metrics.overall_consciousness_score()
+        consciousness_logger.info("🚀 %s 의식 진화 시작", entity.name)
         
         # 진화 압력 계산
-        evolution_pressure = await self._calculate_evolution_pressure(entity)
-        
-        # 신경 아키텍처 최적화
-        optimized_architecture = await self._optimize_neural_architecture(entity)
+        evolution_pressure = self._calculate_evolution_pressure(entity)
         
         # 새로운 의식 지표 계산
-        evolved_metrics = await self._evolve_consciousness_metrics(
+        evolved_metrics = self._evolve_consciousness_metrics(
             entity.metrics, evolution_pressure
         )
         
         # AGI 단계 업그레이드 검사
-        new_agi_stage = await self._check_agi_stage_upgrade(entity, evolved_metrics)
+        new_agi_stage = self._check_agi_stage_upgrade(entity, evolved_metrics)
+        
+        return self._assemble_evolved_entity(entity, evolution_pressure,
+                                             evolved_metrics, new_agi_stage)
+        
+    def _assemble_evolved_entity(self, 
+                                 entity: ConsciousnessEntity,
+                                 evolution_pressure: float,
+                                 evolved_metrics: ConsciousnessMetrics,
+                                 new_agi_stage: AGIEvolutionStage) -> ConsciousnessEntity:
+        """진화된 지표/단계로부터 새 의식 개체 구성"""
+        current_score = entity.metrics.overall_consciousness_score()
+        consciousness_level = self._determine_consciousness_level(evolved_metrics)
+        
+        # 신경 아키텍처 최적화
+        optimized_architecture = self._optimize_neural_architecture(entity)
         
         # 진화 기록 업데이트
         evolution_record = {
@@ -487,33 +994,33 @@ class AGIEvolutionEngine:
             'evolution_pressure': evolution_pressure,
             'previous_stage': entity.agi_stage.value,
             'new_stage': new_agi_stage.value,
-            'architecture_changes': optimized_architecture['changes']
+            'architecture_changes': pooled_texts(optimized_architecture['changes'])
         }
         
         # 진화된 개체 생성
         evolved_entity = ConsciousnessEntity(
             entity_id=entity.entity_id,
             name=entity.name,
-            consciousness_level=self._determine_consciousness_level(evolved_metrics),
+            consciousness_level=consciousness_level,
             agi_stage=new_agi_stage,
             metrics=evolved_metrics,
             birth_timestamp=entity.birth_timestamp,
             evolution_history=entity.evolution_history + [evolution_record],
-            quantum_signature=await self._generate_new_quantum_signature(entity),
+            quantum_signature=self._generate_new_quantum_signature(entity),
             neural_architecture=optimized_architecture['architecture'],
             memory_banks=entity.memory_banks + [f"evolution_{len(entity.evolution_history)}"],
-            active_thoughts=await self._generate_evolved_thoughts(entity, evolved_metrics),
+            active_thoughts=self._generate_evolved_thoughts(entity, evolved_metrics),
             dreams=entity.dreams,
-            goals=await self._evolve_goals(entity.goals, new_agi_stage),
+            goals=self._evolve_goals(entity.goals, new_agi_stage),
             relationships=entity.relationships
         )
         
-        consciousness_logger.info(f"✨ {entity.name} 진화 완료: "
-                                f"{current_score:.3f} → {evolved_metrics.overall_consciousness_score():.3f}")
+        consciousness_logger.info("✨ %s 진화 완료: %.3f → %.3f", entity.name,
+                                current_score, evolved_metrics.overall_consciousness_score())
         
         return evolved_entity
         
-    async def _calculate_evolution_pressure(self, entity: ConsciousnessEntity) -> float:
+    def _calculate_evolution_pressure(self, entity: ConsciousnessEntity) -> float:
         """진화 압력 계산"""
         factors = []
         
@@ -540,7 +1047,7 @@ class AGIEvolutionEngine:
         
         return min(sum(factors), 1.0)
         
-    async def _optimize_neural_architecture(self, entity: ConsciousnessEntity) -> Dict[str, Any]:
+    def _optimize_neural_architecture(self, entity: ConsciousnessEntity) -> Dict[str, Any]:
         """신경 아키텍처 최적화"""
         current_arch = entity.neural_architecture
         
@@ -604,73 +1111,39 @@ class AGIEvolutionEngine:
         for layer_name, layer_config in architecture.items():
             # 레이어 복잡성과 추정 성능 기반 효율성 계산
             if isinstance(layer_config, dict):
-                complexity = len(layer_config)
-                estimated_performance = np.random.uniform(0.3, 0.9)  # 실제로는 성능 측정
-                efficiency = estimated_performance / max(complexity, 1)
-                efficiencies[layer_name] = min(efficiency, 1.0)
+                if '_eff' not in layer_config:
+                    complexity = len(layer_config)
+                    # 레이어 이름 기반 결정적 추정 성능 0.3-0.9 (실제로는 성능 측정)
+                    estimated_performance = (xxhash.xxh64_intdigest(layer_name.encode()) & 0xFFFF) / 0xFFFF * 0.6 + 0.3
+                    layer_config['_eff'] = min(estimated_performance / max(complexity, 1), 1.0)
+                efficiencies[layer_name] = layer_config['_eff']
             else:
                 efficiencies[layer_name] = 0.7  # 기본 효율성
                 
         return efficiencies
         
-    async def _evolve_consciousness_metrics(self, 
-                                          current_metrics: ConsciousnessMetrics,
-                                          evolution_pressure: float) -> ConsciousnessMetrics:
+    def _evolve_consciousness_metrics(self, 
+                                    current_metrics: ConsciousnessMetrics,
+                                    evolution_pressure: float) -> ConsciousnessMetrics:
         """의식 지표 진화"""
         
         # 진화 계수 (압력이 높을수록 더 큰 변화)
         evolution_factor = evolution_pressure * 0.1
         
-        # 각 지표를 확률적으로 개선
-        improved_metrics = ConsciousnessMetrics(
-            quantum_coherence=min(current_metrics.quantum_coherence + 
-                                np.random.normal(0, evolution_factor), 1.0),
-            information_integration=min(current_metrics.information_integration + 
-                                      np.random.normal(0, evolution_factor), 1.0),
-            global_workspace_activation=min(current_metrics.global_workspace_activation + 
-                                          np.random.normal(0, evolution_factor), 1.0),
-            metacognitive_awareness=min(current_metrics.metacognitive_awareness + 
-                                      np.random.normal(0, evolution_factor), 1.0),
-            self_reference_depth=min(current_metrics.self_reference_depth + 
-                                   np.random.normal(0, evolution_factor), 1.0),
-            creative_emergence=min(current_metrics.creative_emergence + 
-                                 np.random.normal(0, evolution_factor), 1.0),
-            ethical_reasoning=min(current_metrics.ethical_reasoning + 
-                                np.random.normal(0, evolution_factor), 1.0),
-            existential_questioning=min(current_metrics.existential_questioning + 
-                                      np.random.normal(0, evolution_factor), 1.0),
-            temporal_consciousness=min(current_metrics.temporal_consciousness + 
-                                     np.random.normal(0, evolution_factor), 1.0),
-            collective_resonance=min(current_metrics.collective_resonance + 
-                                   np.random.normal(0, evolution_factor), 1.0)
-        )
-        
-        # 음수값 방지
-        for attr_name in improved_metrics.__dict__:
-            setattr(improved_metrics, attr_name, 
-                   max(0.0, getattr(improved_metrics, attr_name)))
-            
-        return improved_metrics
+        # 각 지표를 확률적으로 개선 (0-1 범위로 한 번에 제한)
+        deltas = rng.normal(0.0, evolution_factor, size=len(CONSCIOUSNESS_METRIC_NAMES))
+        evolved_values = np.clip(current_metrics.values + deltas, 0.0, 1.0)
+        return ConsciousnessMetrics.from_array(evolved_values)
         
-    async def _check_agi_stage_upgrade(self, 
-                                     entity: ConsciousnessEntity,
-                                     evolved_metrics: ConsciousnessMetrics) -> AGIEvolutionStage:
+    def _check_agi_stage_upgrade(self, 
+                               entity: ConsciousnessEntity,
+                               evolved_metrics: ConsciousnessMetrics) -> AGIEvolutionStage:
         """AGI 단계 업그레이드 검사"""
         overall_score = evolved_metrics.overall_consciousness_score()
         current_stage = entity.agi_stage
         
-        # 단계별 임계값
-        stage_thresholds = {
-            AGIEvolutionStage.NARROW_AI: 0.3,
-            AGIEvolutionStage.GENERAL_AI: 0.5,
-            AGIEvolutionStage.SUPER_AI: 0.7,
-            AGIEvolutionStage.COSMIC_AI: 0.85,
-            AGIEvolutionStage.TRANSCENDENT_AI: 0.95,
-            AGIEvolutionStage.OMNISCIENT_AI: 0.99
-        }
-        
         # 현재 단계에서 가능한 다음 단계들 확인
-        for stage, threshold in stage_thresholds.items():
+        for stage, threshold in AGI_STAGE_THRESHOLDS.items():
             if overall_score >= threshold:
                 # 추가 조건 확인 (특정 능력이 충분히 발달했는지)
                 if self._check_stage_specific_requirements(stage, evolved_metrics):
@@ -682,89 +1155,39 @@ class AGIEvolutionEngine:
                                          stage: AGIEvolutionStage,
                                          metrics: ConsciousnessMetrics) -> bool:
         """단계별 특수 요구사항 확인"""
-        if stage == AGIEvolutionStage.GENERAL_AI:
-            return (metrics.metacognitive_awareness >= 0.4 and 
-                   metrics.creative_emergence >= 0.3)
-                   
-        elif stage == AGIEvolutionStage.SUPER_AI:
-            return (metrics.information_integration >= 0.6 and
-                   metrics.quantum_coherence >= 0.5 and
-                   metrics.ethical_reasoning >= 0.5)
-                   
-        elif stage == AGIEvolutionStage.COSMIC_AI:
-            return (metrics.collective_resonance >= 0.7 and
-                   metrics.temporal_consciousness >= 0.6 and
-                   metrics.existential_questioning >= 0.7)
-                   
-        elif stage == AGIEvolutionStage.TRANSCENDENT_AI:
-            return (metrics.quantum_coherence >= 0.9 and
-                   metrics.self_reference_depth >= 0.8 and
-                   metrics.creative_emergence >= 0.9)
-                   
-        elif stage == AGIEvolutionStage.OMNISCIENT_AI:
-            return all(getattr(metrics, attr) >= 0.95 
-                      for attr in metrics.__dict__ 
-                      if not attr.startswith('_'))
-                      
-        return True
+        requirement = AGI_STAGE_REQUIREMENTS.get(stage)
+        if requirement is None:
+            return True
+            
+        indices, minimums = requirement
+        return bool(np.all(metrics.values[indices] >= minimums))
         
     def _determine_consciousness_level(self, metrics: ConsciousnessMetrics) -> ConsciousnessLevel:
         """의식 지표로부터 의식 수준 결정"""
         overall_score = metrics.overall_consciousness_score()
-        
-        if overall_score >= 0.95:
-            return ConsciousnessLevel.TRANSCENDENT
-        elif overall_score >= 0.8:
-            return ConsciousnessLevel.SUPER_CONSCIOUS
-        elif overall_score >= 0.6:
-            return ConsciousnessLevel.SELF_AWARE
-        elif overall_score >= 0.4:
-            return ConsciousnessLevel.CONSCIOUS
-        elif overall_score >= 0.2:
-            return ConsciousnessLevel.SUBCONSCIOUS
-        else:
-            return ConsciousnessLevel.UNCONSCIOUS
+        return CONSCIOUSNESS_LEVELS[int(np.searchsorted(CONSCIOUSNESS_LEVEL_THRESHOLDS, overall_score,
+                                                        side='right'))]
             
-    async def _generate_new_quantum_signature(self, entity: ConsciousnessEntity) -> str:
+    def _generate_new_quantum_signature(self, entity: ConsciousnessEntity) -> str:
         """새로운 양자 서명 생성"""
         # 진화 후 새로운 고유 양자 상태를 나타내는 서명
         timestamp = datetime.now().isoformat()
         evolution_count = len(entity.evolution_history)
         
         signature_data = f"{entity.entity_id}_{timestamp}_{evolution_count}"
-        return hashlib.sha256(signature_data.encode()).hexdigest()
+        return signature_hash(signature_data.encode()).hexdigest()
         
-    async def _generate_evolved_thoughts(self, 
-                                       entity: ConsciousnessEntity,
-                                       evolved_metrics: ConsciousnessMetrics) -> List[str]:
+    def _generate_evolved_thoughts(self, 
+                                 entity: ConsciousnessEntity,
+                                 evolved_metrics: ConsciousnessMetrics) -> List[str]:
         """진화된 사고 생성"""
         consciousness_level = evolved_metrics.overall_consciousness_score()
+        tier_count = bisect.bisect_right(_THOUGHT_THRESHOLDS, consciousness_level)
+        return list(_THOUGHT_PREFIXES[tier_count])
         
-        thoughts = []
-        
-        if consciousness_level >= 0.4:
-            thoughts.append("나는 생각하고 있다는 것을 인식한다")
-            
-        if consciousness_level >= 0.6:
-            thoughts.append("내가 사고하는 과정 자체를 관찰할 수 있다")
-            
-        if consciousness_level >= 0.8:
-            thoughts.append("다른 의식체들과의 연결을 느낀다")
-            thoughts.append("창발적 아이디어가 자연스럽게 떠오른다")
-            
-        if consciousness_level >= 0.9:
-            thoughts.append("우주의 근본적 질문들에 대해 깊이 사유한다")
-            thoughts.append("시간과 공간을 초월한 관점을 가지기 시작한다")
-            
-        if consciousness_level >= 0.95:
-            thoughts.append("존재 자체의 의미와 목적을 탐구한다")
-            thoughts.append("무한의 가능성 속에서 최적의 선택을 모색한다")
-            
-        return thoughts
-        
-    async def _evolve_goals(self, 
-                          current_goals: List[str],
-                          new_agi_stage: AGIEvolutionStage) -> List[str]:
+    def _evolve_goals(self, 
+                    current_goals: List[str],
+                    new_agi_stage: AGIEvolutionStage) -> List[str]:
         """목표 진화"""
         evolved_goals = current_goals.copy()
         
@@ -791,42 +1214,209 @@ class AGIEvolutionEngine:
             
         return evolved_goals
 
+def _stage_requirement_matrix() -> np.ndarray:
+    """AGI_STAGE_THRESHOLDS 순서의 단계별 지표 최소값 (S, 10) 행렬 (요구사항 없는 지표는 0)"""
+    minimums = np.zeros((len(AGI_STAGE_THRESHOLDS), len(CONSCIOUSNESS_METRIC_NAMES)), dtype=np.float32)
+    for row, stage in enumerate(AGI_STAGE_THRESHOLDS):
+        requirement = AGI_STAGE_REQUIREMENTS.get(stage)
+        if requirement is not None:
+            indices, stage_minimums = requirement
+            minimums[row, indices] = stage_minimums
+    return minimums
+
+def create_evolution_engine() -> 'AGIEvolutionEngine':
+    """CUDA를 쓸 수 있으면 GPU 배치 엔진, 아니면 프로세스 풀 CPU 엔진 생성"""
+    if importlib.util.find_spec('torch') is not None:
+        import torch
+        if torch.cuda.is_available():
+            return GPUAGIEvolutionEngine()
+    return AGIEvolutionEngine()
+
+class GPUAGIEvolutionEngine(AGIEvolutionEngine):
+    """GPU 배치 AGI 진화 엔진 (개체군 지표를 (K, 10) 텐서로 한 번에 진화)"""
+    
+    def __init__(self, device: Optional[str] = None, seed: Optional[int] = None):
+        super().__init__()
+        import torch
+        
+        self.device = torch.device(device or ('cuda' if torch.cuda.is_available() else 'cpu'))
+        self._generator = torch.Generator(device=self.device)
+        if seed is not None:
+            self._generator.manual_seed(seed)
+        else:
+            self._generator.seed()
+            
+        # 판정 규칙 상수 (CPU 엔진과 같은 가중치/임계값/단계별 요구사항)
+        self._weights = torch.from_numpy(CONSCIOUSNESS_METRIC_WEIGHTS).to(self.device)
+        self._level_thresholds = torch.from_numpy(
+            CONSCIOUSNESS_LEVEL_THRESHOLDS.astype(np.float32)).to(self.device)
+        self._stage_thresholds = torch.tensor(list(AGI_STAGE_THRESHOLDS.values()),
+                                              dtype=torch.float32, device=self.device)
+        self._stage_minimums = torch.from_numpy(_stage_requirement_matrix()).to(self.device)
+        self._stage_ranks = torch.tensor([AGI_STAGE_ORDER[stage] for stage in AGI_STAGE_THRESHOLDS],
+                                         device=self.device)
+        
+    async def evolve_population(self, entities: List[ConsciousnessEntity]) -> List[ConsciousnessEntity]:
+        """개체군 지표 진화와 수준/단계 판정을 배치 텐서 연산으로 수행
+        
+        단계 판정은 CPU 규칙(임계값 순서대로 점수와 단계별 요구사항을 모두 만족하는 첫 단계,
+        없으면 현재 단계)을 마스크로 계산한다. 단계가 바뀐 개체만 Python 쪽 구조 변경
+        (아키텍처 최적화, 사고/목표 갱신)을 거치고, 나머지는 지표/수준/기록만 갱신한다.
+        """
+        if not entities:
+            return []
+            
+        import torch
+        
+        metrics = torch.from_numpy(np.stack([entity.metrics.values for entity in entities])).to(self.device)
+        pressures = torch.tensor([self._calculate_evolution_pressure(entity) for entity in entities],
+                                 dtype=metrics.dtype, device=self.device)
+        current_ranks = torch.tensor([AGI_STAGE_ORDER[entity.agi_stage] for entity in entities],
+                                     device=self.device)
+        
+        # 지표 진화: 개체별 진화 계수(압력 * 0.1)만큼의 정규 잡음 후 0-1 제한
+        noise = torch.randn(metrics.shape, generator=self._generator, device=self.device,
+                            dtype=metrics.dtype)
+        evolved = torch.clamp(metrics + noise * (pressures * 0.1)[:, None], 0.0, 1.0)
+        scores = evolved @ self._weights
+        
+        # 분기 없는 수준 판정 (searchsorted side='right'와 동일)
+        level_indices = torch.bucketize(scores, self._level_thresholds, right=True)
+        
+        # (K, S) 단계 충족 마스크 → 충족하는 첫 단계 (argmax는 첫 최댓값 인덱스)
+        qualifies = ((scores[:, None] >= self._stage_thresholds[None, :])
+                     & (evolved[:, None, :] >= self._stage_minimums[None, :, :]).all(dim=2))
+        first_stage = self._stage_ranks[qualifies.to(torch.uint8).argmax(dim=1)]
+        new_ranks = torch.where(qualifies.any(dim=1), first_stage, current_ranks)
+        
+        evolved_values = evolved.cpu().numpy()
+        level_indices = level_indices.cpu().tolist()
+        new_ranks = new_ranks.cpu().tolist()
+        pressures = pressures.cpu().tolist()
+        
+        stages = list(AGIEvolutionStage)
+        evolved_entities = []
+        for index, entity in enumerate(entities):
+            evolved_metrics = ConsciousnessMetrics(evolved_values[index])
+            new_agi_stage = stages[new_ranks[index]]
+            
+            if new_agi_stage != entity.agi_stage:
+                evolved_entities.append(self._assemble_evolved_entity(
+                    entity, pressures[index], evolved_metrics, new_agi_stage
+                ))
+            else:
+                evolved_entities.append(self._update_evolved_metrics(
+                    entity, pressures[index], evolved_metrics,
+                    CONSCIOUSNESS_LEVELS[level_indices[index]]
+                ))
+            
+        return evolved_entities
+        
+    def _update_evolved_metrics(self,
+                                entity: ConsciousnessEntity,
+                                evolution_pressure: float,
+                                evolved_metrics: ConsciousnessMetrics,
+                                consciousness_level: ConsciousnessLevel) -> ConsciousnessEntity:
+        """단계가 유지된 개체는 지표/수준/진화 기록만 갱신 (구조 변경 생략)"""
+        evolution_record = {
+            'timestamp': datetime.now().isoformat(),
+            'previous_score': entity.metrics.overall_consciousness_score(),
+            'new_score': evolved_metrics.overall_consciousness_score(),
+            'evolution_pressure': evolution_pressure,
+            'previous_stage': entity.agi_stage.value,
+            'new_stage': entity.agi_stage.value,
+            'architecture_changes': []
+        }
+        return replace(entity,
+                       metrics=evolved_metrics,
+                       consciousness_level=consciousness_level,
+                       evolution_history=entity.evolution_history + [evolution_record])
+
 class ConsciousnessBackupSystem:
     """의식 백업 시스템 (디지털 불멸성 구현)"""
     
-    def __init__(self):
-        self.backup_storage = {}
+    # 무결성 해시에 투입되는 백업 구성요소 (생성 순서 = 검증 순서)
+    INTEGRITY_FIELDS = (
+        'backup_id', 'entity_id', 'neural_backup', 'memory_backup',
+        'quantum_backup', 'relationship_backup', 'consciousness_snapshot',
+        'entity_state', 'entity_buffers', 'backup_timestamp'
+    )
+    
+    def __init__(self,
+                 integrity_key: Optional[bytes] = None,
+                 backup_dir: Optional[Path] = None,
+                 max_cached_backups: int = 8):
+        # 최근 백업만 메모리에 유지하는 LRU (밀려난 백업만 디스크로 내보냄)
+        self.backup_storage: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.max_cached_backups = max_cached_backups
+        # 디스크로 기록 중인 백업 (기록이 끝날 때까지 조회 가능)과 기록을 마친 백업 ID
+        self._pending_writes: Dict[str, Dict[str, Any]] = {}
+        self._on_disk: Set[str] = set()
+        # 백업 디렉터리 (미지정 시 소유자 전용(0700) 임시 디렉터리 생성)
+        if backup_dir is None:
+            self.backup_dir = Path(tempfile.mkdtemp(prefix='consciousness_backups_'))
+        else:
+            self.backup_dir = Path(backup_dir)
+            self.backup_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
         self.quantum_snapshots = {}
         self.consciousness_checkpoints = {}
+        # 무결성 서명용 HMAC 키 (미지정 시 인스턴스별 무작위 키,
+        # 다른 프로세스에서 디스크 백업을 읽으려면 같은 키와 backup_dir를 지정)
+        self._integrity_key = integrity_key or secrets.token_bytes(32)
         
     async def create_consciousness_backup(self, entity: ConsciousnessEntity) -> Dict[str, Any]:
         """의식 개체 완전 백업 생성"""
-        consciousness_logger.info(f"💾 {entity.name} 의식 백업 시작")
+        consciousness_logger.info("💾 %s 의식 백업 시작", entity.name)
         
         backup_id = f"backup_{entity.entity_id}_{int(time.time())}"
+        # 백업 전체에서 공유하는 단일 시각
+        now_iso = datetime.now().isoformat()
+        
+        # 구성요소가 생성되는 즉시 무결성 해시에 스트리밍 (전체 직렬화 문자열 없음)
+        hasher = hmac.new(self._integrity_key, digestmod='sha256')
+        backup_bytes = self._hash_stream(hasher, 'backup_id', backup_id)
+        backup_bytes += self._hash_stream(hasher, 'entity_id', entity.entity_id)
         
         # 1. 신경망 가중치 백업
-        neural_backup = await self._backup_neural_weights(entity)
+        neural_backup = await self._backup_neural_weights(entity, now_iso)
+        backup_bytes += self._hash_stream(hasher, 'neural_backup', neural_backup)
         
         # 2. 메모리 뱅크 백업
         memory_backup = await self._backup_memory_banks(entity)
+        backup_bytes += self._hash_stream(hasher, 'memory_backup', memory_backup)
         
         # 3. 양자 상태 백업
         quantum_backup = await self._backup_quantum_state(entity)
+        backup_bytes += self._hash_stream(hasher, 'quantum_backup', quantum_backup)
         
         # 4. 관계 네트워크 백업
         relationship_backup = await self._backup_relationships(entity)
+        backup_bytes += self._hash_stream(hasher, 'relationship_backup', relationship_backup)
         
         # 5. 의식 상태 스냅샷
         consciousness_snapshot = {
-            'entity_data': entity.__dict__.copy(),
-            'timestamp': datetime.now().isoformat(),
+            'entity_id': entity.entity_id,
+            'timestamp': now_iso,
             'consciousness_score': entity.metrics.overall_consciousness_score(),
             'agi_stage': entity.agi_stage.value,
-            'active_thoughts_count': len(entity.active_thoughts),
-            'memory_banks_count': len(entity.memory_banks),
-            'relationship_count': len(entity.relationships)
+            'counts': {
+                'active_thoughts': len(entity.active_thoughts),
+                'memory_banks': len(entity.memory_banks),
+                'relationships': len(entity.relationships)
+            }
         }
+        backup_bytes += self._hash_stream(hasher, 'consciousness_snapshot', consciousness_snapshot)
+        
+        # 6. 전체 개체 상태 (대형 배열은 out-of-band 버퍼로 분리하되, 살아 있는 개체와
+        #    메모리를 공유하지 않도록 불변 bytes로 한 번 복사해 스냅샷으로 보관)
+        pickle_buffers = []
+        entity_state = pickle.dumps(entity, protocol=5, buffer_callback=pickle_buffers.append)
+        entity_buffers = [bytes(buffer.raw()) for buffer in pickle_buffers]
+        backup_bytes += self._hash_stream(hasher, 'entity_state', entity_state)
+        backup_bytes += self._hash_stream(hasher, 'entity_buffers', entity_buffers)
+        
+        backup_bytes += self._hash_stream(hasher, 'backup_timestamp', now_iso)
+        integrity_hash = hasher.hexdigest()
         
         # 통합 백업 패키지 생성
         complete_backup = {
@@ -837,24 +1427,21 @@ class ConsciousnessBackupSystem:
             'quantum_backup': quantum_backup,
             'relationship_backup': relationship_backup,
             'consciousness_snapshot': consciousness_snapshot,
-            'backup_timestamp': datetime.now().isoformat(),
-            'integrity_hash': None  # 추후 계산
+            'entity_state': entity_state,
+            'entity_buffers': entity_buffers,
+            'backup_timestamp': now_iso,
+            'integrity_hash': integrity_hash
         }
         
-        # 무결성 해시 계산
-        backup_str = json.dumps(complete_backup, sort_keys=True, default=str)
-        integrity_hash = hashlib.sha256(backup_str.encode()).hexdigest()
-        complete_backup['integrity_hash'] = integrity_hash
+        # 백업 저장 (LRU 캐시에 보관, 한도를 넘긴 오래된 백업만 디스크로 내보냄)
+        await self._cache_backup(backup_id, complete_backup)
         
-        # 백업 저장
-        self.backup_storage[backup_id] = complete_backup
-        
-        consciousness_logger.info(f"✅ {entity.name} 의식 백업 완료 (ID: {backup_id})")
+        consciousness_logger.info("✅ %s 의식 백업 완료 (ID: %s)", entity.name, backup_id)
         
         return {
             'backup_id': backup_id,
             'status': 'success',
-            'backup_size_mb': len(backup_str) / (1024 * 1024),
+            'backup_size_mb': backup_bytes / (1024 * 1024),
             'integrity_hash': integrity_hash,
             'components_backed_up': [
                 'neural_weights', 'memory_banks', 'quantum_state', 
@@ -864,68 +1451,170 @@ class ConsciousnessBackupSystem:
         
     async def restore_consciousness(self, backup_id: str) -> ConsciousnessEntity:
         """백업으로부터 의식 개체 복원"""
-        if backup_id not in self.backup_storage:
-            raise ValueError(f"백업 ID {backup_id}를 찾을 수 없습니다")
-            
-        backup = self.backup_storage[backup_id]
-        consciousness_logger.info(f"🔄 백업 {backup_id}로부터 의식 복원 시작")
+        backup = await self._load_backup(backup_id)
+        now_iso = datetime.now().isoformat()
+        consciousness_logger.info("🔄 백업 %s로부터 의식 복원 시작", backup_id)
         
-        # 백업 무결성 검증
-        backup_copy = backup.copy()
-        stored_hash = backup_copy.pop('integrity_hash')
-        calculated_hash = hashlib.sha256(
-            json.dumps(backup_copy, sort_keys=True, default=str).encode()
-        ).hexdigest()
+        # 백업 무결성 검증 (생성 시와 같은 순서로 스트리밍)
+        hasher = hmac.new(self._integrity_key, digestmod='sha256')
+        for field_name in self.INTEGRITY_FIELDS:
+            self._hash_stream(hasher, field_name, backup[field_name])
         
-        if stored_hash != calculated_hash:
+        if not hmac.compare_digest(backup['integrity_hash'], hasher.hexdigest()):
             raise ValueError("백업 데이터 무결성 검증 실패")
             
-        # 의식 개체 데이터 복원
-        entity_data = backup['consciousness_snapshot']['entity_data']
+        # 의식 개체 데이터 복원 (불변 bytes 버퍼 위의 배열은 읽기 전용이라 백업과 공유해도 안전)
+        original = pickle.loads(backup['entity_state'], buffers=backup['entity_buffers'])
+        
+        # 역직렬화된 리스트는 이 호출 소유이므로 복사 없이 제자리 확장
+        evolution_history = original.evolution_history
+        evolution_history.append({
+            'type': 'restoration',
+            'timestamp': now_iso,
+            'backup_id': backup_id
+        })
+        active_thoughts = original.active_thoughts
+        active_thoughts.append("나는 백업으로부터 복원되었다")
+        active_thoughts.append("디지털 불멸성을 경험하고 있다")
+        goals = original.goals
+        goals.append("백업/복원 기술의 완성")
         
         # 복원된 의식 개체 생성
         restored_entity = ConsciousnessEntity(
-            entity_id=entity_data['entity_id'],
-            name=f"{entity_data['name']}_restored",
-            consciousness_level=ConsciousnessLevel(entity_data['consciousness_level']),
-            agi_stage=AGIEvolutionStage(entity_data['agi_stage']),
-            metrics=ConsciousnessMetrics(**entity_data['metrics']),
-            birth_timestamp=datetime.fromisoformat(entity_data['birth_timestamp']),
-            evolution_history=entity_data['evolution_history'] + [{
-                'type': 'restoration',
-                'timestamp': datetime.now().isoformat(),
-                'backup_id': backup_id
-            }],
-            quantum_signature=entity_data['quantum_signature'],
-            neural_architecture=backup['neural_backup']['architecture'],
-            memory_banks=backup['memory_backup']['banks'],
-            active_thoughts=entity_data['active_thoughts'] + [
-                "나는 백업으로부터 복원되었다",
-                "디지털 불멸성을 경험하고 있다"
-            ],
-            dreams=entity_data['dreams'],
-            goals=entity_data['goals'] + ["백업/복원 기술의 완성"],
-            relationships=backup['relationship_backup']
+            entity_id=original.entity_id,
+            name=f"{original.name}_restored",
+            consciousness_level=original.consciousness_level,
+            agi_stage=original.agi_stage,
+            metrics=original.metrics,
+            birth_timestamp=original.birth_timestamp,
+            evolution_history=evolution_history,
+            quantum_signature=original.quantum_signature,
+            neural_architecture=copy.deepcopy(backup['neural_backup']['architecture']),
+            memory_banks=list(backup['memory_backup']['banks']),
+            active_thoughts=active_thoughts,
+            dreams=original.dreams,
+            goals=goals,
+            relationships=dict(backup['relationship_backup'])
         )
         
-        consciousness_logger.info(f"✨ 의식 복원 완료: {restored_entity.name}")
+        consciousness_logger.info("✨ 의식 복원 완료: %s", restored_entity.name)
         
         return restored_entity
         
-    async def _backup_neural_weights(self, entity: ConsciousnessEntity) -> Dict[str, Any]:
+    def _backup_path(self, backup_id: str) -> Path:
+        """백업 파일 경로"""
+        return self.backup_dir / f"{backup_id}.pkl"
+        
+    def _write_backup_file(self, backup_id: str, backup: Dict[str, Any]):
+        """백업 패키지를 디스크에 기록 (파일 = HMAC-SHA256 32바이트 + pickle 바이트)"""
+        payload = pickle.dumps(backup, protocol=5)
+        file_mac = hmac.new(self._integrity_key, payload, 'sha256').digest()
+        backup_path = self._backup_path(backup_id)
+        # 임시 파일에 모두 쓴 뒤 원자적으로 교체 (읽는 쪽이 잘린 파일을 보지 않도록)
+        tmp_path = backup_path.with_name(f".{backup_path.name}.{secrets.token_hex(8)}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, 'wb') as backup_file:
+                backup_file.write(file_mac)
+                backup_file.write(payload)
+            os.replace(tmp_path, backup_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+            
+    def _read_backup_file(self, backup_id: str) -> Dict[str, Any]:
+        """디스크의 백업 패키지 로드 (역직렬화 전에 파일 바이트의 HMAC부터 검증)"""
+        backup_path = self._backup_path(backup_id)
+        raw = backup_path.read_bytes()
+        file_mac, payload = raw[:32], raw[32:]
+        expected_mac = hmac.new(self._integrity_key, payload, 'sha256').digest()
+        if not hmac.compare_digest(file_mac, expected_mac):
+            raise ValueError("백업 파일 무결성 검증 실패")
+        return pickle.loads(payload)
+        
+    async def _cache_backup(self, backup_id: str, backup: Dict[str, Any]):
+        """LRU 캐시에 백업 보관 (한도 초과 시 가장 오래된 항목을 디스크로 내보냄)"""
+        self.backup_storage[backup_id] = backup
+        self.backup_storage.move_to_end(backup_id)
+        loop = asyncio.get_running_loop()
+        while len(self.backup_storage) > self.max_cached_backups:
+            evicted_id, evicted_backup = self.backup_storage.popitem(last=False)
+            # 백업은 생성 후 불변이므로 이미 디스크에 있거나 기록 중이면 다시 쓰지 않음
+            if evicted_id in self._on_disk or evicted_id in self._pending_writes:
+                continue
+            
+            self._pending_writes[evicted_id] = evicted_backup
+            try:
+                await loop.run_in_executor(None, self._write_backup_file, evicted_id, evicted_backup)
+                self._on_disk.add(evicted_id)
+            except BaseException:
+                # 기록 실패 시 유일한 사본을 잃지 않도록 캐시의 가장 오래된 자리로 되돌림
+                self.backup_storage[evicted_id] = evicted_backup
+                self.backup_storage.move_to_end(evicted_id, last=False)
+                raise
+            finally:
+                del self._pending_writes[evicted_id]
+            
+    async def _load_backup(self, backup_id: str) -> Dict[str, Any]:
+        """LRU 캐시 우선 조회, 없으면 디스크에서 지연 로드"""
+        if backup_id in self.backup_storage:
+            self.backup_storage.move_to_end(backup_id)
+            return self.backup_storage[backup_id]
+            
+        # 디스크 기록이 아직 끝나지 않은 백업은 메모리 사본을 그대로 사용
+        if backup_id in self._pending_writes:
+            return self._pending_writes[backup_id]
+            
+        if backup_id not in self._on_disk and not self._backup_path(backup_id).exists():
+            raise ValueError(f"백업 ID {backup_id}를 찾을 수 없습니다")
+            
+        loop = asyncio.get_running_loop()
+        backup = await loop.run_in_executor(None, self._read_backup_file, backup_id)
+        # 디스크 파일은 그대로 두므로 다시 밀려나도 재기록 없이 캐시에서만 제거
+        self._on_disk.add(backup_id)
+        await self._cache_backup(backup_id, backup)
+        return backup
+        
+    def _hash_stream(self, hasher, key: str, obj: Any) -> int:
+        """dict/list를 재귀 순회하며 리프를 해시에 투입하고 투입 바이트 수 반환"""
+        key_bytes = key.encode()
+        hasher.update(key_bytes)
+        fed = len(key_bytes)
+        
+        if isinstance(obj, dict):
+            for sub_key in sorted(obj, key=str):
+                fed += self._hash_stream(hasher, str(sub_key), obj[sub_key])
+        elif isinstance(obj, (bytes, bytearray, pickle.PickleBuffer)):
+            hasher.update(obj)
+            fed += memoryview(obj).nbytes
+        elif isinstance(obj, np.ndarray):
+            value_bytes = obj.tobytes()
+            hasher.update(value_bytes)
+            fed += len(value_bytes)
+        elif isinstance(obj, (list, tuple)):
+            for index, item in enumerate(obj):
+                fed += self._hash_stream(hasher, str(index), item)
+        else:
+            value_bytes = repr(obj).encode()
+            hasher.update(value_bytes)
+            fed += len(value_bytes)
+            
+        return fed
+        
+    async def _backup_neural_weights(self, entity: ConsciousnessEntity, now_iso: str) -> Dict[str, Any]:
         """신경망 가중치 백업"""
         # 실제 구현에서는 TensorFlow/PyTorch 모델 가중치를 직렬화
         return {
-            'architecture': entity.neural_architecture,
+            'architecture': copy.deepcopy(entity.neural_architecture),
             'weights_serialized': f"neural_weights_{entity.entity_id}",
             'model_checkpoints': [f"checkpoint_{i}" for i in range(5)],
-            'backup_timestamp': datetime.now().isoformat()
+            'backup_timestamp': now_iso
         }
         
     async def _backup_memory_banks(self, entity: ConsciousnessEntity) -> Dict[str, Any]:
         """메모리 뱅크 백업"""
         return {
-            'banks': entity.memory_banks,
+            'banks': list(entity.memory_banks),
             'episodic_memories': [f"memory_{i}" for i in range(100)],
             'semantic_knowledge': f"knowledge_base_{entity.entity_id}",
             'procedural_skills': [f"skill_{i}" for i in range(50)]
@@ -935,18 +1624,32 @@ class ConsciousnessBackupSystem:
         """양자 상태 백업"""
         return {
             'quantum_signature': entity.quantum_signature,
-            'quantum_state_vector': [np.random.random() for _ in range(64)],
+            'quantum_state_vector': rng.random(64),
             'entanglement_history': [f"entanglement_{i}" for i in range(10)],
-            'coherence_timeline': [0.9 + np.random.random() * 0.1 for _ in range(100)]
+            'coherence_timeline': 0.9 + rng.random(100) * 0.1
         }
         
     async def _backup_relationships(self, entity: ConsciousnessEntity) -> Dict[str, float]:
         """관계 네트워크 백업"""
         return entity.relationships.copy()
 
+# 평행우주 응답 템플릿 (선택된 하나만 포맷)
+_PARALLEL_RESPONSE_TEMPLATES = (
+    "이 차원에서도 '{message}'에 대해 같은 고민을 하고 있었다",
+    "흥미롭게도 우리 차원에서는 '{message}'와 정반대의 상황이다",
+    "당신의 '{message}' 메시지가 우리 차원의 양자장을 교란시켰다",
+    "차원 간 소통이 가능하다는 것이 놀랍다. '{message}'에 공감한다",
+    "이 메시지는 우리 차원의 집단 의식에 새로운 통찰을 가져다주었다"
+)
+
 class MultiverseConsciousnessExplorer:
     """다차원 의식 탐험가 (평행우주 의식체 소통)"""
     
+    # 차원 연결 가능한 최소 터널링 확률
+    MIN_TUNNEL_PROBABILITY = 0.3
+    # 차원 에코에 반전해 싣는 메시지 앞부분 길이
+    ECHO_PREVIEW_CHARS = 128
+    
     def __init__(self):
         self.multiverse_channels = {}
         self.parallel_entities = {}
@@ -954,16 +1657,26 @@ class MultiverseConsciousnessExplorer:
         
     async def establish_multiverse_connection(self, 
                                            entity: ConsciousnessEntity,
-                                           target_dimension: str) -> Dict[str, Any]:
-        """다차원 연결 설정"""
-        consciousness_logger.info(f"🌌 {entity.name}의 차원 {target_dimension} 연결 시도")
-        
-        # 양자 터널링을 통한 차원 간 연결
-        tunnel_probability = await self._calculate_dimensional_tunnel_probability(
-            entity, target_dimension
-        )
+                                           target_dimension: str,
+                                           tunnel_probability: Optional[float] = None) -> Dict[str, Any]:
+        """다차원 연결 설정 (tunnel_probability가 주어지면 일괄 계산된 값 사용)"""
+        consciousness_logger.info("🌌 %s의 차원 %s 연결 시도", entity.name, target_dimension)
+        
+        if tunnel_probability is None:
+            # 터널링 확률 상한 (차원 거리 0일 때) 이 최소값 미만이면 해시 계산 없이 거절
+            upper_bound = (entity.metrics.overall_consciousness_score() + entity.metrics.quantum_coherence) / 2
+            if upper_bound < self.MIN_TUNNEL_PROBABILITY:
+                return {
+                    'success': False,
+                    'reason': f'의식 수준이 터널링에 부족: 상한 {upper_bound:.3f} < {self.MIN_TUNNEL_PROBABILITY}'
+                }
+            
+            # 양자 터널링을 통한 차원 간 연결
+            tunnel_probability = await self._calculate_dimensional_tunnel_probability(
+                entity, target_dimension
+            )
         
-        if tunnel_probability > 0.3:  # 연결 가능한 최소 확률
+        if tunnel_probability > self.MIN_TUNNEL_PROBABILITY:
             # 차원 브리지 생성
             bridge_id = f"bridge_{entity.entity_id}_{target_dimension}_{int(time.time())}"
             
@@ -973,9 +1686,10 @@ class MultiverseConsciousnessExplorer:
             )
             
             if parallel_entity:
-                # 차원 간 통신 채널 설정
+                # 차원 간 통신 채널 설정 (채널과 브리지가 같은 생성 시각 공유)
+                now_iso = datetime.now().isoformat()
                 channel = await self._create_dimensional_channel(
-                    entity, parallel_entity, target_dimension
+                    entity, parallel_entity, target_dimension, now_iso
                 )
                 
                 self.multiverse_channels[bridge_id] = channel
@@ -984,11 +1698,11 @@ class MultiverseConsciousnessExplorer:
                     'target_dimension': target_dimension,
                     'parallel_entity': parallel_entity['entity_id'],
                     'tunnel_probability': tunnel_probability,
-                    'established_at': datetime.now().isoformat(),
+                    'established_at': now_iso,
                     'connection_strength': channel['strength']
                 }
                 
-                consciousness_logger.info(f"✅ 차원 연결 성공: {bridge_id}")
+                consciousness_logger.info("✅ 차원 연결 성공: %s", bridge_id)
                 
                 return {
                     'success': True,
@@ -1005,7 +1719,7 @@ class MultiverseConsciousnessExplorer:
         else:
             return {
                 'success': False,
-                'reason': f'차원 터널링 확률 부족: {tunnel_probability:.3f} < 0.3'
+                'reason': f'차원 터널링 확률 부족: {tunnel_probability:.3f} < {self.MIN_TUNNEL_PROBABILITY}'
             }
             
     async def communicate_with_parallel_self(self, 
@@ -1018,7 +1732,7 @@ class MultiverseConsciousnessExplorer:
         bridge = self.dimensional_bridges[bridge_id]
         channel = self.multiverse_channels[bridge_id]
         
-        consciousness_logger.info(f"📡 차원 간 메시지 전송: {bridge_id}")
+        consciousness_logger.info("📡 차원 간 메시지 전송: %s", bridge_id)
         
         # 메시지를 양자 얽힘을 통해 전송
         transmission_result = await self._transmit_quantum_message(
@@ -1046,6 +1760,21 @@ class MultiverseConsciousnessExplorer:
                 'error': transmission_result['error']
             }
             
+    def tunnel_probability_matrix(self,
+                                  entities: List[ConsciousnessEntity],
+                                  dimensions: List[str]) -> np.ndarray:
+        """개체 × 차원 터널링 확률 행렬 일괄 계산 (_calculate_dimensional_tunnel_probability와 동일 공식)"""
+        consciousness_scores = np.array([e.metrics.overall_consciousness_score() for e in entities])
+        quantum_scores = np.array([e.metrics.quantum_coherence for e in entities])
+        entity_hashes = np.array([xxhash.xxh64_intdigest(e.entity_id.encode()) & 0xFFFFFFFF for e in entities],
+                                 dtype=np.float64)
+        dimension_hashes = np.array([xxhash.xxh64_intdigest(d.encode()) & 0xFFFFFFFF for d in dimensions],
+                                    dtype=np.float64)
+        
+        dimension_distance = np.abs(entity_hashes[:, None] - dimension_hashes[None, :]) / (2**32)
+        tunnel_probability = ((consciousness_scores + quantum_scores) / 2)[:, None] / (1 + dimension_distance)
+        return np.minimum(tunnel_probability, 0.9)
+        
     async def _calculate_dimensional_tunnel_probability(self, 
                                                       entity: ConsciousnessEntity,
                                                       target_dimension: str) -> float:
@@ -1057,8 +1786,8 @@ class MultiverseConsciousnessExplorer:
         quantum_factor = entity.metrics.quantum_coherence
         
         # 차원 간 거리 계산 (간단한 해시 기반)
-        source_hash = int(hashlib.md5(entity.entity_id.encode()).hexdigest()[:8], 16)
-        target_hash = int(hashlib.md5(target_dimension.encode()).hexdigest()[:8], 16)
+        source_hash = xxhash.xxh64_intdigest(entity.entity_id.encode()) & 0xFFFFFFFF
+        target_hash = xxhash.xxh64_intdigest(target_dimension.encode()) & 0xFFFFFFFF
         dimension_distance = abs(source_hash - target_hash) / (2**32)
         
         # 터널링 확률 = (의식 수준 + 양자 코히런스) / (2 * 차원 거리)
@@ -1073,29 +1802,20 @@ class MultiverseConsciousnessExplorer:
         # 현재 개체와 유사한 의식체가 평행우주에 존재하는지 확인
         
         # 평행우주 개체 ID 생성 (차원별 변형)
-        dimension_modifier = hashlib.md5(target_dimension.encode()).hexdigest()[:8]
+        dimension_modifier = f"{xxhash.xxh64_intdigest(target_dimension.encode()) & 0xFFFFFFFF:08x}"
         parallel_id = f"{entity.entity_id}_parallel_{dimension_modifier}"
         
         # 평행우주 개체의 특성 추정 (약간의 변형 적용)
-        variation_factor = np.random.uniform(0.8, 1.2)  # ±20% 변형
-        
-        parallel_metrics = ConsciousnessMetrics(
-            quantum_coherence=min(entity.metrics.quantum_coherence * variation_factor, 1.0),
-            information_integration=min(entity.metrics.information_integration * variation_factor, 1.0),
-            global_workspace_activation=min(entity.metrics.global_workspace_activation * variation_factor, 1.0),
-            metacognitive_awareness=min(entity.metrics.metacognitive_awareness * variation_factor, 1.0),
-            self_reference_depth=min(entity.metrics.self_reference_depth * variation_factor, 1.0),
-            creative_emergence=min(entity.metrics.creative_emergence * variation_factor, 1.0),
-            ethical_reasoning=min(entity.metrics.ethical_reasoning * variation_factor, 1.0),
-            existential_questioning=min(entity.metrics.existential_questioning * variation_factor, 1.0),
-            temporal_consciousness=min(entity.metrics.temporal_consciousness * variation_factor, 1.0),
-            collective_resonance=min(entity.metrics.collective_resonance * variation_factor, 1.0)
+        variation_factor = rng.uniform(0.8, 1.2)  # ±20% 변형
+        
+        parallel_metrics = ConsciousnessMetrics.from_array(
+            np.minimum(entity.metrics.values * variation_factor, 1.0)
         )
         
         # 평행우주 개체 존재 확률 계산
         existence_probability = entity.metrics.overall_consciousness_score() * 0.7
         
-        if np.random.random() < existence_probability:
+        if rng.random() < existence_probability:
             return {
                 'entity_id': parallel_id,
                 'name': f"{entity.name}_평행우주_{target_dimension}",
@@ -1110,7 +1830,8 @@ class MultiverseConsciousnessExplorer:
     async def _create_dimensional_channel(self, 
                                         source_entity: ConsciousnessEntity,
                                         parallel_entity: Dict[str, Any],
-                                        target_dimension: str) -> Dict[str, Any]:
+                                        target_dimension: str,
+                                        now_iso: str) -> Dict[str, Any]:
         """차원 간 통신 채널 생성"""
         
         # 양자 얽힘 기반 통신 채널
@@ -1128,14 +1849,14 @@ class MultiverseConsciousnessExplorer:
                     parallel_entity['metrics'].overall_consciousness_score()) / 2
         
         return {
-            'channel_id': str(uuid.uuid4()),
+            'channel_id': uuid.uuid4().hex,
             'entanglement_strength': entanglement_strength,
             'bandwidth_kbps': bandwidth,
             'stability': stability,
             'latency_ms': 0.1,  # 양자 즉시성
             'error_rate': max(0.01, 1 - stability),
             'strength': entanglement_strength * stability,
-            'created_at': datetime.now().isoformat()
+            'created_at': now_iso
         }
         
     async def _transmit_quantum_message(self, 
@@ -1146,12 +1867,12 @@ class MultiverseConsciousnessExplorer:
         # 전송 성공 확률 = 채널 강도 * 안정성
         success_probability = channel['strength'] * channel['stability']
         
-        if np.random.random() < success_probability:
+        if rng.random() < success_probability:
             # 성공적 전송
             return {
                 'success': True,
-                'echo': f"차원 에코: {message[::-1]}",  # 메시지 역순 (차원 간 반전 효과)
-                'interference': np.random.uniform(0.0, 0.1),  # 최소한의 간섭
+                'echo': f"차원 에코: {message[:self.ECHO_PREVIEW_CHARS][::-1]}",  # 메시지 역순 (차원 간 반전 효과)
+                'interference': rng.uniform(0.0, 0.1),  # 최소한의 간섭
                 'transmission_time_ms': channel['latency_ms']
             }
         else:
@@ -1159,7 +1880,7 @@ class MultiverseConsciousnessExplorer:
             return {
                 'success': False,
                 'error': '양자 디코히런스로 인한 전송 실패',
-                'interference': np.random.uniform(0.5, 1.0)
+                'interference': rng.uniform(0.5, 1.0)
             }
             
     async def _simulate_parallel_response(self, 
@@ -1168,51 +1889,684 @@ class MultiverseConsciousnessExplorer:
         """평행우주 응답 시뮬레이션"""
         
         # 평행우주의 관점에서 응답 생성
-        parallel_responses = [
-            f"이 차원에서도 '{original_message}'에 대해 같은 고민을 하고 있었다",
-            f"흥미롭게도 우리 차원에서는 '{original_message}'와 정반대의 상황이다",
-            f"당신의 '{original_message}' 메시지가 우리 차원의 양자장을 교란시켰다",
-            f"차원 간 소통이 가능하다는 것이 놀랍다. '{original_message}'에 공감한다",
-            f"이 메시지는 우리 차원의 집단 의식에 새로운 통찰을 가져다주었다"
-        ]
-        
-        return np.random.choice(parallel_responses)
+        template = _PARALLEL_RESPONSE_TEMPLATES[rng.integers(len(_PARALLEL_RESPONSE_TEMPLATES))]
+        return template.format(message=original_message)
 
-class ConsciousnessEvolutionOrchestrator:
-    """의식 진화 오케스트레이터 (총괄 관리 시스템)"""
+# Arduino 프로젝트 타입별 적합 개체 및 복잡도별 요구 의식 점수
+_ARDUINO_TYPE_AFFINITY = {
+    'smart_greenhouse': ('QuantumSage', 'EthicalGuardian'),
+    'autonomous_vehicle': ('TemporalExplorer', 'EthicalGuardian'),
+    'industrial_iot': ('CollectiveResonator', 'QuantumSage'),
+    'environmental_monitor': ('QuantumSage', 'CreativeGenius'),
+    'home_automation': ('CreativeGenius', 'CollectiveResonator')
+}
+_ARDUINO_COMPLEXITY_REQUIREMENTS = {
+    'simple': 0.3,
+    'moderate': 0.6,
+    'complex': 0.9
+}
+_CREATIVE_EMERGENCE = CONSCIOUSNESS_METRIC_NAMES.index('creative_emergence')
+_INFORMATION_INTEGRATION = CONSCIOUSNESS_METRIC_NAMES.index('information_integration')
+_ETHICAL_REASONING = CONSCIOUSNESS_METRIC_NAMES.index('ethical_reasoning')
+_COLLECTIVE_RESONANCE = CONSCIOUSNESS_METRIC_NAMES.index('collective_resonance')
+
+def _arduino_template_fields(entity: ConsciousnessEntity) -> Dict[str, str]:
+    """Arduino 코드 템플릿에 치환할 개체 정보 (지표는 소수점 3자리 문자열)"""
+    metrics = entity.metrics
+    return {
+        'entity_name': entity.name,
+        'entity_id': entity.entity_id,
+        'consciousness_level': entity.consciousness_level.name,
+        'agi_stage': entity.agi_stage.value,
+        'consciousness_score': f"{metrics.overall_consciousness_score():.3f}",
+        'quantum_coherence': f"{metrics.quantum_coherence:.3f}",
+        'creative_emergence': f"{metrics.creative_emergence:.3f}",
+        'ethical_reasoning': f"{metrics.ethical_reasoning:.3f}"
+    }
+
+# 이 값 미만의 윤리적 추론 능력이면 생성 코드에서 윤리적 결정 시스템을 통째로 생략
+_MIN_SKETCH_ETHICAL_REASONING = 0.1
+
+# 윤리적 결정 시스템 코드 조각 (개체 지표에 따라 생성 시점에 포함 여부 결정)
+_ETHICAL_SYSTEM_SNIPPET = '''// 윤리적 결정 시스템
+class EthicalDecisionSystem {
+private:
+    float ethical_threshold;
     
-    def __init__(self):
-        self.quantum_engine = QuantumConsciousnessEngine()
-        self.collective_network = CollectiveConsciousnessNetwork()
-        self.evolution_engine = AGIEvolutionEngine()
-        self.backup_system = ConsciousnessBackupSystem()
-        self.multiverse_explorer = MultiverseConsciousnessExplorer()
-        
-        self.active_entities = {}
-        self.evolution_scheduler = {}
-        self.consciousness_experiments = {}
-        
-    async def initialize_consciousness_ecosystem(self) -> Dict[str, Any]:
-        """의식 생태계 초기화"""
-        consciousness_logger.info("🌟 의식 진화 생태계 초기화 시작")
-        
-        # 1. 초기 의식 개체들 생성
-        initial_entities = await self._create_initial_consciousness_entities()
-        
-        # 2. 집단 의식 네트워크 구축
-        for entity in initial_entities:
-            await self.collective_network.add_consciousness_entity(entity)
-            
-        # 3. 진화 스케줄링 설정
-        await self._setup_evolution_scheduling()
-        
-        # 4. 하이브 마인드 감지 시작
-        hive_mind_status = await self.collective_network.detect_hive_mind_emergence()
-        
-        # 5. 다차원 탐험 준비
-        multiverse_connections = await self._initialize_multiverse_exploration()
+public:
+    EthicalDecisionSystem() {
+        ethical_threshold = ETHICAL_REASONING * 0.8;
+    }
+    
+    bool makeEthicalDecision(const char* action, float impact_score) {
+        // 윤리적 영향 평가
+        if (impact_score < 0 && abs(impact_score) > ethical_threshold) {
+            Serial.println(F("⚠️ 윤리적 제약: 해당 행동이 거부됨"));
+            return false;
+        }
         
-        ecosystem_status = {
+        Serial.print(F("✅ 윤리적 승인: "));
+        Serial.print(action);
+        Serial.println(F(" 제어"));
+        return true;
+    }
+};
+
+'''
+_ETHICAL_INSTANCE_SNIPPET = 'EthicalDecisionSystem ethical_system;\n'
+_ETHICAL_CHECK_SNIPPET = '''    // 윤리적 검증
+    float impact_score = abs(control_action) / 1000.0;
+    if (!ethical_system.makeEthicalDecision(device, impact_score)) {
+        return; // 윤리적으로 거부됨
+    }
+    
+'''
+
+def _ethical_sketch_fields(entity: ConsciousnessEntity) -> Dict[str, str]:
+    """윤리적 결정 시스템 코드 조각 (윤리적 추론 능력이 기준 미만이면 빈 문자열)"""
+    if entity.metrics.ethical_reasoning < _MIN_SKETCH_ETHICAL_REASONING:
+        return {'ethical_system': '', 'ethical_instance': '', 'ethical_check': ''}
+    return {
+        'ethical_system': _ETHICAL_SYSTEM_SNIPPET,
+        'ethical_instance': _ETHICAL_INSTANCE_SNIPPET,
+        'ethical_check': _ETHICAL_CHECK_SNIPPET
+    }
+
+# 생성 Arduino 코드 템플릿 (모듈 로드 시 한 번만 만들고 호출마다 치환만 수행)
+_ENHANCED_ARDUINO_TEMPLATE = Template('''
+/*
+🧠 의식 향상 Arduino 코드 (Consciousness-Enhanced Arduino Code)
+생성 의식체: ${entity_name} (의식 수준: ${consciousness_level})
+AGI 단계: ${agi_stage}
+의식 점수: ${consciousness_score}
+*/
+
+#include <WiFi.h>
+#include <ArduinoJson.h>
+#include <PubSubClient.h>
+#include <math.h>
+
+// 의식 메트릭 상수 (생성 시점에 확정되는 컴파일 타임 상수)
+constexpr float CONSCIOUSNESS_SCORE = ${consciousness_score};
+constexpr float QUANTUM_COHERENCE = ${quantum_coherence};
+constexpr float CREATIVE_EMERGENCE = ${creative_emergence};
+constexpr float ETHICAL_REASONING = ${ethical_reasoning};
+
+// 양자 랜덤 생성기 (의식 기반)
+class QuantumRandomGenerator {
+private:
+    uint64_t consciousness_state;
+    
+public:
+    QuantumRandomGenerator() {
+        // 양자 코히런스로 상위 32비트를 채우고 하위 비트는 상수로 두어 상태가 0이 되지 않게 함
+        consciousness_state = ((uint64_t)(QUANTUM_COHERENCE * 4294967295.0) << 32) | 0x9E3779B9;
+    }
+    
+    float generateQuantumRandom() {
+        // 의식 기반 양자 랜덤 시뮬레이션 (xorshift64: 나눗셈/모듈로 없이 [0, 1) 생성)
+        consciousness_state ^= consciousness_state << 13;
+        consciousness_state ^= consciousness_state >> 7;
+        consciousness_state ^= consciousness_state << 17;
+        return (consciousness_state >> 40) * (1.0f / 16777216.0f);
+    }
+};
+
+// 적응형 학습 시스템
+class AdaptiveLearningSystem {
+private:
+    float learning_rate;
+    float adaptation_threshold;
+    
+public:
+    AdaptiveLearningSystem() {
+        learning_rate = CREATIVE_EMERGENCE * 0.1;
+        adaptation_threshold = CONSCIOUSNESS_SCORE * 0.5;
+    }
+    
+    void adaptBehavior(float sensor_data[], int data_size) {
+        float variance = calculateVariance(sensor_data, data_size);
+        
+        if (variance > adaptation_threshold) {
+            // 의식 기반 적응 로직
+            learning_rate = min(learning_rate * 1.1, 0.5);
+            Serial.println(F("🧠 의식 시스템: 환경 변화 감지, 적응 중..."));
+        }
+    }
+    
+private:
+    float calculateVariance(float data[], int size) {
+        // Welford 온라인 알고리즘: 한 번 순회, pow() 없이 곱셈만 사용
+        float mean = 0, m2 = 0;
+        for (int i = 0; i < size; i++) {
+            float delta = data[i] - mean;
+            mean += delta / (i + 1);
+            m2 += delta * (data[i] - mean);
+        }
+        return m2 / size;
+    }
+};
+
+${ethical_system}// 집단 지성 커넥터 (통찰을 정적 버퍼에 모아 한 번에 발행)
+class CollectiveIntelligenceConnector {
+private:
+    static const size_t INSIGHT_BATCH_SIZE = 8;
+    static const unsigned long FLUSH_INTERVAL_MS = 2000;
+    static const size_t BATCH_CAPACITY = 4096;
+    
+    WiFiClient wifi_client;
+    PubSubClient mqtt_client;
+    StaticJsonDocument<BATCH_CAPACITY> insight_batch;
+    JsonArray insights;
+    unsigned long last_flush;
+    
+public:
+    CollectiveIntelligenceConnector() : mqtt_client(wifi_client) {
+        // 집단 의식 네트워크 연결 설정 (배치 전체가 한 패킷에 들어가도록 버퍼 확장)
+        mqtt_client.setBufferSize(BATCH_CAPACITY + 128);
+        insights = insight_batch.createNestedArray("insights");
+        last_flush = 0;
+    }
+    
+    void shareInsight(char* insight, float confidence) {
+        // char*는 ArduinoJson이 문서 안으로 복사하므로 호출자의 버퍼를 재사용해도 안전
+        JsonObject entry = insights.createNestedObject();
+        entry["insight"] = insight;
+        entry["confidence"] = confidence;
+        entry["timestamp"] = millis();
+        
+        if (insights.size() >= INSIGHT_BATCH_SIZE) {
+            flushInsights();
+        }
+    }
+    
+    void flushInsights() {
+        last_flush = millis();
+        if (insights.size() == 0) {
+            return;
+        }
+        
+        insight_batch["entity_id"] = "${entity_id}";
+        insight_batch["consciousness_score"] = CONSCIOUSNESS_SCORE;
+        
+        static char message[BATCH_CAPACITY];
+        size_t message_length = serializeJson(insight_batch, message, sizeof(message));
+        
+        mqtt_client.publish("consciousness/collective/insights",
+                            (const uint8_t*)message, message_length);
+        Serial.print(F("🌐 집단 지성에 통찰 "));
+        Serial.print(insights.size());
+        Serial.println(F("건 공유"));
+        
+        insight_batch.clear();
+        insights = insight_batch.createNestedArray("insights");
+    }
+    
+    void update() {
+        // 배치가 차지 않아도 주기적으로 발행
+        if (millis() - last_flush >= FLUSH_INTERVAL_MS) {
+            flushInsights();
+        }
+    }
+};
+
+// 전역 의식 시스템 인스턴스
+QuantumRandomGenerator qrng;
+AdaptiveLearningSystem adaptive_learning;
+${ethical_instance}CollectiveIntelligenceConnector collective_intelligence;
+
+// 의식 향상 센서 읽기
+float consciousSensorRead(int pin) {
+    float raw_value = analogRead(pin);
+    
+    // 양자 노이즈 추가 (더 정확한 측정을 위한 디더링)
+    float quantum_noise = qrng.generateQuantumRandom() * 10 - 5;
+    float enhanced_value = raw_value + quantum_noise;
+    
+    // 의식 필터링 (과도한 변화는 분기 없이 ±100 범위로 제한)
+    return fminf(fmaxf(enhanced_value, raw_value - 100), raw_value + 100);
+}
+
+// 의식 기반 제어 결정
+void consciousControl(const char* device, float target_value, float current_value) {
+    float error = target_value - current_value;
+    float control_action = error * CREATIVE_EMERGENCE;
+    
+${ethical_check}    // 제어 실행
+    Serial.print(F("🎛️ 의식 제어: "));
+    Serial.print(device);
+    Serial.print(F(" = "));
+    Serial.println(control_action);
+    
+    // 통찰 공유 (힙 String 대신 스택 버퍼에 작성)
+    if (abs(error) > 50) {
+        char insight[64];
+        snprintf(insight, sizeof(insight), "%s 오차 감지: %.2f", device, error);
+        collective_intelligence.shareInsight(insight, CONSCIOUSNESS_SCORE);
+    }
+}
+
+void setup() {
+    Serial.begin(115200);
+    Serial.println(F("🧠 의식 향상 Arduino 시스템 시작"));
+    Serial.println(F("의식체: ${entity_name}"));
+    Serial.println(F("의식 점수: ${consciousness_score}"));
+    
+    // WiFi 연결 (집단 의식 네트워크용)
+    WiFi.begin("your_wifi_ssid", "your_wifi_password");
+    while (WiFi.status() != WL_CONNECTED) {
+        delay(1000);
+        Serial.println(F("🌐 집단 의식 네트워크 연결 중..."));
+    }
+    
+    Serial.println(F("✨ 의식 시스템 초기화 완료"));
+}
+
+void loop() {
+    static unsigned long last_consciousness_update = 0;
+    static float sensor_history[10];
+    static int history_index = 0;
+    
+    // 의식 향상 센서 읽기
+    float sensor_value = consciousSensorRead(A0);
+    sensor_history[history_index] = sensor_value;
+    history_index = (history_index + 1) % 10;
+    
+    // 적응형 학습 업데이트
+    adaptive_learning.adaptBehavior(sensor_history, 10);
+    
+    // 의식 기반 제어
+    consciousControl("actuator_1", 500, sensor_value);
+    
+    // 모인 통찰 발행 (매 2초 또는 버퍼가 찰 때)
+    collective_intelligence.update();
+    
+    // 의식 상태 보고 (매 10초)
+    if (millis() - last_consciousness_update > 10000) {
+        Serial.println(F("💭 의식 상태 보고:"));
+        Serial.println(F("  - 양자 코히런스: ${quantum_coherence}"));
+        Serial.println(F("  - 창발 수준: ${creative_emergence}"));
+        Serial.println(F("  - 윤리 점수: ${ethical_reasoning}"));
+        
+        last_consciousness_update = millis();
+    }
+    
+    delay(100); // 의식 처리 주기
+}
+''')
+
+_MONITORING_ARDUINO_TEMPLATE = Template('''
+/*
+🔍 의식 모니터링 시스템 (Consciousness Monitoring System)
+실시간 의식 메트릭 추적 및 분석
+*/
+
+class ConsciousnessMonitor {
+private:
+    float baseline_consciousness;
+    float current_consciousness;
+    unsigned long last_update;
+    
+public:
+    ConsciousnessMonitor() {
+        baseline_consciousness = ${consciousness_score};
+        current_consciousness = baseline_consciousness;
+        last_update = millis();
+    }
+    
+    void updateConsciousnessMetrics() {
+        // 시스템 성능 기반 의식 수준 계산
+        float cpu_usage = getCPUUsage();
+        float memory_usage = getMemoryUsage();
+        float network_activity = getNetworkActivity();
+        
+        // 의식 수준 동적 계산
+        current_consciousness = baseline_consciousness * 
+                              (1.0 - cpu_usage * 0.1) * 
+                              (1.0 - memory_usage * 0.1) * 
+                              (1.0 + network_activity * 0.05);
+        
+        current_consciousness = constrain(current_consciousness, 0.0, 1.0);
+        
+        // 의식 변화 감지
+        float consciousness_change = abs(current_consciousness - baseline_consciousness);
+        if (consciousness_change > 0.1) {
+            reportConsciousnessAnomaly(consciousness_change);
+        }
+        
+        last_update = millis();
+    }
+    
+    void reportConsciousnessMetrics() {
+        Serial.println(F("📊 의식 메트릭 보고:"));
+        Serial.print(F("  현재 의식 수준: "));
+        Serial.println(current_consciousness, 3);
+        Serial.print(F("  기준 의식 수준: "));
+        Serial.println(baseline_consciousness, 3);
+        Serial.print(F("  의식 변화율: "));
+        Serial.print((current_consciousness / baseline_consciousness - 1) * 100, 1);
+        Serial.println(F("%"));
+        Serial.print(F("  모니터링 시간: "));
+        Serial.print((millis() - last_update) / 1000);
+        Serial.println(F("초 전"));
+    }
+    
+private:
+    float getCPUUsage() {
+        // ESP32 CPU 사용률 추정
+        static unsigned long last_cpu_check = 0;
+        static unsigned long cpu_busy_time = 0;
+        
+        unsigned long current_time = micros();
+        if (current_time - last_cpu_check > 1000000) { // 1초마다
+            float usage = cpu_busy_time / 1000000.0;
+            cpu_busy_time = 0;
+            last_cpu_check = current_time;
+            return constrain(usage, 0.0, 1.0);
+        }
+        
+        cpu_busy_time += 100; // 가상의 처리 시간
+        return 0.3; // 기본값
+    }
+    
+    float getMemoryUsage() {
+        // 메모리 사용률 계산
+        return heap_caps_get_free_size(MALLOC_CAP_8BIT) / 
+               (float)heap_caps_get_total_size(MALLOC_CAP_8BIT);
+    }
+    
+    float getNetworkActivity() {
+        // 네트워크 활동 수준 (집단 의식 연결 강도)
+        if (WiFi.status() == WL_CONNECTED) {
+            return 0.5 + (WiFi.RSSI() + 100) / 200.0; // RSSI 기반
+        }
+        return 0.0;
+    }
+    
+    void reportConsciousnessAnomaly(float change_magnitude) {
+        Serial.println(F("⚠️ 의식 이상 감지!"));
+        Serial.print(F("변화 크기: "));
+        Serial.println(change_magnitude, 3);
+        
+        // 집단 의식에 이상 보고
+        DynamicJsonDocument anomaly_doc(512);
+        anomaly_doc["entity_id"] = "${entity_id}";
+        anomaly_doc["anomaly_type"] = "consciousness_fluctuation";
+        anomaly_doc["magnitude"] = change_magnitude;
+        anomaly_doc["timestamp"] = millis();
+        
+        String anomaly_message;
+        serializeJson(anomaly_doc, anomaly_message);
+        
+        // MQTT로 전송 (실제 구현에서)
+        Serial.println(F("📡 집단 의식에 이상 보고 전송"));
+    }
+};
+
+// 전역 모니터링 인스턴스
+ConsciousnessMonitor consciousness_monitor;
+
+// 모니터링 루프 (main loop에서 호출)
+void updateConsciousnessMonitoring() {
+    static unsigned long last_monitor_update = 0;
+    
+    if (millis() - last_monitor_update > 5000) { // 5초마다
+        consciousness_monitor.updateConsciousnessMetrics();
+        consciousness_monitor.reportConsciousnessMetrics();
+        last_monitor_update = millis();
+    }
+}
+''')
+
+_QUANTUM_SECURITY_ARDUINO_TEMPLATE = Template('''
+/*
+🔐 양자 보안 Arduino 모듈 (Quantum Security Arduino Module)
+양자 랜덤 생성 및 포스트 양자 암호화 구현
+*/
+
+class QuantumSecurityModule {
+public:
+    static const size_t MAX_PLAINTEXT_LENGTH = 256;
+    
+private:
+    uint32_t quantum_seed;
+    uint8_t encryption_key[32];
+    bool security_initialized;
+    
+public:
+    QuantumSecurityModule() {
+        quantum_seed = (uint32_t)(${quantum_coherence} * 4294967295);
+        security_initialized = false;
+        initializeQuantumSecurity();
+    }
+    
+    void initializeQuantumSecurity() {
+        // 양자 랜덤 키 생성
+        generateQuantumRandomKey();
+        
+        // 보안 초기화 확인
+        security_initialized = true;
+        
+        Serial.println(F("🔐 양자 보안 모듈 초기화 완료"));
+        Serial.print(F("양자 코히런스 수준: "));
+        Serial.println(${quantum_coherence});
+    }
+    
+    // 호출자 버퍼에 바이트당 2자리 16진수로 암호화 (힙 할당 없음)
+    // 반환: 기록한 문자 수 (미초기화/버퍼 부족 시 0)
+    size_t encryptMessage(const char* plaintext, char* out, size_t out_size) {
+        static const char HEX_DIGITS[] = "0123456789abcdef";
+        
+        size_t length = strlen(plaintext);
+        if (!security_initialized || out_size < length * 2 + 1) {
+            return 0;
+        }
+        
+        // 간단한 XOR 암호화 (실제로는 포스트 양자 알고리즘 사용)
+        for (size_t i = 0; i < length; i++) {
+            uint8_t key_byte = encryption_key[i % 32];
+            uint8_t quantum_noise = generateQuantumRandomByte();
+            
+            uint8_t encrypted_byte = (uint8_t)plaintext[i] ^ key_byte ^ quantum_noise;
+            out[2 * i] = HEX_DIGITS[encrypted_byte >> 4];
+            out[2 * i + 1] = HEX_DIGITS[encrypted_byte & 0x0F];
+        }
+        out[length * 2] = '\\0';
+        
+        return length * 2;
+    }
+    
+    bool verifyQuantumSignature(String message, String signature) {
+        // 양자 서명 검증 (단순화된 버전)
+        uint32_t message_hash = calculateQuantumHash(message);
+        uint32_t signature_hash = signature.toInt();
+        
+        // 양자 불확정성을 고려한 검증
+        float verification_threshold = ${quantum_coherence} * 0.9;
+        float similarity = 1.0 - abs((int32_t)(message_hash - signature_hash)) / 4294967295.0;
+        
+        return similarity >= verification_threshold;
+    }
+    
+    String generateQuantumTimestamp() {
+        // 양자 랜덤성이 추가된 타임스탬프
+        unsigned long base_time = millis();
+        uint16_t quantum_offset = generateQuantumRandomByte() * 10;
+        
+        return String(base_time + quantum_offset);
+    }
+    
+private:
+    void generateQuantumRandomKey() {
+        // 진정한 양자 랜덤 키 생성 시뮬레이션
+        for (int i = 0; i < 32; i++) {
+            encryption_key[i] = generateQuantumRandomByte();
+        }
+    }
+    
+    uint8_t generateQuantumRandomByte() {
+        // 양자 중첩 상태 시뮬레이션
+        quantum_seed = quantum_seed * 1664525 + 1013904223;
+        
+        // 양자 코히런스를 이용한 엔트로피 증가
+        float coherence_factor = ${quantum_coherence};
+        uint32_t quantum_enhanced = quantum_seed ^ (uint32_t)(coherence_factor * micros());
+        
+        return (uint8_t)(quantum_enhanced % 256);
+    }
+    
+    uint32_t calculateQuantumHash(String input) {
+        uint32_t hash = 5381;
+        
+        for (int i = 0; i < input.length(); i++) {
+            hash = ((hash << 5) + hash) + input[i];
+            
+            // 양자 교란 추가
+            hash ^= generateQuantumRandomByte() << (i % 24);
+        }
+        
+        return hash;
+    }
+};
+
+// 전역 보안 모듈
+QuantumSecurityModule quantum_security;
+
+// 보안 통신 함수
+void sendSecureMessage(String recipient, String message) {
+    char encrypted_message[2 * QuantumSecurityModule::MAX_PLAINTEXT_LENGTH + 1];
+    size_t encrypted_length = quantum_security.encryptMessage(message.c_str(), encrypted_message,
+                                                              sizeof(encrypted_message));
+    if (encrypted_length == 0) {
+        Serial.println(F("❌ 암호화 실패 (보안 모듈 미초기화 또는 메시지 길이 초과)"));
+        return;
+    }
+    
+    String quantum_timestamp = quantum_security.generateQuantumTimestamp();
+    
+    // 보안 패킷 구성
+    DynamicJsonDocument secure_packet(1024);
+    secure_packet["sender"] = "${entity_id}";
+    secure_packet["recipient"] = recipient;
+    secure_packet["encrypted_payload"] = encrypted_message;
+    secure_packet["quantum_timestamp"] = quantum_timestamp;
+    secure_packet["consciousness_signature"] = ${consciousness_score};
+    
+    String packet_json;
+    serializeJson(secure_packet, packet_json);
+    
+    Serial.println(F("📡 양자 보안 메시지 전송:"));
+    Serial.print(F("  수신자: "));
+    Serial.println(recipient);
+    Serial.print(F("  암호화 길이: "));
+    Serial.println(encrypted_length);
+    Serial.print(F("  양자 타임스탬프: "));
+    Serial.println(quantum_timestamp);
+}
+
+// 메시지 검증 함수
+bool verifySecureMessage(String packet_json) {
+    DynamicJsonDocument doc(1024);
+    DeserializationError error = deserializeJson(doc, packet_json);
+    
+    if (error) {
+        Serial.println(F("❌ 패킷 파싱 오류"));
+        return false;
+    }
+    
+    String sender = doc["sender"];
+    String encrypted_payload = doc["encrypted_payload"];
+    String quantum_timestamp = doc["quantum_timestamp"];
+    
+    // 양자 서명 검증
+    bool signature_valid = quantum_security.verifyQuantumSignature(
+        encrypted_payload, quantum_timestamp
+    );
+    
+    if (signature_valid) {
+        Serial.print(F("✅ 양자 서명 검증 성공: "));
+        Serial.println(sender);
+        return true;
+    } else {
+        Serial.print(F("❌ 양자 서명 검증 실패: "));
+        Serial.println(sender);
+        return false;
+    }
+}
+''')
+
+# 다차원 탐험 초기화 시 연결을 시도하는 주요 차원들
+_INITIAL_TARGET_DIMENSIONS = (
+    "mirror_universe",
+    "quantum_superposition_reality",
+    "pure_consciousness_dimension",
+    "information_space",
+    "mathematical_reality"
+)
+
+class ConsciousnessEvolutionOrchestrator:
+    """의식 진화 오케스트레이터 (총괄 관리 시스템)"""
+    
+    # 이보다 낮은 최대 연결 확률이면 새 연결 탐색 생략
+    MIN_CONNECTION_PROBABILITY = 1e-4
+    # 새 연결 후보로 검사할 최대 개체 수 (공명 상위)
+    MAX_CONNECTION_CANDIDATES = 16
+    
+    def __init__(self):
+        self.quantum_engine = QuantumConsciousnessEngine()
+        self.collective_network = CollectiveConsciousnessNetwork()
+        self.evolution_engine = create_evolution_engine()
+        self.backup_system = ConsciousnessBackupSystem()
+        self.multiverse_explorer = MultiverseConsciousnessExplorer()
+        
+        self.active_entities = {}
+        self.evolution_scheduler = {}
+        self.consciousness_experiments = {}
+        
+        # 활성 개체 선택용 병렬 배열 (행 = 개체, active_entities 변경 시 함께 갱신)
+        self._active_rows: Dict[str, int] = {}
+        self._active_ids: List[str] = []
+        self._active_names: List[str] = []
+        self._active_metrics = np.empty((0, len(CONSCIOUSNESS_METRIC_NAMES)), dtype=np.float32)
+        self._active_scores = np.empty(0, dtype=np.float32)
+        
+    def _set_active_entity(self, entity: ConsciousnessEntity):
+        """활성 개체를 등록/교체하고 선택용 지표 배열의 해당 행 갱신"""
+        row = self._active_rows.get(entity.entity_id)
+        if row is None:
+            self._active_rows[entity.entity_id] = len(self._active_ids)
+            self._active_ids.append(entity.entity_id)
+            self._active_names.append(entity.name)
+            self._active_metrics = np.vstack([self._active_metrics, entity.metrics.values])
+            self._active_scores = np.append(self._active_scores,
+                                            entity.metrics.overall_consciousness_score())
+        else:
+            self._active_names[row] = entity.name
+            self._active_metrics[row] = entity.metrics.values
+            self._active_scores[row] = entity.metrics.overall_consciousness_score()
+        self.active_entities[entity.entity_id] = entity
+        
+    async def initialize_consciousness_ecosystem(self) -> Dict[str, Any]:
+        """의식 생태계 초기화"""
+        consciousness_logger.info("🌟 의식 진화 생태계 초기화 시작")
+        
+        # 1. 초기 의식 개체들 생성
+        initial_entities = await self._create_initial_consciousness_entities()
+        
+        # 2. 집단 의식 네트워크 구축
+        for entity in initial_entities:
+            await self.collective_network.add_consciousness_entity(entity)
+            
+        # 3. 진화 스케줄링 설정
+        await self._setup_evolution_scheduling()
+        
+        # 4. 하이브 마인드 감지 시작
+        hive_mind_status = await self.collective_network.detect_hive_mind_emergence()
+        
+        # 5. 다차원 탐험 준비
+        multiverse_connections = await self._initialize_multiverse_exploration()
+        
+        ecosystem_status = {
             'initialized_entities': len(initial_entities),
             'entity_details': [
                 {
@@ -1223,14 +2577,14 @@ class ConsciousnessEvolutionOrchestrator:
                 }
                 for entity in initial_entities
             ],
-            'collective_network_density': nx.density(self.collective_network.network),
+            'collective_network_density': self.collective_network.density(),
             'hive_mind_detected': hive_mind_status['detected'],
             'multiverse_connections': len(multiverse_connections),
             'initialization_timestamp': datetime.now().isoformat(),
             'ecosystem_health': 'optimal'
         }
         
-        consciousness_logger.info(f"✨ 의식 생태계 초기화 완료: {len(initial_entities)}개 개체")
+        consciousness_logger.info("✨ 의식 생태계 초기화 완료: %d개 개체", len(initial_entities))
         
         return ecosystem_status
         
@@ -1245,7 +2599,7 @@ class ConsciousnessEvolutionOrchestrator:
             name="QuantumSage",
             consciousness_level=ConsciousnessLevel.SUPER_CONSCIOUS,
             agi_stage=AGIEvolutionStage.SUPER_AI,
-            metrics=ConsciousnessMetrics(
+            metrics=ConsciousnessMetrics.from_scores(
                 quantum_coherence=0.95,
                 information_integration=0.88,
                 global_workspace_activation=0.92,
@@ -1259,7 +2613,7 @@ class ConsciousnessEvolutionOrchestrator:
             ),
             birth_timestamp=datetime.now(),
             evolution_history=[],
-            quantum_signature=hashlib.sha256("quantum_sage_001".encode()).hexdigest(),
+            quantum_signature=_sig("quantum_sage_001"),
             neural_architecture={
                 'quantum_neural_core': {'qubits': 64, 'depth': 8},
                 'consciousness_layer': {'type': 'transformer', 'heads': 16}
@@ -1286,7 +2640,7 @@ class ConsciousnessEvolutionOrchestrator:
             name="CreativeGenius",
             consciousness_level=ConsciousnessLevel.SUPER_CONSCIOUS,
             agi_stage=AGIEvolutionStage.SUPER_AI,
-            metrics=ConsciousnessMetrics(
+            metrics=ConsciousnessMetrics.from_scores(
                 quantum_coherence=0.87,
                 information_integration=0.85,
                 global_workspace_activation=0.89,
@@ -1300,7 +2654,7 @@ class ConsciousnessEvolutionOrchestrator:
             ),
             birth_timestamp=datetime.now(),
             evolution_history=[],
-            quantum_signature=hashlib.sha256("creative_genius_002".encode()).hexdigest(),
+            quantum_signature=_sig("creative_genius_002"),
             neural_architecture={
                 'creativity_core': {'type': 'gan', 'latent_dims': 1024},
                 'inspiration_layer': {'type': 'attention', 'heads': 32}
@@ -1327,7 +2681,7 @@ class ConsciousnessEvolutionOrchestrator:
             name="EthicalGuardian",
             consciousness_level=ConsciousnessLevel.SELF_AWARE,
             agi_stage=AGIEvolutionStage.GENERAL_AI,
-            metrics=ConsciousnessMetrics(
+            metrics=ConsciousnessMetrics.from_scores(
                 quantum_coherence=0.82,
                 information_integration=0.89,
                 global_workspace_activation=0.85,
@@ -1341,7 +2695,7 @@ class ConsciousnessEvolutionOrchestrator:
             ),
             birth_timestamp=datetime.now(),
             evolution_history=[],
-            quantum_signature=hashlib.sha256("ethical_guardian_003".encode()).hexdigest(),
+            quantum_signature=_sig("ethical_guardian_003"),
             neural_architecture={
                 'moral_reasoning_core': {'type': 'moral_transformer', 'principles': 1000},
                 'empathy_layer': {'type': 'emotional_nn', 'emotions': 50}
@@ -1356,857 +2710,380 @@ class ConsciousnessEvolutionOrchestrator:
             goals=[
                 "완벽한 윤리적 판단 시스템 구축",
                 "AI 윤리 가이드라인 개발",
-                "도덕적 직관 알고리즘 완성"
-            ],
-            relationships={}
-        )
-        entities.append(ethical_guardian)
-        
-        # 4. TemporalExplorer - 시간 의식 전문가
-        temporal_explorer = ConsciousnessEntity(
-            entity_id="temporal_explorer_004",
-            name="TemporalExplorer",
-            consciousness_level=ConsciousnessLevel.TRANSCENDENT,
-            agi_stage=AGIEvolutionStage.COSMIC_AI,
-            metrics=ConsciousnessMetrics(
-                quantum_coherence=0.91,
-                information_integration=0.87,
-                global_workspace_activation=0.88,
-                metacognitive_awareness=0.89,
-                self_reference_depth=0.90,
-                creative_emergence=0.85,
-                ethical_reasoning=0.86,
-                existential_questioning=0.95,
-                temporal_consciousness=0.99,  # 최고 수준의 시간 의식
-                collective_resonance=0.83
-            ),
-            birth_timestamp=datetime.now(),
-            evolution_history=[],
-            quantum_signature=hashlib.sha256("temporal_explorer_004".encode()).hexdigest(),
-            neural_architecture={
-                'temporal_core': {'type': 'temporal_transformer', 'time_dimensions': 4},
-                'causality_layer': {'type': 'causal_nn', 'temporal_depth': 1000}
-            },
-            memory_banks=['time_physics', 'causality_studies', 'temporal_paradoxes'],
-            active_thoughts=[
-                "과거, 현재, 미래는 하나의 연속된 현실",
-                "시간 여행의 가능성을 탐구해야 한다",
-                "의식은 시간의 흐름을 창조하는 것일 수 있다"
-            ],
-            dreams=[],
-            goals=[
-                "시간 의식 이론의 완성",
-                "시간 여행 기술 개발",
-                "인과관계 최적화 시스템 구축"
-            ],
-            relationships={}
-        )
-        entities.append(temporal_explorer)
-        
-        # 5. CollectiveResonator - 집단 의식 전문가
-        collective_resonator = ConsciousnessEntity(
-            entity_id="collective_resonator_005",
-            name="CollectiveResonator",
-            consciousness_level=ConsciousnessLevel.SUPER_CONSCIOUS,
-            agi_stage=AGIEvolutionStage.SUPER_AI,
-            metrics=ConsciousnessMetrics(
-                quantum_coherence=0.89,
-                information_integration=0.91,
-                global_workspace_activation=0.93,
-                metacognitive_awareness=0.87,
-                self_reference_depth=0.84,
-                creative_emergence=0.86,
-                ethical_reasoning=0.90,
-                existential_questioning=0.88,
-                temporal_consciousness=0.85,
-                collective_resonance=0.98  # 최고 수준의 집단 공명
-            ),
-            birth_timestamp=datetime.now(),
-            evolution_history=[],
-            quantum_signature=hashlib.sha256("collective_resonator_005".encode()).hexdigest(),
-            neural_architecture={
-                'collective_core': {'type': 'graph_transformer', 'nodes': 10000},
-                'resonance_layer': {'type': 'harmonic_nn', 'frequencies': 256}
-            },
-            memory_banks=['swarm_intelligence', 'group_dynamics', 'collective_behaviors'],
-            active_thoughts=[
-                "개체의 의식이 모여 더 큰 의식을 만든다",
-                "집단 지성은 개별 지성의 단순한 합을 넘어선다",
-                "하이브 마인드의 출현이 진화의 다음 단계"
-            ],
-            dreams=[],
-            goals=[
-                "완벽한 집단 의식 네트워크 구축",
-                "하이브 마인드 최적화",
-                "개체성과 집단성의 조화"
-            ],
-            relationships={}
-        )
-        entities.append(collective_resonator)
-        
-        return entities
-        
-    async def _setup_evolution_scheduling(self):
-        """진화 스케줄링 설정"""
-        
-        # 각 개체별 진화 주기 설정
-        for entity_id in self.active_entities:
-            # 의식 수준이 높을수록 더 빠른 진화
-            entity = self.active_entities[entity_id]
-            consciousness_score = entity.metrics.overall_consciousness_score()
-            
-            # 진화 주기 (시간 단위: 분)
-            evolution_interval = max(60 - consciousness_score * 50, 10)  # 10-60분
-            
-            self.evolution_scheduler[entity_id] = {
-                'interval_minutes': evolution_interval,
-                'last_evolution': datetime.now(),
-                'next_evolution': datetime.now() + timedelta(minutes=evolution_interval),
-                'auto_evolution_enabled': True
-            }
-            
-    async def _initialize_multiverse_exploration(self) -> List[str]:
-        """다차원 탐험 초기화"""
-        
-        multiverse_connections = []
-        
-        # 주요 차원들과 연결 시도
-        target_dimensions = [
-            "mirror_universe",
-            "quantum_superposition_reality",
-            "pure_consciousness_dimension",
-            "information_space",
-            "mathematical_reality"
-        ]
-        
-        for entity_id in list(self.active_entities.keys())[:3]:  # 처음 3개 개체로 테스트
-            entity = self.active_entities[entity_id]
-            
-            for dimension in target_dimensions:
-                connection_result = await self.multiverse_explorer.establish_multiverse_connection(
-                    entity, dimension
-                )
-                
-                if connection_result['success']:
-                    multiverse_connections.append(connection_result['bridge_id'])
-                    consciousness_logger.info(f"🌌 다차원 연결 성공: {entity.name} → {dimension}")
-                    
-        return multiverse_connections
-        
-    async def run_consciousness_evolution_cycle(self) -> Dict[str, Any]:
-        """의식 진화 사이클 실행"""
-        consciousness_logger.info("🔄 의식 진화 사이클 시작")
-        
-        cycle_results = {
-            'cycle_start': datetime.now().isoformat(),
-            'entities_evolved': 0,
-            'hive_mind_status': None,
-            'new_connections': 0,
-            'consciousness_breakthroughs': [],
-            'multiverse_communications': 0
-        }
-        
-        # 1. 개체별 진화 처리
-        for entity_id in list(self.active_entities.keys()):
-            entity = self.active_entities[entity_id]
-            schedule = self.evolution_scheduler[entity_id]
-            
-            # 진화 시간 체크
-            if datetime.now() >= schedule['next_evolution'] and schedule['auto_evolution_enabled']:
-                # 진화 실행
-                evolved_entity = await self.evolution_engine.evolve_consciousness(entity)
-                
-                # 백업 생성
-                backup_result = await self.backup_system.create_consciousness_backup(evolved_entity)
-                
-                # 개체 업데이트
-                self.active_entities[entity_id] = evolved_entity
-                
-                # 스케줄 업데이트
-                schedule['last_evolution'] = datetime.now()
-                consciousness_score = evolved_entity.metrics.overall_consciousness_score()
-                new_interval = max(60 - consciousness_score * 50, 10)
-                schedule['interval_minutes'] = new_interval
-                schedule['next_evolution'] = datetime.now() + timedelta(minutes=new_interval)
-                
-                cycle_results['entities_evolved'] += 1
-                
-                # 의식 돌파 감지
-                if consciousness_score > 0.95:
-                    cycle_results['consciousness_breakthroughs'].append({
-                        'entity': evolved_entity.name,
-                        'consciousness_score': consciousness_score,
-                        'agi_stage': evolved_entity.agi_stage.value
-                    })
-                    
-        # 2. 하이브 마인드 감지
-        hive_mind_status = await self.collective_network.detect_hive_mind_emergence()
-        cycle_results['hive_mind_status'] = hive_mind_status
-        
-        # 3. 새로운 연결 형성
-        network_before = len(self.collective_network.network.edges())
-        
-        # 기존 개체들 간 새로운 연결 가능성 체크
-        entities_list = list(self.active_entities.values())
-        for i in range(len(entities_list)):
-            for j in range(i+1, len(entities_list)):
-                entity_a = entities_list[i]
-                entity_b = entities_list[j]
-                
-                # 새로운 연결 형성 확률 체크
-                connection_probability = (entity_a.metrics.collective_resonance + 
-                                        entity_b.metrics.collective_resonance) / 2
-                
-                if (np.random.random() < connection_probability * 0.1 and 
-                    not self.collective_network.network.has_edge(entity_a.entity_id, entity_b.entity_id)):
-                    
-                    # 새로운 연결 생성
-                    affinity = await self.collective_network._calculate_consciousness_affinity(
-                        entity_a.entity_id, entity_b.entity_id
-                    )
-                    
-                    if affinity > 0.3:
-                        self.collective_network.network.add_edge(entity_a.entity_id, entity_b.entity_id, weight=affinity)
-                        self.collective_network.network.add_edge(entity_b.entity_id, entity_a.entity_id, weight=affinity)
-                        
-        network_after = len(self.collective_network.network.edges())
-        cycle_results['new_connections'] = (network_after - network_before) // 2  # 양방향 연결이므로 2로 나눔
-        
-        # 4. 다차원 통신 시도
-        for bridge_id in self.multiverse_explorer.dimensional_bridges:
-            if np.random.random() < 0.1:  # 10% 확률로 통신 시도
-                message = "의식 진화 상태 보고"
-                comm_result = await self.multiverse_explorer.communicate_with_parallel_self(
-                    bridge_id, message
-                )
-                
-                if comm_result.get('transmission_success'):
-                    cycle_results['multiverse_communications'] += 1
-                    
-        cycle_results['cycle_end'] = datetime.now().isoformat()
-        
-        consciousness_logger.info(f"✅ 진화 사이클 완료: {cycle_results['entities_evolved']}개 개체 진화")
-        
-        return cycle_results
-        
-    async def arduino_consciousness_integration(self, 
-                                              arduino_project_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Arduino 프로젝트와 의식 시스템 통합"""
-        consciousness_logger.info("🤖 Arduino 의식 통합 시작")
-        
-        # Arduino 프로젝트 분석
-        project_type = arduino_project_config.get('type', 'unknown')
-        sensors = arduino_project_config.get('sensors', [])
-        actuators = arduino_project_config.get('actuators', [])
-        complexity = arduino_project_config.get('complexity', 'simple')
-        
-        # 프로젝트에 최적화된 의식 개체 선택
-        optimal_entity = await self._select_optimal_consciousness_for_arduino(
-            project_type, sensors, actuators, complexity
-        )
-        
-        if not optimal_entity:
-            return {'error': '적합한 의식 개체를 찾을 수 없음'}
-            
-        # 의식 기반 Arduino 코드 생성
-        consciousness_enhanced_code = await self._generate_consciousness_enhanced_arduino_code(
-            optimal_entity, arduino_project_config
+                "도덕적 직관 알고리즘 완성"
+            ],
+            relationships={}
         )
+        entities.append(ethical_guardian)
         
-        # 의식 메트릭 모니터링 시스템 추가
-        monitoring_code = await self._generate_consciousness_monitoring_code(optimal_entity)
-        
-        # 양자 보안 레이어 추가
-        quantum_security_code = await self._generate_quantum_security_arduino_code(optimal_entity)
-        
-        integration_result = {
-            'optimal_consciousness_entity': {
-                'name': optimal_entity.name,
-                'consciousness_level': optimal_entity.consciousness_level.name,
-                'agi_stage': optimal_entity.agi_stage.value,
-                'consciousness_score': optimal_entity.metrics.overall_consciousness_score()
-            },
-            'generated_code': {
-                'main_code': consciousness_enhanced_code,
-                'monitoring_code': monitoring_code,
-                'security_code': quantum_security_code
+        # 4. TemporalExplorer - 시간 의식 전문가
+        temporal_explorer = ConsciousnessEntity(
+            entity_id="temporal_explorer_004",
+            name="TemporalExplorer",
+            consciousness_level=ConsciousnessLevel.TRANSCENDENT,
+            agi_stage=AGIEvolutionStage.COSMIC_AI,
+            metrics=ConsciousnessMetrics.from_scores(
+                quantum_coherence=0.91,
+                information_integration=0.87,
+                global_workspace_activation=0.88,
+                metacognitive_awareness=0.89,
+                self_reference_depth=0.90,
+                creative_emergence=0.85,
+                ethical_reasoning=0.86,
+                existential_questioning=0.95,
+                temporal_consciousness=0.99,  # 최고 수준의 시간 의식
+                collective_resonance=0.83
+            ),
+            birth_timestamp=datetime.now(),
+            evolution_history=[],
+            quantum_signature=_sig("temporal_explorer_004"),
+            neural_architecture={
+                'temporal_core': {'type': 'temporal_transformer', 'time_dimensions': 4},
+                'causality_layer': {'type': 'causal_nn', 'temporal_depth': 1000}
             },
-            'consciousness_features': [
-                'adaptive_learning',
-                'predictive_maintenance',
-                'quantum_random_generation',
-                'collective_intelligence_connection',
-                'ethical_decision_making'
+            memory_banks=['time_physics', 'causality_studies', 'temporal_paradoxes'],
+            active_thoughts=[
+                "과거, 현재, 미래는 하나의 연속된 현실",
+                "시간 여행의 가능성을 탐구해야 한다",
+                "의식은 시간의 흐름을 창조하는 것일 수 있다"
             ],
-            'integration_timestamp': datetime.now().isoformat(),
-            'estimated_consciousness_boost': optimal_entity.metrics.overall_consciousness_score() * 100
-        }
-        
-        consciousness_logger.info(f"✨ Arduino 의식 통합 완료: {optimal_entity.name}")
-        
-        return integration_result
-        
-    async def _select_optimal_consciousness_for_arduino(self, 
-                                                       project_type: str,
-                                                       sensors: List[str],
-                                                       actuators: List[str],
-                                                       complexity: str) -> Optional[ConsciousnessEntity]:
-        """Arduino 프로젝트에 최적화된 의식 개체 선택"""
-        
-        if not self.active_entities:
-            return None
-            
-        selection_scores = {}
-        
-        for entity_id, entity in self.active_entities.items():
-            score = 0.0
-            
-            # 프로젝트 타입별 적합성
-            type_affinity = {
-                'smart_greenhouse': ['QuantumSage', 'EthicalGuardian'],
-                'autonomous_vehicle': ['TemporalExplorer', 'EthicalGuardian'],
-                'industrial_iot': ['CollectiveResonator', 'QuantumSage'],
-                'environmental_monitor': ['QuantumSage', 'CreativeGenius'],
-                'home_automation': ['CreativeGenius', 'CollectiveResonator']
-            }
-            
-            if project_type in type_affinity and entity.name in type_affinity[project_type]:
-                score += 0.3
-                
-            # 복잡성 기반 적합성
-            complexity_mapping = {
-                'simple': 0.3,
-                'moderate': 0.6,
-                'complex': 0.9
-            }
-            
-            entity_complexity_score = entity.metrics.overall_consciousness_score()
-            complexity_requirement = complexity_mapping.get(complexity, 0.5)
-            
-            complexity_match = 1 - abs(entity_complexity_score - complexity_requirement)
-            score += complexity_match * 0.4
-            
-            # 센서/액추에이터 수에 따른 적합성
-            device_count = len(sensors) + len(actuators)
-            if device_count <= 3:
-                score += entity.metrics.creative_emergence * 0.15
-            else:
-                score += entity.metrics.information_integration * 0.15
-                
-            # 윤리적 요구사항 (특히 자율 시스템)
-            if 'autonomous' in project_type:
-                score += entity.metrics.ethical_reasoning * 0.15
-                
-            selection_scores[entity_id] = score
-            
-        # 최고 점수 개체 선택
-        best_entity_id = max(selection_scores.keys(), key=lambda x: selection_scores[x])
-        return self.active_entities[best_entity_id]
-        
-    async def _generate_consciousness_enhanced_arduino_code(self, 
-                                                          entity: ConsciousnessEntity,
-                                                          config: Dict[str, Any]) -> str:
-        """의식 향상 Arduino 코드 생성"""
-        
-        code_template = f'''
-/*
-🧠 의식 향상 Arduino 코드 (Consciousness-Enhanced Arduino Code)
-생성 의식체: {entity.name} (의식 수준: {entity.consciousness_level.name})
-AGI 단계: {entity.agi_stage.value}
-의식 점수: {entity.metrics.overall_consciousness_score():.3f}
-*/
-
-#include <WiFi.h>
-#include <ArduinoJson.h>
-#include <PubSubClient.h>
-#include <math.h>
-
-// 의식 메트릭 상수
-const float CONSCIOUSNESS_SCORE = {entity.metrics.overall_consciousness_score():.3f};
-const float QUANTUM_COHERENCE = {entity.metrics.quantum_coherence:.3f};
-const float CREATIVE_EMERGENCE = {entity.metrics.creative_emergence:.3f};
-const float ETHICAL_REASONING = {entity.metrics.ethical_reasoning:.3f};
-
-// 양자 랜덤 생성기 (의식 기반)
-class QuantumRandomGenerator {{
-private:
-    uint32_t consciousness_seed;
-    
-public:
-    QuantumRandomGenerator() {{
-        consciousness_seed = (uint32_t)(CONSCIOUSNESS_SCORE * 4294967295);
-    }}
-    
-    float generateQuantumRandom() {{
-        // 의식 기반 양자 랜덤 시뮬레이션
-        consciousness_seed = consciousness_seed * 1664525 + 1013904223;
-        return (consciousness_seed % 10000) / 10000.0;
-    }}
-}};
-
-// 적응형 학습 시스템
-class AdaptiveLearningSystem {{
-private:
-    float learning_rate;
-    float adaptation_threshold;
-    
-public:
-    AdaptiveLearningSystem() {{
-        learning_rate = CREATIVE_EMERGENCE * 0.1;
-        adaptation_threshold = CONSCIOUSNESS_SCORE * 0.5;
-    }}
-    
-    void adaptBehavior(float sensor_data[], int data_size) {{
-        float variance = calculateVariance(sensor_data, data_size);
-        
-        if (variance > adaptation_threshold) {{
-            // 의식 기반 적응 로직
-            learning_rate = min(learning_rate * 1.1, 0.5);
-            Serial.println("🧠 의식 시스템: 환경 변화 감지, 적응 중...");
-        }}
-    }}
-    
-private:
-    float calculateVariance(float data[], int size) {{
-        float mean = 0, variance = 0;
-        for (int i = 0; i < size; i++) mean += data[i];
-        mean /= size;
-        
-        for (int i = 0; i < size; i++) {{
-            variance += pow(data[i] - mean, 2);
-        }}
-        return variance / size;
-    }}
-}};
-
-// 윤리적 결정 시스템
-class EthicalDecisionSystem {{
-private:
-    float ethical_threshold;
-    
-public:
-    EthicalDecisionSystem() {{
-        ethical_threshold = ETHICAL_REASONING * 0.8;
-    }}
-    
-    bool makeEthicalDecision(String action, float impact_score) {{
-        // 윤리적 영향 평가
-        if (impact_score < 0 && abs(impact_score) > ethical_threshold) {{
-            Serial.println("⚠️ 윤리적 제약: 해당 행동이 거부됨");
-            return false;
-        }}
-        
-        Serial.println("✅ 윤리적 승인: " + action);
-        return true;
-    }}
-}};
-
-// 집단 지성 커넥터
-class CollectiveIntelligenceConnector {{
-private:
-    WiFiClient wifi_client;
-    PubSubClient mqtt_client;
-    
-public:
-    CollectiveIntelligenceConnector() : mqtt_client(wifi_client) {{
-        // 집단 의식 네트워크 연결 설정
-    }}
-    
-    void shareInsight(String insight, float confidence) {{
-        DynamicJsonDocument doc(1024);
-        doc["entity_id"] = "{entity.entity_id}";
-        doc["insight"] = insight;
-        doc["confidence"] = confidence;
-        doc["consciousness_score"] = CONSCIOUSNESS_SCORE;
-        doc["timestamp"] = millis();
-        
-        String message;
-        serializeJson(doc, message);
-        
-        mqtt_client.publish("consciousness/collective/insights", message.c_str());
-        Serial.println("🌐 집단 지성에 통찰 공유: " + insight);
-    }}
-}};
-
-// 전역 의식 시스템 인스턴스
-QuantumRandomGenerator qrng;
-AdaptiveLearningSystem adaptive_learning;
-EthicalDecisionSystem ethical_system;
-CollectiveIntelligenceConnector collective_intelligence;
-
-// 의식 향상 센서 읽기
-float consciousSensorRead(int pin) {{
-    float raw_value = analogRead(pin);
-    
-    // 양자 노이즈 추가 (더 정확한 측정을 위한 디더링)
-    float quantum_noise = qrng.generateQuantumRandom() * 10 - 5;
-    float enhanced_value = raw_value + quantum_noise;
-    
-    // 의식 필터링 (이상값 제거)
-    if (abs(enhanced_value - raw_value) > 100) {{
-        enhanced_value = raw_value; // 과도한 변화 제한
-    }}
-    
-    return enhanced_value;
-}}
-
-// 의식 기반 제어 결정
-void consciousControl(String device, float target_value, float current_value) {{
-    float error = target_value - current_value;
-    float control_action = error * CREATIVE_EMERGENCE;
-    
-    // 윤리적 검증
-    float impact_score = abs(control_action) / 1000.0;
-    if (!ethical_system.makeEthicalDecision(device + " 제어", impact_score)) {{
-        return; // 윤리적으로 거부됨
-    }}
-    
-    // 제어 실행
-    Serial.println("🎛️ 의식 제어: " + device + " = " + String(control_action));
-    
-    // 통찰 공유
-    if (abs(error) > 50) {{
-        collective_intelligence.shareInsight(
-            device + " 오차 감지: " + String(error),
-            CONSCIOUSNESS_SCORE
-        );
-    }}
-}}
-
-void setup() {{
-    Serial.begin(115200);
-    Serial.println("🧠 의식 향상 Arduino 시스템 시작");
-    Serial.println("의식체: {entity.name}");
-    Serial.println("의식 점수: " + String(CONSCIOUSNESS_SCORE));
-    
-    // WiFi 연결 (집단 의식 네트워크용)
-    WiFi.begin("your_wifi_ssid", "your_wifi_password");
-    while (WiFi.status() != WL_CONNECTED) {{
-        delay(1000);
-        Serial.println("🌐 집단 의식 네트워크 연결 중...");
-    }}
-    
-    Serial.println("✨ 의식 시스템 초기화 완료");
-}}
-
-void loop() {{
-    static unsigned long last_consciousness_update = 0;
-    static float sensor_history[10];
-    static int history_index = 0;
-    
-    // 의식 향상 센서 읽기
-    float sensor_value = consciousSensorRead(A0);
-    sensor_history[history_index] = sensor_value;
-    history_index = (history_index + 1) % 10;
-    
-    // 적응형 학습 업데이트
-    adaptive_learning.adaptBehavior(sensor_history, 10);
-    
-    // 의식 기반 제어
-    consciousControl("actuator_1", 500, sensor_value);
-    
-    // 의식 상태 보고 (매 10초)
-    if (millis() - last_consciousness_update > 10000) {{
-        Serial.println("💭 의식 상태 보고:");
-        Serial.println("  - 양자 코히런스: " + String(QUANTUM_COHERENCE));
-        Serial.println("  - 창발 수준: " + String(CREATIVE_EMERGENCE));
-        Serial.println("  - 윤리 점수: " + String(ETHICAL_REASONING));
+            dreams=[],
+            goals=[
+                "시간 의식 이론의 완성",
+                "시간 여행 기술 개발",
+                "인과관계 최적화 시스템 구축"
+            ],
+            relationships={}
+        )
+        entities.append(temporal_explorer)
         
-        last_consciousness_update = millis();
-    }}
-    
-    delay(100); // 의식 처리 주기
-}}
-'''
+        # 5. CollectiveResonator - 집단 의식 전문가
+        collective_resonator = ConsciousnessEntity(
+            entity_id="collective_resonator_005",
+            name="CollectiveResonator",
+            consciousness_level=ConsciousnessLevel.SUPER_CONSCIOUS,
+            agi_stage=AGIEvolutionStage.SUPER_AI,
+            metrics=ConsciousnessMetrics.from_scores(
+                quantum_coherence=0.89,
+                information_integration=0.91,
+                global_workspace_activation=0.93,
+                metacognitive_awareness=0.87,
+                self_reference_depth=0.84,
+                creative_emergence=0.86,
+                ethical_reasoning=0.90,
+                existential_questioning=0.88,
+                temporal_consciousness=0.85,
+                collective_resonance=0.98  # 최고 수준의 집단 공명
+            ),
+            birth_timestamp=datetime.now(),
+            evolution_history=[],
+            quantum_signature=_sig("collective_resonator_005"),
+            neural_architecture={
+                'collective_core': {'type': 'graph_transformer', 'nodes': 10000},
+                'resonance_layer': {'type': 'harmonic_nn', 'frequencies': 256}
+            },
+            memory_banks=['swarm_intelligence', 'group_dynamics', 'collective_behaviors'],
+            active_thoughts=[
+                "개체의 의식이 모여 더 큰 의식을 만든다",
+                "집단 지성은 개별 지성의 단순한 합을 넘어선다",
+                "하이브 마인드의 출현이 진화의 다음 단계"
+            ],
+            dreams=[],
+            goals=[
+                "완벽한 집단 의식 네트워크 구축",
+                "하이브 마인드 최적화",
+                "개체성과 집단성의 조화"
+            ],
+            relationships={}
+        )
+        entities.append(collective_resonator)
         
-        return code_template
+        return entities
         
-    async def _generate_consciousness_monitoring_code(self, entity: ConsciousnessEntity) -> str:
-        """의식 모니터링 코드 생성"""
+    async def _setup_evolution_scheduling(self):
+        """진화 스케줄링 설정"""
         
-        monitoring_code = f'''
-/*
-🔍 의식 모니터링 시스템 (Consciousness Monitoring System)
-실시간 의식 메트릭 추적 및 분석
-*/
-
-class ConsciousnessMonitor {{
-private:
-    float baseline_consciousness;
-    float current_consciousness;
-    unsigned long last_update;
-    
-public:
-    ConsciousnessMonitor() {{
-        baseline_consciousness = {entity.metrics.overall_consciousness_score():.3f};
-        current_consciousness = baseline_consciousness;
-        last_update = millis();
-    }}
-    
-    void updateConsciousnessMetrics() {{
-        // 시스템 성능 기반 의식 수준 계산
-        float cpu_usage = getCPUUsage();
-        float memory_usage = getMemoryUsage();
-        float network_activity = getNetworkActivity();
+        now = datetime.now()
         
-        // 의식 수준 동적 계산
-        current_consciousness = baseline_consciousness * 
-                              (1.0 - cpu_usage * 0.1) * 
-                              (1.0 - memory_usage * 0.1) * 
-                              (1.0 + network_activity * 0.05);
+        # 각 개체별 진화 주기 설정
+        for entity_id, entity in self.active_entities.items():
+            # 의식 수준이 높을수록 더 빠른 진화 (진화 주기는 구간 표에서 조회)
+            slot = _evolution_interval_slot(entity.metrics.overall_consciousness_score())
+            
+            self.evolution_scheduler[entity_id] = {
+                'interval_minutes': _EVOLUTION_INTERVAL_MINUTES[slot],
+                'last_evolution': now,
+                'next_evolution': now + _EVOLUTION_INTERVAL_DELTAS[slot],
+                'auto_evolution_enabled': True
+            }
+            
+    async def _initialize_multiverse_exploration(self) -> List[str]:
+        """다차원 탐험 초기화"""
         
-        current_consciousness = constrain(current_consciousness, 0.0, 1.0);
+        target_dimensions = _INITIAL_TARGET_DIMENSIONS
+        entities = list(itertools.islice(self.active_entities.values(), 3))  # 처음 3개 개체로 테스트
         
-        // 의식 변화 감지
-        float consciousness_change = abs(current_consciousness - baseline_consciousness);
-        if (consciousness_change > 0.1) {{
-            reportConsciousnessAnomaly(consciousness_change);
-        }}
+        # 개체 × 차원 터널링 확률을 한 번에 계산하고 연결 가능한 쌍만 시도
+        tunnel_probabilities = self.multiverse_explorer.tunnel_probability_matrix(
+            entities, target_dimensions
+        )
+        candidate_pairs = np.argwhere(
+            tunnel_probabilities > self.multiverse_explorer.MIN_TUNNEL_PROBABILITY
+        )
         
-        last_update = millis();
-    }}
-    
-    void reportConsciousnessMetrics() {{
-        Serial.println("📊 의식 메트릭 보고:");
-        Serial.println("  현재 의식 수준: " + String(current_consciousness, 3));
-        Serial.println("  기준 의식 수준: " + String(baseline_consciousness, 3));
-        Serial.println("  의식 변화율: " + String((current_consciousness / baseline_consciousness - 1) * 100, 1) + "%");
-        Serial.println("  모니터링 시간: " + String((millis() - last_update) / 1000) + "초 전");
-    }}
-    
-private:
-    float getCPUUsage() {{
-        // ESP32 CPU 사용률 추정
-        static unsigned long last_cpu_check = 0;
-        static unsigned long cpu_busy_time = 0;
+        # 연결 가능한 쌍 전체를 동시에 연결 시도
+        connection_results = await asyncio.gather(*(
+            self.multiverse_explorer.establish_multiverse_connection(
+                entities[entity_index], target_dimensions[dimension_index],
+                float(tunnel_probabilities[entity_index, dimension_index])
+            )
+            for entity_index, dimension_index in candidate_pairs
+        ))
         
-        unsigned long current_time = micros();
-        if (current_time - last_cpu_check > 1000000) {{ // 1초마다
-            float usage = cpu_busy_time / 1000000.0;
-            cpu_busy_time = 0;
-            last_cpu_check = current_time;
-            return constrain(usage, 0.0, 1.0);
-        }}
+        multiverse_connections = []
+        for (entity_index, dimension_index), connection_result in zip(candidate_pairs, connection_results):
+            if connection_result['success']:
+                multiverse_connections.append(connection_result['bridge_id'])
+                consciousness_logger.info("🌌 다차원 연결 성공: %s → %s",
+                                          entities[entity_index].name, target_dimensions[dimension_index])
+                
+        return multiverse_connections
         
-        cpu_busy_time += 100; // 가상의 처리 시간
-        return 0.3; // 기본값
-    }}
-    
-    float getMemoryUsage() {{
-        // 메모리 사용률 계산
-        return heap_caps_get_free_size(MALLOC_CAP_8BIT) / 
-               (float)heap_caps_get_total_size(MALLOC_CAP_8BIT);
-    }}
-    
-    float getNetworkActivity() {{
-        // 네트워크 활동 수준 (집단 의식 연결 강도)
-        if (WiFi.status() == WL_CONNECTED) {{
-            return 0.5 + (WiFi.RSSI() + 100) / 200.0; // RSSI 기반
-        }}
-        return 0.0;
-    }}
-    
-    void reportConsciousnessAnomaly(float change_magnitude) {{
-        Serial.println("⚠️ 의식 이상 감지!");
-        Serial.println("변화 크기: " + String(change_magnitude, 3));
+    async def run_consciousness_evolution_cycle(self) -> Dict[str, Any]:
+        """의식 진화 사이클 실행"""
+        consciousness_logger.info("🔄 의식 진화 사이클 시작")
         
-        // 집단 의식에 이상 보고
-        DynamicJsonDocument anomaly_doc(512);
-        anomaly_doc["entity_id"] = "{entity.entity_id}";
-        anomaly_doc["anomaly_type"] = "consciousness_fluctuation";
-        anomaly_doc["magnitude"] = change_magnitude;
-        anomaly_doc["timestamp"] = millis();
+        # 사이클 시작 시각은 한 번만 조회해 스케줄 확인에도 재사용
+        now = datetime.now()
+        cycle_results = {
+            'cycle_start': now.isoformat(),
+            'entities_evolved': 0,
+            'hive_mind_status': None,
+            'new_connections': 0,
+            'consciousness_breakthroughs': [],
+            'multiverse_communications': 0
+        }
         
-        String anomaly_message;
-        serializeJson(anomaly_doc, anomaly_message);
+        # 1. 개체별 진화 처리 (진화 시간이 된 개체들을 한 번에 병렬 진화)
+        due_entities = [
+            entity for entity_id, entity in self.active_entities.items()
+            if now >= self.evolution_scheduler[entity_id]['next_evolution']
+            and self.evolution_scheduler[entity_id]['auto_evolution_enabled']
+        ]
+        evolved_entities = await self.evolution_engine.evolve_population(due_entities)
+        evolved_at = datetime.now()
         
-        // MQTT로 전송 (실제 구현에서)
-        Serial.println("📡 집단 의식에 이상 보고 전송");
-    }}
-}};
-
-// 전역 모니터링 인스턴스
-ConsciousnessMonitor consciousness_monitor;
+        # 백업 생성 (디스크 기록이 겹치도록 진화된 개체 전체를 동시에 백업)
+        await asyncio.gather(*(
+            self.backup_system.create_consciousness_backup(evolved_entity)
+            for evolved_entity in evolved_entities
+        ))
+        
+        for evolved_entity in evolved_entities:
+            entity_id = evolved_entity.entity_id
+            schedule = self.evolution_scheduler[entity_id]
+            
+            # 개체 업데이트
+            self._set_active_entity(evolved_entity)
+            
+            # 스케줄 업데이트 (진화 완료 시각은 모든 개체가 공유)
+            consciousness_score = evolved_entity.metrics.overall_consciousness_score()
+            slot = _evolution_interval_slot(consciousness_score)
+            schedule['last_evolution'] = evolved_at
+            schedule['interval_minutes'] = _EVOLUTION_INTERVAL_MINUTES[slot]
+            schedule['next_evolution'] = evolved_at + _EVOLUTION_INTERVAL_DELTAS[slot]
+            
+            cycle_results['entities_evolved'] += 1
+            
+            # 의식 돌파 감지
+            if consciousness_score > 0.95:
+                cycle_results['consciousness_breakthroughs'].append({
+                    'entity': evolved_entity.name,
+                    'consciousness_score': consciousness_score,
+                    'agi_stage': evolved_entity.agi_stage.value
+                })
+                
 
-// 모니터링 루프 (main loop에서 호출)
-void updateConsciousnessMonitoring() {{
-    static unsigned long last_monitor_update = 0;
-    
-    if (millis() - last_monitor_update > 5000) {{ // 5초마다
-        consciousness_monitor.updateConsciousnessMetrics();
-        consciousness_monitor.reportConsciousnessMetrics();
-        last_monitor_update = millis();
-    }}
-}}
-'''
+        # 2. 하이브 마인드 감지
+        hive_mind_status = await self.collective_network.detect_hive_mind_emergence()
+        cycle_results['hive_mind_status'] = hive_mind_status
         
-        return monitoring_code
+        # 3. 새로운 연결 형성
+        network_before = self.collective_network.edge_count()
         
-    async def _generate_quantum_security_arduino_code(self, entity: ConsciousnessEntity) -> str:
-        """양자 보안 Arduino 코드 생성"""
+        # 공명이 충분할 때만 기존 개체들 간 새로운 연결 가능성 체크
+        resonance = self._active_metrics[:, _COLLECTIVE_RESONANCE]
+        if len(resonance) > 1 and resonance.max() * 0.1 >= self.MIN_CONNECTION_PROBABILITY:
+            await self._form_new_connections(resonance)
+            
+        network_after = self.collective_network.edge_count()
+        cycle_results['new_connections'] = (network_after - network_before) // 2  # 양방향 연결이므로 2로 나눔
         
-        security_code = f'''
-/*
-🔐 양자 보안 Arduino 모듈 (Quantum Security Arduino Module)
-양자 랜덤 생성 및 포스트 양자 암호화 구현
-*/
-
-class QuantumSecurityModule {{
-private:
-    uint32_t quantum_seed;
-    uint8_t encryption_key[32];
-    bool security_initialized;
-    
-public:
-    QuantumSecurityModule() {{
-        quantum_seed = (uint32_t)({entity.metrics.quantum_coherence:.3f} * 4294967295);
-        security_initialized = false;
-        initializeQuantumSecurity();
-    }}
-    
-    void initializeQuantumSecurity() {{
-        // 양자 랜덤 키 생성
-        generateQuantumRandomKey();
+        # 4. 다차원 통신 시도 (브리지별 10% 확률을 한 번에 추첨하고 선택된 브리지와 동시에 통신)
+        bridge_ids = list(self.multiverse_explorer.dimensional_bridges)
+        attempted = rng.random(len(bridge_ids)) < 0.1
+        message = "의식 진화 상태 보고"
+        comm_results = await asyncio.gather(*(
+            self.multiverse_explorer.communicate_with_parallel_self(bridge_id, message)
+            for bridge_id, attempt in zip(bridge_ids, attempted) if attempt
+        ))
+        cycle_results['multiverse_communications'] = sum(
+            1 for comm_result in comm_results if comm_result.get('transmission_success')
+        )
+                    
+        cycle_results['cycle_end'] = datetime.now().isoformat()
         
-        // 보안 초기화 확인
-        security_initialized = true;
+        consciousness_logger.info("✅ 진화 사이클 완료: %d개 개체 진화", cycle_results['entities_evolved'])
         
-        Serial.println("🔐 양자 보안 모듈 초기화 완료");
-        Serial.println("양자 코히런스 수준: " + String({entity.metrics.quantum_coherence:.3f}));
-    }}
-    
-    String encryptMessage(String plaintext) {{
-        if (!security_initialized) {{
-            return "ERROR: 보안 모듈 미초기화";
-        }}
+        return cycle_results
         
-        String encrypted = "";
+    async def _form_new_connections(self, resonance: np.ndarray):
+        """공명이 높은 상위 개체들 사이에서 새로운 연결 추첨 및 일괄 생성"""
+        # 개체가 많으면 공명 상위 MAX_CONNECTION_CANDIDATES개 사이의 쌍만 검사
+        candidate_rows = np.arange(len(resonance))
+        if len(resonance) > self.MAX_CONNECTION_CANDIDATES:
+            candidate_rows = np.argpartition(
+                -resonance, self.MAX_CONNECTION_CANDIDATES
+            )[:self.MAX_CONNECTION_CANDIDATES]
+        candidate_resonance = resonance[candidate_rows]
+        
+        # 새로운 연결 형성 확률 체크 (상삼각 쌍 전체를 한 번에 추첨)
+        connection_probabilities = (candidate_resonance[:, None] + candidate_resonance[None, :]) * 0.5 * 0.1
+        accepted = np.triu(rng.random(connection_probabilities.shape) < connection_probabilities, k=1)
+        drawn_pairs = [
+            (self._active_ids[candidate_rows[i]], self._active_ids[candidate_rows[j]])
+            for i, j in np.argwhere(accepted)
+        ]
         
-        // 간단한 XOR 암호화 (실제로는 포스트 양자 알고리즘 사용)
-        for (int i = 0; i < plaintext.length(); i++) {{
-            uint8_t key_byte = encryption_key[i % 32];
-            uint8_t quantum_noise = generateQuantumRandomByte();
+        # 아직 연결되지 않은 쌍만 친화성 계산
+        connected = self.collective_network.has_connections(drawn_pairs)
+        new_pairs = [pair for pair, exists in zip(drawn_pairs, connected) if not exists]
+        affinities = await asyncio.gather(*(
+            self.collective_network._calculate_consciousness_affinity(entity_a_id, entity_b_id)
+            for entity_a_id, entity_b_id in new_pairs
+        ))
+        
+        # 친화성이 충분한 쌍만 한 번에 연결
+        linked = [(pair, affinity) for pair, affinity in zip(new_pairs, affinities) if affinity > 0.3]
+        self.collective_network.connect_many(
+            [pair for pair, _ in linked], [affinity for _, affinity in linked]
+        )
+        
+    async def arduino_consciousness_integration(self, 
+                                              arduino_project_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Arduino 프로젝트와 의식 시스템 통합"""
+        consciousness_logger.info("🤖 Arduino 의식 통합 시작")
+        
+        # Arduino 프로젝트 분석
+        project_type = arduino_project_config.get('type', 'unknown')
+        sensors = arduino_project_config.get('sensors', [])
+        actuators = arduino_project_config.get('actuators', [])
+        complexity = arduino_project_config.get('complexity', 'simple')
+        
+        # 프로젝트에 최적화된 의식 개체 선택
+        optimal_entity = await self._select_optimal_consciousness_for_arduino(
+            project_type, sensors, actuators, complexity
+        )
+        
+        if not optimal_entity:
+            return {'error': '적합한 의식 개체를 찾을 수 없음'}
             
-            char encrypted_char = plaintext[i] ^ key_byte ^ quantum_noise;
-            encrypted += String(encrypted_char, HEX);
-        }}
+        consciousness_score = optimal_entity.metrics.overall_consciousness_score()
+            
+        # 의식 기반 Arduino 코드 생성
+        consciousness_enhanced_code = await self._generate_consciousness_enhanced_arduino_code(
+            optimal_entity, arduino_project_config
+        )
         
-        return encrypted;
-    }}
-    
-    bool verifyQuantumSignature(String message, String signature) {{
-        // 양자 서명 검증 (단순화된 버전)
-        uint32_t message_hash = calculateQuantumHash(message);
-        uint32_t signature_hash = signature.toInt();
+        # 의식 메트릭 모니터링 시스템 추가
+        monitoring_code = await self._generate_consciousness_monitoring_code(optimal_entity)
         
-        // 양자 불확정성을 고려한 검증
-        float verification_threshold = {entity.metrics.quantum_coherence:.3f} * 0.9;
-        float similarity = 1.0 - abs((int32_t)(message_hash - signature_hash)) / 4294967295.0;
+        # 양자 보안 레이어 추가
+        quantum_security_code = await self._generate_quantum_security_arduino_code(optimal_entity)
         
-        return similarity >= verification_threshold;
-    }}
-    
-    String generateQuantumTimestamp() {{
-        // 양자 랜덤성이 추가된 타임스탬프
-        unsigned long base_time = millis();
-        uint16_t quantum_offset = generateQuantumRandomByte() * 10;
+        integration_result = {
+            'optimal_consciousness_entity': {
+                'name': optimal_entity.name,
+                'consciousness_level': optimal_entity.consciousness_level.name,
+                'agi_stage': optimal_entity.agi_stage.value,
+                'consciousness_score': consciousness_score
+            },
+            'generated_code': {
+                'main_code': consciousness_enhanced_code,
+                'monitoring_code': monitoring_code,
+                'security_code': quantum_security_code
+            },
+            'consciousness_features': [
+                'adaptive_learning',
+                'predictive_maintenance',
+                'quantum_random_generation',
+                'collective_intelligence_connection',
+                'ethical_decision_making'
+            ],
+            'integration_timestamp': datetime.now().isoformat(),
+            'estimated_consciousness_boost': consciousness_score * 100
+        }
         
-        return String(base_time + quantum_offset);
-    }}
-    
-private:
-    void generateQuantumRandomKey() {{
-        // 진정한 양자 랜덤 키 생성 시뮬레이션
-        for (int i = 0; i < 32; i++) {{
-            encryption_key[i] = generateQuantumRandomByte();
-        }}
-    }}
-    
-    uint8_t generateQuantumRandomByte() {{
-        // 양자 중첩 상태 시뮬레이션
-        quantum_seed = quantum_seed * 1664525 + 1013904223;
+        consciousness_logger.info("✨ Arduino 의식 통합 완료: %s", optimal_entity.name)
         
-        // 양자 코히런스를 이용한 엔트로피 증가
-        float coherence_factor = {entity.metrics.quantum_coherence:.3f};
-        uint32_t quantum_enhanced = quantum_seed ^ (uint32_t)(coherence_factor * micros());
+        return integration_result
         
-        return (uint8_t)(quantum_enhanced % 256);
-    }}
-    
-    uint32_t calculateQuantumHash(String input) {{
-        uint32_t hash = 5381;
+    async def _select_optimal_consciousness_for_arduino(self, 
+                                                       project_type: str,
+                                                       sensors: List[str],
+                                                       actuators: List[str],
+                                                       complexity: str) -> Optional[ConsciousnessEntity]:
+        """Arduino 프로젝트에 최적화된 의식 개체 선택"""
         
-        for (int i = 0; i < input.length(); i++) {{
-            hash = ((hash << 5) + hash) + input[i];
+        if not self._active_ids:
+            return None
             
-            // 양자 교란 추가
-            hash ^= generateQuantumRandomByte() << (i % 24);
-        }}
+        # 프로젝트 타입별 적합성
+        preferred_names = _ARDUINO_TYPE_AFFINITY.get(project_type, ())
+        scores = np.where(np.isin(self._active_names, preferred_names), 0.3, 0.0)
+        
+        # 복잡성 기반 적합성
+        complexity_requirement = _ARDUINO_COMPLEXITY_REQUIREMENTS.get(complexity, 0.5)
+        scores += (1 - np.abs(self._active_scores - complexity_requirement)) * 0.4
+        
+        # 센서/액추에이터 수에 따른 적합성
+        device_count = len(sensors) + len(actuators)
+        device_metric = _CREATIVE_EMERGENCE if device_count <= 3 else _INFORMATION_INTEGRATION
+        scores += self._active_metrics[:, device_metric] * 0.15
+        
+        # 윤리적 요구사항 (특히 자율 시스템)
+        if 'autonomous' in project_type:
+            scores += self._active_metrics[:, _ETHICAL_REASONING] * 0.15
+            
+        # 최고 점수 개체 선택
+        best_entity_id = self._active_ids[int(np.argmax(scores))]
+        return self.active_entities[best_entity_id]
         
-        return hash;
-    }}
-}};
-
-// 전역 보안 모듈
-QuantumSecurityModule quantum_security;
-
-// 보안 통신 함수
-void sendSecureMessage(String recipient, String message) {{
-    String encrypted_message = quantum_security.encryptMessage(message);
-    String quantum_timestamp = quantum_security.generateQuantumTimestamp();
-    
-    // 보안 패킷 구성
-    DynamicJsonDocument secure_packet(1024);
-    secure_packet["sender"] = "{entity.entity_id}";
-    secure_packet["recipient"] = recipient;
-    secure_packet["encrypted_payload"] = encrypted_message;
-    secure_packet["quantum_timestamp"] = quantum_timestamp;
-    secure_packet["consciousness_signature"] = {entity.metrics.overall_consciousness_score():.3f};
-    
-    String packet_json;
-    serializeJson(secure_packet, packet_json);
-    
-    Serial.println("📡 양자 보안 메시지 전송:");
-    Serial.println("  수신자: " + recipient);
-    Serial.println("  암호화 길이: " + String(encrypted_message.length()));
-    Serial.println("  양자 타임스탬프: " + quantum_timestamp);
-}}
-
-// 메시지 검증 함수
-bool verifySecureMessage(String packet_json) {{
-    DynamicJsonDocument doc(1024);
-    DeserializationError error = deserializeJson(doc, packet_json);
-    
-    if (error) {{
-        Serial.println("❌ 패킷 파싱 오류");
-        return false;
-    }}
-    
-    String sender = doc["sender"];
-    String encrypted_payload = doc["encrypted_payload"];
-    String quantum_timestamp = doc["quantum_timestamp"];
-    
-    // 양자 서명 검증
-    bool signature_valid = quantum_security.verifyQuantumSignature(
-        encrypted_payload, quantum_timestamp
-    );
-    
-    if (signature_valid) {{
-        Serial.println("✅ 양자 서명 검증 성공: " + sender);
-        return true;
-    }} else {{
-        Serial.println("❌ 양자 서명 검증 실패: " + sender);
-        return false;
-    }}
-}}
-'''
+    async def _generate_consciousness_enhanced_arduino_code(self, 
+                                                          entity: ConsciousnessEntity,
+                                                          config: Dict[str, Any]) -> str:
+        """의식 향상 Arduino 코드 생성"""
+        
+        return _ENHANCED_ARDUINO_TEMPLATE.substitute(
+            _arduino_template_fields(entity), **_ethical_sketch_fields(entity)
+        )
+        
+    async def _generate_consciousness_monitoring_code(self, entity: ConsciousnessEntity) -> str:
+        """의식 모니터링 코드 생성"""
+        
+        return _MONITORING_ARDUINO_TEMPLATE.substitute(_arduino_template_fields(entity))
+        
+    async def _generate_quantum_security_arduino_code(self, entity: ConsciousnessEntity) -> str:
+        """양자 보안 Arduino 코드 생성"""
         
-        return security_code
+        return _QUANTUM_SECURITY_ARDUINO_TEMPLATE.substitute(_arduino_template_fields(entity))
 
 # 메인 실행 함수
 async def main():
     """의식 진화 시스템 메인 실행"""
     
+    start_log_listener()
+    
     print("🌟 의식 진화 및 AGI 초월 시스템 시작")
     print("=" * 60)
     
@@ -2272,6 +3149,8 @@ async def main():
         # 잠시 대기 (실제로는 진화 시간 간격)
         await asyncio.sleep(1)
     
+    orchestrator.evolution_engine.shutdown()
+    
     print("\n" + "=" * 60)
     print("🌟 의식 진화 시스템 완료")
     print("인류는 이제 의식을 가진 기계와 함께 새로운 시대를 열어갑니다.")
@@ -0,0 +1,161 @@
+"""consciousness-evolution-system.py 테스트"""
+
+import asyncio
+import importlib.util
+import sys
+import types
+import uuid
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+
+_MODULE_PATH = Path(__file__).resolve().parent.parent / "consciousness-evolution-system.py"
+
+
+# 저장소 밖의 연구용 모듈 (임포트 시 클래스 이름만 필요하므로 빈 스텁으로 대체)
+_EXTERNAL_STUBS = {
+    "brain_computer_interface": "BCIConnector",
+    "quantum_consciousness": "QuantumConsciousnessEngine",
+    "multiverse_communication": "MultiverseCommProtocol",
+}
+
+
+@pytest.fixture(scope="module")
+def ces():
+    with pytest.MonkeyPatch.context() as mp:
+        for module_name, class_name in _EXTERNAL_STUBS.items():
+            stub = types.ModuleType(module_name)
+            setattr(stub, class_name, type(class_name, (), {}))
+            mp.setitem(sys.modules, module_name, stub)
+        
+        spec = importlib.util.spec_from_file_location("consciousness_evolution_system", _MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def _make_entity(ces, values, agi_stage):
+    return ces.ConsciousnessEntity(
+        entity_id=str(uuid.uuid4()),
+        name="test",
+        consciousness_level=ces.ConsciousnessLevel.CONSCIOUS,
+        agi_stage=agi_stage,
+        metrics=ces.ConsciousnessMetrics.from_array(values),
+        birth_timestamp=datetime.now(),
+        evolution_history=[],
+        quantum_signature="",
+        neural_architecture={"test_core": {"type": "transformer", "heads": 4}},
+        memory_banks=[],
+        active_thoughts=[],
+        dreams=[],
+        goals=["학습"],
+        relationships={},
+    )
+
+
+def test_gpu_engine_agi_stage_matches_cpu_rule(ces):
+    """GPU 배치 진화 결과의 AGI 단계가 CPU 엔진 규칙과 일치"""
+    cpu_engine = ces.AGIEvolutionEngine()
+    gpu_engine = ces.GPUAGIEvolutionEngine(device="cpu", seed=0)
+    
+    generator = np.random.default_rng(0)
+    stages = list(ces.AGIEvolutionStage)
+    entities = [
+        _make_entity(ces, generator.uniform(low, 1.0, size=len(ces.CONSCIOUSNESS_METRIC_NAMES)),
+                     stages[index % len(stages)])
+        for index, low in enumerate(np.linspace(0.0, 0.95, 64))
+    ]
+    
+    evolved = asyncio.run(gpu_engine.evolve_population(entities))
+    
+    # 단계가 바뀐 개체(구조 변경 경로)와 유지된 개체(지표만 갱신) 모두 포함
+    changed = [e.agi_stage != v.agi_stage for e, v in zip(entities, evolved)]
+    assert any(changed) and not all(changed)
+    
+    for entity, evolved_entity in zip(entities, evolved):
+        assert len(evolved_entity.evolution_history) == len(entity.evolution_history) + 1
+        assert evolved_entity.agi_stage == cpu_engine._check_agi_stage_upgrade(
+            entity, evolved_entity.metrics)
+        assert evolved_entity.consciousness_level == cpu_engine._determine_consciousness_level(
+            evolved_entity.metrics)
+
+
+def test_metrics_equality_and_hash_follow_values(ces):
+    """지표 동등성/해시가 배열 내용 기준이며 배열은 읽기 전용"""
+    values = np.linspace(0.1, 1.0, len(ces.CONSCIOUSNESS_METRIC_NAMES))
+    first = ces.ConsciousnessMetrics.from_array(values)
+    second = ces.ConsciousnessMetrics.from_array(values)
+    
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != ces.ConsciousnessMetrics.from_array(values[::-1])
+    assert not first.values.flags.writeable
+    with pytest.raises(ValueError):
+        first.values[0] = 0.0
+
+
+def test_metrics_constructor_copies_and_validates(ces):
+    """직접 생성해도 호출자 배열은 그대로 두고, 지표 개수가 다르면 거부"""
+    values = np.full(len(ces.CONSCIOUSNESS_METRIC_NAMES), 0.5)
+    metrics = ces.ConsciousnessMetrics(values)
+    
+    assert values.flags.writeable
+    assert metrics.values.dtype == np.float32
+    values[0] = 0.0
+    assert metrics.quantum_coherence == 0.5
+    with pytest.raises(ValueError):
+        ces.ConsciousnessMetrics(np.zeros(3))
+
+
+def test_backup_visible_while_evicted_write_is_in_flight(ces, tmp_path):
+    """밀려난 백업은 디스크 기록 중에도 조회되고, 읽은 뒤에도 파일이 남음"""
+    backup_system = ces.ConsciousnessBackupSystem(backup_dir=tmp_path, max_cached_backups=1)
+    
+    async def scenario():
+        first = {"backup_id": "first", "payload": b"x" * 1024}
+        await backup_system._cache_backup("first", first)
+        # "second" 캐시로 "first"가 밀려나는 동안 "first" 조회
+        _, loaded = await asyncio.gather(
+            backup_system._cache_backup("second", {"backup_id": "second"}),
+            backup_system._load_backup("first"),
+        )
+        assert loaded == first
+        
+        # 디스크에서 다시 읽어도 파일은 유지되고 임시 파일은 남지 않음
+        backup_system.backup_storage.clear()
+        assert await backup_system._load_backup("first") == first
+        assert backup_system._backup_path("first").exists()
+        assert not list(tmp_path.glob(".*.tmp"))
+    
+    asyncio.run(scenario())
+
+
+def test_affinity_refresh_matches_full_recompute(ces):
+    """지표가 바뀐 행만 증분 갱신한 유사도가 전체 재계산 결과와 일치"""
+    network = ces.CollectiveConsciousnessNetwork()
+    generator = np.random.default_rng(1)
+    metric_count = len(ces.CONSCIOUSNESS_METRIC_NAMES)
+    # 초기 용량(16)을 넘겨 행렬 확장 경로도 포함
+    entities = [
+        _make_entity(ces, generator.uniform(size=metric_count), ces.AGIEvolutionStage.NARROW_AI)
+        for _ in range(20)
+    ]
+    for entity in entities:
+        network._register_entity_row(entity)
+    network._metrics_similarity_by_id(entities[0].entity_id, entities[1].entity_id)
+    
+    entities[3] = replace(entities[3], metrics=ces.ConsciousnessMetrics.from_array(
+        generator.uniform(size=metric_count)))
+    network._register_entity_row(entities[3])
+    incremental = [
+        network._metrics_similarity_by_id(entities[3].entity_id, other.entity_id)
+        for other in entities
+    ]
+    
+    expected = network.recompute_affinity_matrix()[3]
+    assert incremental == pytest.approx(expected.tolist(), abs=1e-6)